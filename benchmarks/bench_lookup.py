@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark point lookups: indexed lookup vs. the previous full-column scan.
+
+Usage:
+    python benchmarks/bench_lookup.py [--rows 155000] [--lookups 2000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pinin import PincodeData  # noqa: E402
+from pinin.datagen import generate  # noqa: E402
+
+
+def make_dataset(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Build a realistic synthetic dataset (about 8 offices per pincode)."""
+    return generate(rows, seed)
+
+
+def time_per_call(func, pincodes) -> float:
+    """Return the mean seconds per call of ``func`` over ``pincodes``."""
+    start = time.perf_counter()
+    for pincode in pincodes:
+        func(pincode)
+    return (time.perf_counter() - start) / len(pincodes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=155_000)
+    parser.add_argument("--lookups", type=int, default=2_000)
+    args = parser.parse_args()
+
+    frame = make_dataset(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pincodes.csv")
+        frame.to_csv(path, index=False)
+        pincode_data = PincodeData(path)
+
+    data = pincode_data.data
+    keys = data['pincode'].unique()
+    sample = np.random.default_rng(1).choice(keys, size=args.lookups).tolist()
+
+    def scan(pincode: str) -> list:
+        return data[data['pincode'] == pincode].to_dict('records')
+
+    scan_lookups = sample[:max(args.lookups // 20, 1)]
+    scan_time = time_per_call(scan, scan_lookups)
+    index_time = time_per_call(pincode_data.get_pincode_info, sample)
+    state_time = time_per_call(pincode_data.get_state, sample)
+
+    print(f"rows={len(data):,} pincodes={len(keys):,}")
+    print(f"full scan        : {scan_time * 1e6:10.1f} us/lookup")
+    print(f"get_pincode_info : {index_time * 1e6:10.1f} us/lookup")
+    print(f"get_state        : {state_time * 1e6:10.1f} us/lookup")
+    print(f"speedup          : {scan_time / index_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
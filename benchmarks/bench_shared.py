@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory of many worker processes: PincodeData vs. SharedPincodeData.
+
+Forks ``--workers`` processes that each create a dataset object and perform
+lookups, then sums their proportional set size (PSS, shared pages divided
+among the processes sharing them). Linux only (reads /proc/<pid>/smaps_rollup).
+
+Usage:
+    python benchmarks/bench_shared.py [--rows 155000] [--workers 8]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pinin import PincodeData  # noqa: E402
+from pinin.shared import SharedPincodeData  # noqa: E402
+from bench_lookup import make_dataset  # noqa: E402
+
+
+def pss_kb(pid: int) -> int:
+    """Proportional set size of a process in kB."""
+    with open(f"/proc/{pid}/smaps_rollup") as handle:
+        for line in handle:
+            if line.startswith("Pss:"):
+                return int(line.split()[1])
+    return 0
+
+
+def run_workers(factory, workers: int, pincodes: list) -> int:
+    """Fork workers that build a dataset object and look pincodes up; return total PSS in kB."""
+    ready_read, ready_write = os.pipe()
+    release_read, release_write = os.pipe()
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            pincode_data = factory()
+            for pincode in pincodes:
+                pincode_data.get_state(pincode)
+            os.write(ready_write, b"x")
+            os.read(release_read, 1)
+            os._exit(0)
+        children.append(pid)
+
+    for _ in children:
+        os.read(ready_read, 1)
+    total = sum(pss_kb(pid) for pid in children)
+    os.write(release_write, b"x" * workers)
+    for pid in children:
+        os.waitpid(pid, 0)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=155_000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--lookups", type=int, default=5_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pincodes.csv")
+        make_dataset(args.rows).to_csv(path, index=False)
+
+        start = time.perf_counter()
+        SharedPincodeData.prepare(path)
+        print(f"prepare (parse + snapshot): {time.perf_counter() - start:.2f} s")
+
+        keys = PincodeData(path, use_snapshot=True).data['pincode'].unique()
+        pincodes = np.random.default_rng(1).choice(keys, size=args.lookups).tolist()
+
+        for workers in sorted({1, args.workers // 2, args.workers} - {0}):
+            private = run_workers(lambda: PincodeData(path, use_snapshot=True), workers, pincodes)
+            shared = run_workers(lambda: SharedPincodeData(path, build=False), workers, pincodes)
+            print(f"workers={workers:3d}  PincodeData: {private / 1024:8.1f} MB"
+                  f"  SharedPincodeData: {shared / 1024:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
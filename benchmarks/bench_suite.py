@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for PincodeData operations, with regression baselines.
+
+Times loading (CSV parse and snapshot) and the main lookup and search
+operations on synthetic datasets of several sizes, reporting latency
+percentiles and throughput for each.
+
+Save a baseline, then compare later runs against it; the run exits with
+status 1 when an operation's median latency regresses by more than the
+threshold:
+
+    python benchmarks/bench_suite.py --sizes 10000,155000 --save baseline.json
+    python benchmarks/bench_suite.py --sizes 10000,155000 --compare baseline.json --threshold 0.25
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pinin import PincodeData  # noqa: E402
+from pinin.datagen import write_csv  # noqa: E402
+
+BASELINE_VERSION = 1
+
+# Operations whose first call builds a lazy index: warmed up before timing
+WARM_UP = 3
+
+
+def summarize(samples_ns: Sequence[int]) -> Dict[str, float]:
+    """Latency percentiles (microseconds) and throughput of per-call timings."""
+    samples = np.asarray(samples_ns, dtype=np.float64) / 1e3
+    total_seconds = samples.sum() / 1e6
+    return {
+        "calls": int(len(samples)),
+        "mean_us": float(samples.mean()),
+        "p50_us": float(np.percentile(samples, 50)),
+        "p90_us": float(np.percentile(samples, 90)),
+        "p99_us": float(np.percentile(samples, 99)),
+        "max_us": float(samples.max()),
+        "ops_per_sec": float(len(samples) / total_seconds) if total_seconds else float("inf"),
+    }
+
+
+def time_calls(func: Callable[[Any], Any], arguments: Sequence[Any]) -> Dict[str, float]:
+    """Call ``func`` once per argument after a short warm-up and summarize the timings."""
+    for argument in arguments[:WARM_UP]:
+        func(argument)
+    samples = []
+    for argument in arguments:
+        start = time.perf_counter_ns()
+        func(argument)
+        samples.append(time.perf_counter_ns() - start)
+    return summarize(samples)
+
+
+def time_loads(path: str, repeat: int, use_snapshot: bool) -> Dict[str, float]:
+    """Time creating fresh instances from a CSV file."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        PincodeData(path, use_snapshot=use_snapshot)
+        samples.append(time.perf_counter_ns() - start)
+    return summarize(samples)
+
+
+def run_size(rows: int, calls: int, load_repeat: int, seed: int) -> Dict[str, Dict[str, float]]:
+    """Benchmark every operation on a synthetic dataset of ``rows`` rows."""
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_csv(os.path.join(tmp, "pincodes.csv"), rows=rows, seed=seed)
+
+        results["load_csv"] = time_loads(path, load_repeat, use_snapshot=False)
+        PincodeData(path, use_snapshot=True)  # writes the snapshot
+        results["load_snapshot"] = time_loads(path, load_repeat, use_snapshot=True)
+
+        pincode_data = PincodeData(path, use_snapshot=False)
+        # Without the record cache, every lookup goes through the index
+        uncached = PincodeData(path, use_snapshot=False, cache_size=0)
+        data = pincode_data.data
+        rng = random.Random(seed)
+        # Each operation gets its own sample, so one does not run on keys
+        # another has already put in the cache
+        unique_pincodes = list(data['pincode'].unique())
+        states = pincode_data.get_states()
+        districts = rng.choices(list(data['districtname'].unique()), k=calls)
+        offices = [name[:5] for name in rng.choices(list(data['officename'].unique()), k=calls)]
+
+        results["get_pincode_info"] = time_calls(pincode_data.get_pincode_info, rng.choices(unique_pincodes, k=calls))
+        results["get_pincode_info_uncached"] = time_calls(uncached.get_pincode_info,
+                                                          rng.choices(unique_pincodes, k=calls))
+        results["get_state"] = time_calls(pincode_data.get_state, rng.choices(unique_pincodes, k=calls))
+        results["get_state_uncached"] = time_calls(uncached.get_state, rng.choices(unique_pincodes, k=calls))
+        results["search_by_state"] = time_calls(pincode_data.search_by_state, rng.choices(states, k=calls))
+        results["search_by_district"] = time_calls(pincode_data.search_by_district, districts)
+        results["search_by_office"] = time_calls(pincode_data.search_by_office, offices)
+        results["get_districts"] = time_calls(pincode_data.get_districts, rng.choices(states + [None], k=calls))
+        results["get_statistics"] = time_calls(lambda _: pincode_data.get_statistics(), range(max(calls // 20, 5)))
+    return results
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Compare median latencies against a baseline.
+
+    Returns:
+        One message per operation whose p50 latency grew by more than
+        ``threshold`` (a fraction, e.g. 0.25 for 25%)
+    """
+    regressions = []
+    for size, operations in current["results"].items():
+        for name, stats in operations.items():
+            reference = baseline.get("results", {}).get(size, {}).get(name)
+            if not reference or not reference.get("p50_us"):
+                continue
+            ratio = stats["p50_us"] / reference["p50_us"]
+            if ratio > 1 + threshold:
+                regressions.append(
+                    f"rows={size} {name}: p50 {reference['p50_us']:.1f} -> {stats['p50_us']:.1f} us "
+                    f"({(ratio - 1) * 100:+.0f}%)"
+                )
+    return regressions
+
+
+def print_table(size: str, operations: Dict[str, Dict[str, float]],
+                baseline: Dict[str, Dict[str, float]]) -> None:
+    """Print one size's results, with each p50 change against the baseline when there is one."""
+    print(f"\nrows={int(size):,}")
+    print(f"{'operation':26} {'p50 us':>12} {'p90 us':>12} {'p99 us':>12} {'ops/s':>12} {'vs base':>8}")
+    for name, stats in operations.items():
+        reference = baseline.get(name, {}).get("p50_us")
+        change = f"{(stats['p50_us'] / reference - 1) * 100:+7.0f}%" if reference else ""
+        print(f"{name:26} {stats['p50_us']:12.1f} {stats['p90_us']:12.1f} {stats['p99_us']:12.1f} "
+              f"{stats['ops_per_sec']:12,.0f} {change:>8}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmarks and return the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,155000",
+                        help="Comma-separated dataset sizes in rows (default: 10000,155000)")
+    parser.add_argument("--calls", type=int, default=1000, help="Timed calls per operation (default: 1000)")
+    parser.add_argument("--load-repeat", type=int, default=3, help="Timed loads per size (default: 3)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", metavar="FILE", help="Write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="Compare against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed p50 slowdown before failing, as a fraction (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    baseline: Dict[str, Any] = {}
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+        if baseline.get("version") != BASELINE_VERSION:
+            print(f"Unsupported baseline version in {args.compare}", file=sys.stderr)
+            return 2
+
+    report: Dict[str, Any] = {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "calls": args.calls,
+        "results": {},
+    }
+    for size in [int(value) for value in args.sizes.split(",") if value]:
+        operations = run_size(size, args.calls, args.load_repeat, args.seed)
+        report["results"][str(size)] = operations
+        print_table(str(size), operations, baseline.get("results", {}).get(str(size), {}))
+
+    if args.save:
+        with open(args.save, "w") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"\nbaseline written to {args.save}")
+
+    if args.compare:
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(f"\nno regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Multi-threaded stress test of the default instance and concurrent readers.
+
+1. Cold start: ``--threads`` threads call a convenience function at the same
+   moment; the dataset must be loaded exactly once.
+2. Concurrent reads: the same threads run a random mix of lookups and
+   searches against one fresh instance (so lazily built indexes are built
+   while other threads read) and check every result against a
+   single-threaded reference.
+
+Exits with status 1 if the data was loaded more than once or any result
+differs from the reference.
+
+Usage:
+    python benchmarks/bench_threads.py [--rows 155000] [--threads 16] [--seconds 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pinin  # noqa: E402
+from pinin import core  # noqa: E402
+from pinin import PincodeData  # noqa: E402
+from bench_lookup import make_dataset  # noqa: E402
+
+
+def cold_start(path: str, threads: int) -> int:
+    """Hit the default instance from many threads at once; return the number of loads."""
+    loads = []
+    original_init = PincodeData.__init__
+
+    def counting_init(self, **kwargs):
+        loads.append(threading.get_ident())
+        original_init(self, path, **kwargs)
+
+    core._get_default_instance.cache_clear()
+    barrier = threading.Barrier(threads)
+    sample = core.pd.read_csv(path, nrows=1)['pincode'].astype(str)[0]
+
+    def worker():
+        barrier.wait()
+        pinin.get_state(sample)
+
+    PincodeData.__init__ = counting_init  # type: ignore
+    try:
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        start = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        print(f"cold start: {threads} threads, {len(loads)} load(s), {time.perf_counter() - start:.2f} s")
+    finally:
+        PincodeData.__init__ = original_init  # type: ignore
+        core._get_default_instance.cache_clear()
+    return len(loads)
+
+
+def operations(pincode_data: PincodeData, pincodes: list, states: list, offices: list) -> list:
+    """Build (name, callable) pairs covering the read API."""
+    return (
+        [("get_pincode_info", lambda p=p: pincode_data.get_pincode_info(p)) for p in pincodes[:200]]
+        + [("get_state", lambda p=p: pincode_data.get_state(p)) for p in pincodes[200:400]]
+        + [("get_offices", lambda p=p: pincode_data.get_offices(p)) for p in pincodes[400:600]]
+        + [("get_states_many", lambda: pincode_data.get_states_many(pincodes).tolist())]
+        + [("search_by_state", lambda s=s: pincode_data.search_by_state(s)) for s in states]
+        + [("search_by_prefix", lambda p=p: pincode_data.search_by_prefix(p[:3])) for p in pincodes[:50]]
+        + [("search_by_office", lambda o=o: len(pincode_data.search_by_office(o))) for o in offices]
+        + [("fuzzy_search", lambda s=s: pincode_data.fuzzy_search('districtname', s.lower(), k=3))
+           for s in states]
+    )
+
+
+def concurrent_reads(path: str, threads: int, seconds: float) -> int:
+    """Run mixed reads from many threads; return the number of wrong results."""
+    reference = PincodeData(path, use_snapshot=False)
+    pincodes = sorted(reference.data['pincode'].unique())[::7][:600]
+    states = reference.get_states()
+    offices = ["Rampur", "Nagar B.O", "Bazar", "H.O"]
+    expected = [func() for _, func in operations(reference, pincodes, states, offices)]
+
+    shared = PincodeData(path, use_snapshot=False)
+    ops = operations(shared, pincodes, states, offices)
+    errors = []
+    calls = [0] * threads
+    deadline = time.perf_counter() + seconds
+
+    def worker(slot: int) -> None:
+        rng = random.Random(slot)
+        while time.perf_counter() < deadline:
+            i = rng.randrange(len(ops))
+            name, func = ops[i]
+            try:
+                if func() != expected[i]:
+                    errors.append(f"{name}: wrong result")
+            except Exception as e:  # noqa: BLE001
+                errors.append(f"{name}: {type(e).__name__}: {e}")
+            calls[slot] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    total = sum(calls)
+    print(f"concurrent reads: {threads} threads, {total:,} calls, {total / seconds:,.0f} calls/s, "
+          f"{len(errors)} error(s)")
+    for error in errors[:10]:
+        print(f"  {error}")
+    return len(errors)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=155_000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pincodes.csv")
+        make_dataset(args.rows).to_csv(path, index=False)
+        os.environ["PININ_SNAPSHOT"] = "0"
+
+        loads = cold_start(path, args.threads)
+        errors = concurrent_reads(path, args.threads, args.seconds)
+
+    sys.exit(0 if loads == 1 and errors == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
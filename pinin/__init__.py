@@ -21,42 +21,117 @@ Usage:
     district = pincode_data.get_district("110001")
 """
 
-from .core import (
-    PincodeData,
-    get_pincode_info,
-    get_state,
-    get_district,
-    get_taluk,
-    get_offices,
-    search_by_state,
-    search_by_district,
-    get_states,
-    get_districts,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from .exceptions import (
     PininError,
     InvalidPincodeError,
     DataNotFoundError,
     DataLoadError,
+    ColumnNotAvailableError,
 )
 
+if TYPE_CHECKING:
+    from .core import (
+        PincodeData,
+        get_pincode_info,
+        get_state,
+        get_district,
+        get_taluk,
+        get_offices,
+        exists,
+        exists_many,
+        get_pincode_info_many,
+        get_states_many,
+        get_districts_many,
+        get_taluks_many,
+        normalize_pincodes,
+        search_by_state,
+        search_by_district,
+        search_by_prefix,
+        search_by_range,
+        suggest,
+        get_states,
+        get_districts,
+        preload,
+        get_metrics,
+    )
+    from .record import PincodeRecord
+
+# The dataset code (and pandas) is imported on first use, so that tools
+# which only talk to the lookup daemon (see ``pinin.client``) start quickly
+_LAZY_ATTRIBUTES = {
+    "PincodeData": ".core",
+    "PincodeRecord": ".record",
+    "get_pincode_info": ".core",
+    "get_state": ".core",
+    "get_district": ".core",
+    "get_taluk": ".core",
+    "get_offices": ".core",
+    "exists": ".core",
+    "exists_many": ".core",
+    "get_pincode_info_many": ".core",
+    "get_states_many": ".core",
+    "get_districts_many": ".core",
+    "get_taluks_many": ".core",
+    "normalize_pincodes": ".core",
+    "search_by_state": ".core",
+    "search_by_district": ".core",
+    "search_by_prefix": ".core",
+    "search_by_range": ".core",
+    "suggest": ".core",
+    "get_states": ".core",
+    "get_districts": ".core",
+    "preload": ".core",
+    "get_metrics": ".core",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 __version__ = "0.1.7"
 __author__ = "Raja CSP Raman"
 __email__ = "raja.csp@gmail.com"
 
 __all__ = [
     "PincodeData",
+    "PincodeRecord",
     "get_pincode_info",
     "get_state",
     "get_district",
     "get_taluk",
     "get_offices",
+    "exists",
+    "exists_many",
+    "get_pincode_info_many",
+    "get_states_many",
+    "get_districts_many",
+    "get_taluks_many",
+    "normalize_pincodes",
     "search_by_state",
     "search_by_district",
+    "search_by_prefix",
+    "search_by_range",
+    "suggest",
     "get_states",
     "get_districts",
+    "preload",
+    "get_metrics",
     "PininError",
     "InvalidPincodeError",
     "DataNotFoundError",
     "DataLoadError",
+    "ColumnNotAvailableError",
 ]
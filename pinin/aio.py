@@ -0,0 +1,260 @@
+"""
+asyncio interface to the pincode data.
+
+Creating a ``PincodeData`` parses (or maps) the dataset, which blocks for a
+noticeable time; calling the synchronous API from a coroutine on a cold start
+therefore stalls the event loop. ``AsyncPincodeData`` loads the dataset in an
+executor, and every coroutine that needs it awaits the same load. Point
+lookups are microseconds once the data is loaded and run directly on the
+loop; bulk lookups are offloaded to the executor in chunks sized to a time
+slice, so no single call holds the interpreter lock for long.
+
+Usage::
+
+    pincodes = AsyncPincodeData()
+
+    @app.on_event("startup")
+    async def warm_up():
+        await pincodes.load()
+
+    async def handler(pincode):
+        return await pincodes.get_state(pincode)
+"""
+
+import asyncio
+import functools
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+
+import numpy as np
+import pandas as pd
+
+from .core import PincodeArray, PincodeData, Record
+from .exceptions import PininError
+
+T = TypeVar("T")
+
+# Smallest bulk chunk; below this the per-call overhead dominates
+MIN_CHUNK_SIZE = 256
+
+
+def _load(data_file: Optional[str], options: Dict[str, Any]) -> PincodeData:
+    """Load the data and build the lazy lookup structures, off the event loop."""
+    data = PincodeData(data_file, **options)
+    index = data._get_index()
+    # Built on first use otherwise, which would stall the first call on the
+    # event loop (point lookups, exists, search_by_*) or the first bulk chunk
+    index.key_index
+    index.first_rows
+    index.numbers
+    index.bitmap
+    if {'statename', 'districtname'} <= set(data.data.columns):
+        index.groups
+    return data
+
+
+class AsyncPincodeData:
+    """
+    Awaitable wrapper around ``PincodeData``.
+
+    The dataset is loaded at most once per instance, in an executor thread, on
+    the first call to :meth:`load` or to any lookup. A failed load is not
+    cached, so the next call retries it.
+    """
+
+    def __init__(self, data_file: Optional[str] = None, executor: Optional[Executor] = None,
+                 time_slice: float = 0.005, **options: Any):
+        """
+        Create the wrapper without loading anything.
+
+        Args:
+            data_file: Path to CSV file containing pincode data.
+                      If None, uses the default bundled data file.
+            executor: Executor to load the data in; None uses the loop's
+                      default thread pool.
+            time_slice: Target duration in seconds of one bulk lookup chunk;
+                      the event loop is never kept waiting much longer.
+            **options: Further ``PincodeData`` arguments, e.g. ``cache_size``
+                      or ``record_format``.
+
+        Raises:
+            ValueError: If the time slice is not positive
+        """
+        if time_slice <= 0:
+            raise ValueError(f"Time slice must be positive, got {time_slice}")
+        self._data_file = data_file
+        self._executor = executor
+        self._options = options
+        self.time_slice = time_slice
+        self._data: Optional[PincodeData] = None
+        self._loading: Optional["asyncio.Future[PincodeData]"] = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the dataset has been loaded."""
+        return self._data is not None
+
+    async def load(self) -> PincodeData:
+        """
+        Load the dataset without blocking the event loop.
+
+        Concurrent callers share a single load. Cancelling one caller does
+        not cancel the load for the others.
+
+        Returns:
+            The loaded ``PincodeData`` instance
+
+        Raises:
+            DataLoadError: If the data file cannot be loaded
+        """
+        if self._data is not None:
+            return self._data
+        if self._loading is None:
+            loop = asyncio.get_running_loop()
+            self._loading = loop.run_in_executor(
+                self._executor, functools.partial(_load, self._data_file, self._options)
+            )
+        loading = self._loading
+        try:
+            self._data = await asyncio.shield(loading)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Let the next caller try again
+            if self._loading is loading:
+                self._loading = None
+            raise
+        return self._data
+
+    async def get_pincode_info(self, pincode: Union[str, int]) -> List[Record]:
+        """Async version of ``PincodeData.get_pincode_info``."""
+        return (await self.load()).get_pincode_info(pincode)
+
+    async def get_state(self, pincode: Union[str, int]) -> str:
+        """Async version of ``PincodeData.get_state``."""
+        return (await self.load()).get_state(pincode)
+
+    async def get_district(self, pincode: Union[str, int]) -> str:
+        """Async version of ``PincodeData.get_district``."""
+        return (await self.load()).get_district(pincode)
+
+    async def get_taluk(self, pincode: Union[str, int]) -> str:
+        """Async version of ``PincodeData.get_taluk``."""
+        return (await self.load()).get_taluk(pincode)
+
+    async def get_offices(self, pincode: Union[str, int]) -> List[str]:
+        """Async version of ``PincodeData.get_offices``."""
+        return (await self.load()).get_offices(pincode)
+
+    async def exists(self, pincode: Union[str, int]) -> bool:
+        """Async version of ``PincodeData.exists``."""
+        return (await self.load()).exists(pincode)
+
+    async def suggest(self, pincode: Union[str, int], k: int = 5) -> List[Dict[str, Any]]:
+        """Async version of ``PincodeData.suggest``."""
+        return (await self.load()).suggest(pincode, k)
+
+    async def search_by_state(self, state_name: str) -> List[str]:
+        """Async version of ``PincodeData.search_by_state``."""
+        return (await self.load()).search_by_state(state_name)
+
+    async def search_by_district(self, district_name: str, state_name: Optional[str] = None) -> List[str]:
+        """Async version of ``PincodeData.search_by_district``."""
+        return (await self.load()).search_by_district(district_name, state_name)
+
+    async def _in_slices(self, func: Callable[[Any], T], items: Any,
+                         combine: Callable[[List[T]], T]) -> T:
+        """
+        Apply a bulk function to consecutive chunks of a Series or DataFrame.
+
+        Every chunk, and the final combination of the results, runs in the
+        executor. The chunk size is adjusted after every chunk so that one
+        chunk takes about one time slice, which bounds how long a single
+        call can hold the interpreter lock while the event loop waits.
+        """
+        loop = asyncio.get_running_loop()
+        chunk_size = MIN_CHUNK_SIZE
+        start = 0
+        parts: List[T] = []
+        while start < len(items):
+            chunk = items.iloc[start:start + chunk_size]
+            began = time.perf_counter()
+            parts.append(await loop.run_in_executor(self._executor, func, chunk))
+            elapsed = time.perf_counter() - began
+            start += len(chunk)
+            scale = self.time_slice / elapsed if elapsed > 0 else 2.0
+            chunk_size = max(MIN_CHUNK_SIZE, int(chunk_size * min(max(scale, 0.5), 2.0)))
+        return await loop.run_in_executor(self._executor, combine, parts)
+
+    async def _as_series(self, pincodes: PincodeArray) -> pd.Series:
+        """Wrap bulk input in a Series; large lists are converted in the executor."""
+        if isinstance(pincodes, pd.Series):
+            return pincodes
+        if len(pincodes) <= MIN_CHUNK_SIZE:
+            return pd.Series(pincodes)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, pd.Series, pincodes)
+
+    async def _field_many(self, pincodes: PincodeArray, method: str) -> pd.Series:
+        """Run one of the ``get_*_many`` field lookups in time-sliced chunks."""
+        data = await self.load()
+        lookup = getattr(data, method)
+        series = await self._as_series(pincodes)
+        if not len(series):
+            return lookup(series)  # type: ignore
+        result = await self._in_slices(lookup, series, pd.concat)
+        result.index = series.index
+        return result
+
+    async def get_pincode_info_many(self, pincodes: PincodeArray) -> List[Union[List[Record], PininError]]:
+        """Async version of ``PincodeData.get_pincode_info_many``, run in time-sliced chunks."""
+        data = await self.load()
+        series = await self._as_series(pincodes)
+        if not len(series):
+            return []
+        return await self._in_slices(
+            data.get_pincode_info_many, series, lambda parts: [item for part in parts for item in part]
+        )
+
+    async def get_states_many(self, pincodes: PincodeArray) -> pd.Series:
+        """Async version of ``PincodeData.get_states_many``, run in time-sliced chunks."""
+        return await self._field_many(pincodes, 'get_states_many')
+
+    async def get_districts_many(self, pincodes: PincodeArray) -> pd.Series:
+        """Async version of ``PincodeData.get_districts_many``, run in time-sliced chunks."""
+        return await self._field_many(pincodes, 'get_districts_many')
+
+    async def get_taluks_many(self, pincodes: PincodeArray) -> pd.Series:
+        """Async version of ``PincodeData.get_taluks_many``, run in time-sliced chunks."""
+        return await self._field_many(pincodes, 'get_taluks_many')
+
+    async def exists_many(self, pincodes: PincodeArray) -> np.ndarray:
+        """Async version of ``PincodeData.exists_many``, run in time-sliced chunks."""
+        data = await self.load()
+        series = await self._as_series(pincodes)
+        if not len(series):
+            return data.exists_many(series)
+        return await self._in_slices(data.exists_many, series, np.concatenate)
+
+    async def normalize_pincodes(self, pincodes: PincodeArray) -> pd.DataFrame:
+        """Async version of ``PincodeData.normalize_pincodes``, run in time-sliced chunks."""
+        return await self._field_many(pincodes, 'normalize_pincodes')  # type: ignore
+
+    async def enrich(self, df: pd.DataFrame, column: str = 'pincode', **options: Any) -> pd.DataFrame:
+        """
+        Async version of ``PincodeData.enrich``, run in time-sliced chunks.
+
+        Always returns a new DataFrame.
+
+        Raises:
+            ValueError: If ``inplace=True`` is passed, or for the errors of
+                        ``PincodeData.enrich``
+        """
+        if options.get('inplace'):
+            raise ValueError("AsyncPincodeData.enrich does not support inplace=True")
+        data = await self.load()
+        if not len(df):
+            return data.enrich(df, column=column, **options)
+        return await self._in_slices(
+            lambda chunk: data.enrich(chunk, column=column, **options), df, pd.concat
+        )
@@ -0,0 +1,150 @@
+"""
+Bounded cache for per-pincode lookup results.
+
+Lookup traffic is heavily skewed towards a few thousand pincodes, so
+``PincodeData`` keeps the records of recently (or frequently) requested
+pincodes in a cache of fixed size instead of rebuilding them from the
+DataFrame on every call. Cached values are shared between callers and must be
+immutable.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, NamedTuple, Optional
+
+POLICIES = ("lru", "lfu")
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, in the style of ``functools.lru_cache``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    policy: str
+
+
+class RecordCache:
+    """
+    Thread-safe bounded mapping with LRU or LFU eviction.
+
+    ``lru`` evicts the entry that was used least recently. ``lfu`` evicts the
+    entry that was used the fewest times, breaking ties by recency, which
+    keeps a stable set of hot keys when traffic has a long tail of one-off
+    lookups. Both policies run in constant time per operation.
+    """
+
+    def __init__(self, maxsize: int = 2048, policy: str = "lru"):
+        """
+        Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries; 0 disables caching
+            policy: Eviction policy, ``"lru"`` or ``"lfu"``
+
+        Raises:
+            ValueError: If the size is negative or the policy is unknown
+        """
+        if maxsize < 0:
+            raise ValueError(f"Cache size must not be negative, got {maxsize}")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown cache policy '{policy}', expected one of {POLICIES}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # LRU: a single recency-ordered mapping
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        # LFU: use count per key and one recency-ordered bucket per count
+        self._counts: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, Any]"] = {}
+        self._min_count = 0
+
+    def __len__(self) -> int:
+        return len(self._entries) if self.policy == "lru" else len(self._counts)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value, counting a hit or a miss.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if the key is not cached
+        """
+        with self._lock:
+            if self.policy == "lru":
+                value = self._entries.get(key)
+                if value is not None:
+                    self._entries.move_to_end(key)
+            else:
+                value = self._touch(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting an entry if the cache is full.
+
+        Args:
+            key: Cache key
+            value: Immutable value to cache (not None)
+        """
+        if not self.maxsize:
+            return
+        with self._lock:
+            if self.policy == "lru":
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                return
+
+            if key in self._counts:
+                self._buckets[self._counts[key]][key] = value
+                self._touch(key)
+                return
+            if len(self._counts) >= self.maxsize:
+                bucket = self._buckets[self._min_count]
+                evicted, _ = bucket.popitem(last=False)
+                if not bucket:
+                    del self._buckets[self._min_count]
+                del self._counts[evicted]
+            self._counts[key] = 1
+            self._buckets.setdefault(1, OrderedDict())[key] = value
+            self._min_count = 1
+
+    def _touch(self, key: Hashable) -> Optional[Any]:
+        """Move an LFU entry to the next use-count bucket (lock held)."""
+        count = self._counts.get(key)
+        if count is None:
+            return None
+        bucket = self._buckets[count]
+        value = bucket.pop(key)
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = value
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._counts.clear()
+            self._buckets.clear()
+            self._min_count = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Get the cache statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self), self.policy)
@@ -5,17 +5,24 @@ Command-line interface for pypinindia.
 import argparse
 import sys
 import json
-from typing import List, Dict, Any, Optional, Union
+import time
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union, TextIO, Iterator, Sequence
 
-from .core import (
-    PincodeData, get_pincode_info, get_state, get_district, get_taluk,
-    get_offices, search_by_state, search_by_district, get_states, get_districts
-)
+from .client import connect, default_address
 from .exceptions import InvalidPincodeError, DataNotFoundError, DataLoadError
 
+# pandas and the dataset are only imported when no daemon answers for us
+if TYPE_CHECKING:
+    import pandas as pd
+    from .core import PincodeData
+
 
 def main() -> None:
     """Main CLI entry point."""
+    if sys.argv[1:2] == ["serve"]:
+        run_serve(sys.argv[2:])
+        return
+    
     parser = argparse.ArgumentParser(
         description="Indian Pincode lookup and information tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -30,6 +37,9 @@ Examples:
   pypinindia --list-states             # List all states
   pypinindia --list-districts          # List all districts
   pypinindia --stats                   # Show dataset statistics
+  pypinindia --enrich orders.csv --column pin --output enriched.csv
+  cat orders.ndjson | pypinindia --enrich - --format ndjson
+  pypinindia serve &                   # Keep the dataset loaded for later calls
         """
     )
     
@@ -95,6 +105,42 @@ Examples:
         help="Show dataset statistics"
     )
     
+    parser.add_argument(
+        "--enrich",
+        metavar="INPUT",
+        help="Stream a CSV or NDJSON file ('-' for stdin) and add pincode details to every row"
+    )
+    
+    parser.add_argument(
+        "--column",
+        default="pincode",
+        help="Name of the pincode column for --enrich (default: pincode)"
+    )
+    
+    parser.add_argument(
+        "--columns",
+        help="Comma-separated columns to add with --enrich "
+             "(default: state, district, taluk and office count)"
+    )
+    
+    parser.add_argument(
+        "--format",
+        choices=["csv", "ndjson"],
+        help="Input and output format for --enrich (default: from the file extension, else csv)"
+    )
+    
+    parser.add_argument(
+        "--output",
+        help="Write --enrich output to this file instead of stdout"
+    )
+    
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=50000,
+        help="Rows per chunk for --enrich (default: 50000)"
+    )
+    
     parser.add_argument(
         "--json", "-j",
         action="store_true",
@@ -112,49 +158,67 @@ Examples:
         help="Path to custom CSV data file"
     )
     
+    parser.add_argument(
+        "--socket",
+        help="Address of the lookup daemon: a Unix socket path or HOST:PORT "
+             f"(default: $PININ_SOCKET or {default_address()})"
+    )
+    
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Load the dataset in this process even if a lookup daemon is running"
+    )
+    
     args = parser.parse_args()
     
     try:
-        # Initialize PincodeData with custom file if provided
-        if args.data_file:
-            pincode_data = PincodeData(args.data_file)
-            if args.verbose:
-                print(f"Using custom data file: {args.data_file}")
+        if args.data_file and args.verbose:
+            # Diagnostics go to stderr: stdout may carry --enrich or --json output
+            print(f"Using custom data file: {args.data_file}", file=sys.stderr)
+        
+        # Handle bulk enrichment
+        if args.enrich:
+            run_enrich(args)
+            return
+        
+        if not (args.list_states or args.list_districts is not None or args.stats
+                or args.search_state or args.search_district or args.pincode):
+            parser.error("Pincode is required unless using search or list options")
+        
+        # Validate pincode format before loading anything
+        if args.pincode and not (args.pincode.isdigit() and len(args.pincode) == 6):
+            print(f"Error: Invalid pincode format '{args.pincode}'. Must be a 6-digit number.", file=sys.stderr)
+            sys.exit(1)
+        
+        # Load the dataset (or reach the daemon) once for the whole command
+        pincode_data = open_data_source(args)
         
         # Handle list operations
         if args.list_states:
-            list_states(args.json, args.verbose)
+            list_states(args.json, args.verbose, pincode_data=pincode_data)
             return
         
         if args.list_districts is not None:
             state_filter = args.list_districts if args.list_districts else None
-            list_districts(state_filter, args.json, args.verbose)
+            list_districts(state_filter, args.json, args.verbose, pincode_data=pincode_data)
             return
         
         if args.stats:
-            show_statistics(args.json, args.verbose, args.data_file)
+            show_statistics(args.json, args.verbose, pincode_data=pincode_data)
             return
         
         # Handle search operations
         if args.search_state:
-            search_state(args.search_state, args.json, args.verbose, args.data_file)
+            search_state(args.search_state, args.json, args.verbose, pincode_data=pincode_data)
             return
         
         if args.search_district:
-            search_district(args.search_district, args.in_state, args.json, args.verbose, args.data_file)
+            search_district(args.search_district, args.in_state, args.json, args.verbose, pincode_data=pincode_data)
             return
         
-        # Handle pincode operations
-        if not args.pincode:
-            parser.error("Pincode is required unless using search or list options")
-        
-        # Validate pincode format
-        if not args.pincode.isdigit() or len(args.pincode) != 6:
-            print(f"Error: Invalid pincode format '{args.pincode}'. Must be a 6-digit number.", file=sys.stderr)
-            sys.exit(1)
-        
         # Execute pincode lookup
-        lookup_pincode(args.pincode, args, args.data_file)
+        lookup_pincode(args.pincode, args, pincode_data=pincode_data)
     
     except InvalidPincodeError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -180,41 +244,116 @@ Examples:
         sys.exit(1)
 
 
-def lookup_pincode(pincode: str, args: argparse.Namespace, data_file: Optional[str] = None) -> None:
-    """Lookup information for a specific pincode."""
+def run_serve(argv: Sequence[str]) -> None:
+    """Handle ``pypinindia serve``: run the lookup daemon in the foreground."""
+    parser = argparse.ArgumentParser(
+        prog="pypinindia serve",
+        description="Keep the pincode dataset loaded and answer lookups from other "
+                    "pypinindia processes over a local socket (line-delimited JSON)."
+    )
+    parser.add_argument(
+        "--socket",
+        help=f"Unix socket path or HOST:PORT to listen on (default: $PININ_SOCKET or {default_address()})"
+    )
+    parser.add_argument("--data-file", help="Path to custom CSV data file")
+    parser.add_argument(
+        "--watch",
+        type=float,
+        metavar="SECONDS",
+        help="Check the data file every SECONDS and reload it without downtime when it changes"
+    )
+    args = parser.parse_args(argv)
+    
+    from .server import serve
+    
+    def ready(server: Any) -> None:
+        address = server.server_address
+        if isinstance(address, tuple):
+            address = f"{address[0]}:{address[1]}"
+        print(f"pypinindia daemon listening on {address}", file=sys.stderr)
+    
+    def reloaded(result: Any) -> None:
+        print(
+            f"Reloaded {result.records:,} records in {result.seconds:.2f}s: "
+            f"{result.added:,} added, {result.removed:,} removed, "
+            f"{result.changed_pincodes:,} pincodes changed",
+            file=sys.stderr
+        )
+    
+    try:
+        serve(args.socket, args.data_file, ready, args.watch, reloaded)
+    except (DataLoadError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def open_data_source(args: argparse.Namespace) -> Any:
+    """
+    Get the object that answers lookups for this command.
+    
+    Returns a client of a running daemon serving the requested data, unless
+    ``--no-daemon`` is given; otherwise the dataset is loaded here, once.
+    Both expose the ``PincodeData`` lookup and search methods.
+    """
+    if not args.no_daemon:
+        client = connect(args.socket, args.data_file)
+        if client is not None:
+            if args.verbose:
+                print(f"Using lookup daemon at {client.address}", file=sys.stderr)
+            return client
+    
+    return _local_source(args.data_file)
+
+
+def _local_source(data_file: Optional[str]) -> "PincodeData":
+    """Load ``data_file``, or get the shared instance of the bundled data."""
+    from .core import PincodeData, _get_default_instance
+    return PincodeData(data_file) if data_file else _get_default_instance()
+
+
+def lookup_pincode(pincode: str, args: argparse.Namespace, data_file: Optional[str] = None,
+                   pincode_data: Any = None) -> None:
+    """
+    Lookup information for a specific pincode.
+    
+    ``pincode_data`` is the source to query (see ``open_data_source``);
+    without one, ``data_file`` or the bundled data is loaded.
+    """
+    if pincode_data is None:
+        pincode_data = _local_source(data_file)
     try:
         if args.state:
-            state_result = get_state(pincode) if not data_file else PincodeData(data_file).get_state(pincode)
+            state_result = pincode_data.get_state(pincode)
             output_result(state_result, args.json, args.verbose, f"State for {pincode}")
         
         elif args.district:
-            district_result = get_district(pincode) if not data_file else PincodeData(data_file).get_district(pincode)
+            district_result = pincode_data.get_district(pincode)
             output_result(district_result, args.json, args.verbose, f"District for {pincode}")
         
         elif args.taluk:
-            taluk_result = get_taluk(pincode) if not data_file else PincodeData(data_file).get_taluk(pincode)
+            taluk_result = pincode_data.get_taluk(pincode)
             output_result(taluk_result, args.json, args.verbose, f"Taluk for {pincode}")
         
         elif args.offices:
-            offices_result = get_offices(pincode) if not data_file else PincodeData(data_file).get_offices(pincode)
+            offices_result = pincode_data.get_offices(pincode)
             output_result(offices_result, args.json, args.verbose, f"Offices for {pincode}")
         
         else:
             # Default: show complete information
-            info_result = get_pincode_info(pincode) if not data_file else PincodeData(data_file).get_pincode_info(pincode)
+            info_result = pincode_data.get_pincode_info(pincode)
             output_result(info_result, args.json, args.verbose, f"Complete information for {pincode}")
     
     except Exception as e:
         raise e
 
 
-def search_state(state_name: str, json_output: bool, verbose: bool, data_file: Optional[str] = None) -> None:
+def search_state(state_name: str, json_output: bool, verbose: bool, data_file: Optional[str] = None,
+                 pincode_data: Any = None) -> None:
     """Search pincodes by state name."""
+    if pincode_data is None:
+        pincode_data = _local_source(data_file)
     try:
-        if not data_file:
-            result = search_by_state(state_name)
-        else:
-            result = PincodeData(data_file).search_by_state(state_name)
+        result = pincode_data.search_by_state(state_name)
         
         if not result:
             print(f"No pincodes found for state: {state_name}")
@@ -226,13 +365,13 @@ def search_state(state_name: str, json_output: bool, verbose: bool, data_file: O
         raise e
 
 
-def search_district(district_name: str, state_name: Optional[str], json_output: bool, verbose: bool, data_file: Optional[str] = None) -> None:
+def search_district(district_name: str, state_name: Optional[str], json_output: bool, verbose: bool,
+                    data_file: Optional[str] = None, pincode_data: Any = None) -> None:
     """Search pincodes by district name."""
+    if pincode_data is None:
+        pincode_data = _local_source(data_file)
     try:
-        if not data_file:
-            result = search_by_district(district_name, state_name)
-        else:
-            result = PincodeData(data_file).search_by_district(district_name, state_name)
+        result = pincode_data.search_by_district(district_name, state_name)
         
         if not result:
             location = f"{district_name}" + (f" in {state_name}" if state_name else "")
@@ -246,20 +385,24 @@ def search_district(district_name: str, state_name: Optional[str], json_output:
         raise e
 
 
-def list_states(json_output: bool, verbose: bool) -> None:
+def list_states(json_output: bool, verbose: bool, pincode_data: Any = None) -> None:
     """List all states in the dataset."""
+    if pincode_data is None:
+        pincode_data = _local_source(None)
     try:
-        result = get_states()
+        result = pincode_data.get_states()
         output_result(result, json_output, verbose, f"All states ({len(result)} found)")
     
     except Exception as e:
         raise e
 
 
-def list_districts(state_name: Optional[str], json_output: bool, verbose: bool) -> None:
+def list_districts(state_name: Optional[str], json_output: bool, verbose: bool, pincode_data: Any = None) -> None:
     """List all districts, optionally filtered by state."""
+    if pincode_data is None:
+        pincode_data = _local_source(None)
     try:
-        result = get_districts(state_name)
+        result = pincode_data.get_districts(state_name)
         
         if state_name:
             title = f"Districts in {state_name} ({len(result)} found)"
@@ -272,14 +415,13 @@ def list_districts(state_name: Optional[str], json_output: bool, verbose: bool)
         raise e
 
 
-def show_statistics(json_output: bool, verbose: bool, data_file: Optional[str] = None) -> None:
+def show_statistics(json_output: bool, verbose: bool, data_file: Optional[str] = None,
+                    pincode_data: Any = None) -> None:
     """Show dataset statistics."""
+    if pincode_data is None:
+        pincode_data = _local_source(data_file)
     try:
-        if not data_file:
-            from .core import _get_default_instance
-            stats = _get_default_instance().get_statistics()
-        else:
-            stats = PincodeData(data_file).get_statistics()
+        stats = pincode_data.get_statistics()
         
         output_result(stats, json_output, verbose, "Dataset Statistics")
     
@@ -287,6 +429,94 @@ def show_statistics(json_output: bool, verbose: bool, data_file: Optional[str] =
         raise e
 
 
+def _read_chunks(source: Union[str, TextIO], fmt: str, chunk_size: int) -> Iterator["pd.DataFrame"]:
+    """Read an input file in chunks of at most ``chunk_size`` rows."""
+    import pandas as pd
+    
+    if fmt == "ndjson":
+        # dtype=False keeps values as written instead of guessing types
+        return iter(pd.read_json(source, lines=True, chunksize=chunk_size, dtype=False))
+    return iter(pd.read_csv(source, chunksize=chunk_size, dtype=str, keep_default_na=False))
+
+
+def _write_chunk(chunk: "pd.DataFrame", destination: TextIO, fmt: str, first: bool) -> None:
+    """Write one enriched chunk."""
+    if fmt == "ndjson":
+        text = chunk.to_json(orient="records", lines=True, force_ascii=False)
+        destination.write(text if text.endswith("\n") else text + "\n")
+    else:
+        chunk.to_csv(destination, header=first, index=False)
+
+
+def enrich_stream(pincode_data: "PincodeData", source: Union[str, TextIO], destination: TextIO,
+                  fmt: str = "csv", column: str = "pincode", columns: Optional[Sequence[str]] = None,
+                  chunk_size: int = 50000) -> Dict[str, Any]:
+    """
+    Enrich a CSV or NDJSON stream chunk by chunk.
+    
+    Only one chunk is held in memory at a time, so memory use does not grow
+    with the size of the input.
+    
+    Args:
+        pincode_data: Loaded dataset, reused for every chunk
+        source: Input path or text stream
+        destination: Output text stream
+        fmt: ``'csv'`` or ``'ndjson'``, used for both input and output
+        column: Name of the pincode column
+        columns: Columns to add (defaults to ``ENRICH_COLUMNS``)
+        chunk_size: Maximum rows per chunk
+        
+    Returns:
+        Dictionary with the number of rows, misses, elapsed seconds and rows/sec
+    """
+    from .core import ENRICH_COLUMNS
+    
+    selected = list(columns) if columns else list(ENRICH_COLUMNS)
+    # office_count identifies misses even when the caller did not ask for it
+    extra = [] if "office_count" in selected else ["office_count"]
+    
+    rows = misses = 0
+    start = time.perf_counter()
+    for number, chunk in enumerate(_read_chunks(source, fmt, chunk_size)):
+        enriched = pincode_data.enrich(chunk, column=column, columns=selected + extra, inplace=True)
+        misses += int((enriched["office_count"] == 0).sum())
+        rows += len(enriched)
+        _write_chunk(enriched.drop(columns=extra), destination, fmt, first=(number == 0))
+    elapsed = time.perf_counter() - start
+    
+    return {
+        "rows": rows,
+        "misses": misses,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+
+
+def run_enrich(args: argparse.Namespace) -> None:
+    """Handle the --enrich mode."""
+    fmt = args.format
+    if fmt is None:
+        fmt = "ndjson" if args.enrich.lower().endswith((".ndjson", ".jsonl")) else "csv"
+    columns = [name.strip() for name in args.columns.split(",")] if args.columns else None
+    
+    # Load the dataset once for the whole stream
+    from .core import PincodeData, _get_default_instance
+    pincode_data = PincodeData(args.data_file) if args.data_file else _get_default_instance()
+    source: Union[str, TextIO] = sys.stdin if args.enrich == "-" else args.enrich
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as destination:
+            stats = enrich_stream(pincode_data, source, destination, fmt, args.column, columns, args.chunk_size)
+    else:
+        stats = enrich_stream(pincode_data, source, sys.stdout, fmt, args.column, columns, args.chunk_size)
+    
+    print(
+        f"Enriched {stats['rows']:,} rows in {stats['seconds']:.2f}s "
+        f"({stats['rows_per_sec']:,.0f} rows/sec), {stats['misses']:,} misses",
+        file=sys.stderr
+    )
+
+
 def output_result(result: Any, json_output: bool, verbose: bool, title: Optional[str] = None) -> None:
     """Output result in the specified format."""
     if json_output:
@@ -0,0 +1,258 @@
+"""
+Client for the pypinindia lookup daemon.
+
+``pypinindia serve`` (see ``pinin.server``) keeps a loaded dataset resident
+and answers requests over a Unix domain socket, or over TCP on localhost
+where Unix sockets are unavailable. The protocol is line-delimited JSON: one
+request object per line, one response object per line, in order::
+
+    -> {"method": "get_state", "args": ["110001"]}
+    <- {"result": "Delhi"}
+    -> {"method": "get_state", "args": ["999999"]}
+    <- {"error": {"type": "DataNotFoundError", "message": "...", "pincode": "999999"}}
+
+This module deliberately imports neither pandas nor the dataset code, so a
+short-lived process that talks to a running daemon starts quickly.
+"""
+
+import json
+import os
+import socket
+import stat
+import tempfile
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+from .exceptions import PininError, InvalidPincodeError, DataNotFoundError
+
+# PincodeData methods a daemon answers, besides the ``ping`` handshake
+METHODS = frozenset((
+    'get_pincode_info', 'get_state', 'get_district', 'get_taluk', 'get_offices', 'exists',
+    'search_by_state', 'search_by_district', 'search_by_prefix', 'search_by_range',
+    'search_by_office', 'fuzzy_search', 'suggest', 'get_states', 'get_districts',
+    'get_statistics', 'get_metrics',
+))
+
+DEFAULT_PORT = 8765
+
+_PINCODE_ERRORS: Dict[str, Type[PininError]] = {
+    'InvalidPincodeError': InvalidPincodeError,
+    'DataNotFoundError': DataNotFoundError,
+}
+_BUILTIN_ERRORS: Dict[str, Type[Exception]] = {
+    'ValueError': ValueError,
+    'TypeError': TypeError,
+}
+
+Address = Union[str, Tuple[str, int]]
+
+
+def default_address() -> str:
+    """
+    Get the daemon address from ``PININ_SOCKET``, else the per-user default.
+
+    The default is a Unix socket in ``XDG_RUNTIME_DIR`` (or in the
+    :func:`private_dir` under the temporary directory), or
+    ``127.0.0.1:8765`` on platforms without Unix sockets.
+    """
+    configured = os.environ.get("PININ_SOCKET")
+    if configured:
+        return configured
+    if not hasattr(socket, "AF_UNIX"):
+        return f"127.0.0.1:{DEFAULT_PORT}"
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "pypinindia.sock")
+    return os.path.join(private_dir(), "pypinindia.sock")
+
+
+def private_dir() -> str:
+    """
+    Get the per-user directory for the default socket without ``XDG_RUNTIME_DIR``.
+
+    The temporary directory is shared by all users, so the socket is not
+    placed there directly: ``pypinindia serve`` creates this directory with
+    mode 0700, and clients check that it (and the socket) belongs to them.
+    """
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"pypinindia-{uid}")
+
+
+def check_private(path: str, directory: bool = False) -> None:
+    """
+    Check that a socket (or its directory) belongs to the current user only.
+
+    Another local user could otherwise listen on a socket path first and
+    answer lookups with forged data. Not checked on platforms without
+    ``os.getuid``.
+
+    Args:
+        path: Socket or directory path; symlinks are not followed
+        directory: Whether ``path`` must be a directory instead of a socket
+
+    Raises:
+        FileNotFoundError: If the path does not exist
+        PermissionError: If it is of the wrong type, owned by another user,
+                         or accessible to other users
+    """
+    if not hasattr(os, "getuid"):
+        return
+    info = os.lstat(path)
+    kind = "directory" if directory else "socket"
+    if not (stat.S_ISDIR if directory else stat.S_ISSOCK)(info.st_mode):
+        raise PermissionError(f"{path} is not a {kind}")
+    if info.st_uid != os.getuid():
+        raise PermissionError(f"{kind.capitalize()} {path} is owned by another user (uid {info.st_uid})")
+    if info.st_mode & 0o077:
+        raise PermissionError(f"{kind.capitalize()} {path} is accessible to other users "
+                              f"(mode {stat.S_IMODE(info.st_mode):o})")
+
+
+def parse_address(address: Optional[str] = None) -> Address:
+    """
+    Parse a daemon address.
+
+    Args:
+        address: A Unix socket path, or ``HOST:PORT`` for TCP. None uses
+                 :func:`default_address`.
+
+    Returns:
+        The socket path, or a ``(host, port)`` tuple
+    """
+    address = address or default_address()
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit() and os.sep not in address:
+        return host or "127.0.0.1", int(port)
+    return address
+
+
+def _error_from_response(error: Dict[str, Any]) -> Exception:
+    """Recreate the exception a daemon reported."""
+    name = error.get('type', '')
+    message = error.get('message', '')
+    if name in _PINCODE_ERRORS:
+        return _PINCODE_ERRORS[name](error.get('pincode', ''), message)
+    if name in _BUILTIN_ERRORS:
+        return _BUILTIN_ERRORS[name](message)
+    return PininError(f"{name}: {message}" if name else message)
+
+
+class DaemonClient:
+    """
+    Connection to a running lookup daemon.
+
+    Exposes the daemon's methods under their ``PincodeData`` names, so it can
+    stand in for a ``PincodeData`` instance for point lookups and searches::
+
+        with DaemonClient() as client:
+            client.get_state("110001")
+
+    Errors raised by the daemon are raised again as the same exception types.
+    A client is not thread-safe; use one per thread.
+    """
+
+    def __init__(self, address: Optional[str] = None, timeout: Optional[float] = 5.0):
+        """
+        Connect to a daemon.
+
+        Args:
+            address: Unix socket path or ``HOST:PORT``; None uses
+                     :func:`default_address`.
+            timeout: Socket timeout in seconds for connecting and for each
+                     request; None waits indefinitely.
+
+        Raises:
+            PermissionError: If the Unix socket (or the per-user directory
+                             it is in) belongs to another user or is
+                             accessible to other users; see :func:`check_private`
+            OSError: If no daemon is listening at the address
+        """
+        self.address = parse_address(address)
+        if not isinstance(self.address, tuple):
+            if os.path.dirname(os.path.abspath(self.address)) == private_dir():
+                check_private(private_dir(), directory=True)
+            check_private(self.address)
+        family = socket.AF_INET if isinstance(self.address, tuple) else socket.AF_UNIX
+        self._socket = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            self._socket.settimeout(timeout)
+            self._socket.connect(self.address)
+        except OSError:
+            self._socket.close()
+            raise
+        self._file = self._socket.makefile("rwb")
+
+    def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Send one request and wait for its response.
+
+        Raises:
+            The exception reported by the daemon, or ``ConnectionError`` if
+            the daemon closed the connection
+        """
+        request = {'method': method, 'args': list(args), 'kwargs': kwargs}
+        self._file.write(json.dumps(request).encode("utf-8") + b"\n")
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Lookup daemon closed the connection")
+        response = json.loads(line)
+        if 'error' in response:
+            raise _error_from_response(response['error'])
+        return response['result']
+
+    def ping(self) -> Dict[str, Any]:
+        """Get the daemon's process id, package version and data file."""
+        return self.call('ping')
+
+    def __getattr__(self, name: str) -> Any:
+        if name in METHODS:
+            return lambda *args, **kwargs: self.call(name, *args, **kwargs)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def close(self) -> None:
+        """Close the connection."""
+        try:
+            self._file.close()
+        finally:
+            self._socket.close()
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def connect(address: Optional[str] = None, data_file: Optional[str] = None,
+            timeout: Optional[float] = 5.0) -> Optional[DaemonClient]:
+    """
+    Connect to a running daemon serving the given data file, if there is one.
+
+    Args:
+        address: Unix socket path or ``HOST:PORT``; None uses
+                 :func:`default_address`.
+        data_file: CSV file the daemon must be serving; None requires the
+                   default bundled data.
+        timeout: Socket timeout in seconds.
+
+    Returns:
+        A connected client, or None if no daemon is listening, its socket
+        fails :func:`check_private`, or it serves a different data file
+    """
+    try:
+        client = DaemonClient(address, timeout)
+    except OSError:
+        return None
+    try:
+        info = client.ping()
+    except (OSError, ValueError, PininError):
+        client.close()
+        return None
+    if data_file is None:
+        serves_requested = info.get('default_data', False)
+    else:
+        serves_requested = info.get('data_file') == os.path.abspath(data_file)
+    if not serves_requested:
+        client.close()
+        return None
+    return client
@@ -4,11 +4,145 @@ Core functionality for Indian pincode data lookup and management.
 
 import os
 import re
-from functools import lru_cache
-from typing import Dict, List, Optional, Union, Any
+import sys
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union, Any
+import numpy as np
 import pandas as pd
 
-from .exceptions import InvalidPincodeError, DataNotFoundError, DataLoadError
+from .exceptions import PininError, InvalidPincodeError, DataNotFoundError, DataLoadError, ColumnNotAvailableError
+from .cache import CacheInfo, RecordCache
+from .index import GroupIndex, PincodeIndex
+from .normalize import LEADING_ZERO, OK, UNKNOWN, classify_pincode, pincode_digits
+from .normalize import normalize_pincodes as _normalize_formats
+from .metrics import INSTRUMENTED_METHODS, MetricEvent, MetricsRecorder, metrics_enabled
+from .record import RECORD_FORMATS, PincodeRecord
+from . import loader, snapshot
+from .loader import CATEGORICAL_COLUMNS, REQUIRED_COLUMNS
+
+PincodeArray = Union[Sequence[Union[str, int]], np.ndarray, pd.Series]
+PincodeRecords = Tuple[Mapping[str, Any], ...]
+Record = Union[Dict[str, Any], PincodeRecord]
+
+# Columns added by PincodeData.enrich when none are requested
+ENRICH_COLUMNS = ('statename', 'districtname', 'taluk', 'office_count')
+
+# Kinds of typo PincodeData.suggest corrects, most likely first
+SUGGESTION_EDITS = ('transposition', 'substitution', 'nearby')
+
+# Place value of each digit of a pincode
+_PLACES = 10 ** np.arange(5, -1, -1)
+
+
+def _memory_footprint(data: pd.DataFrame) -> Tuple[int, int]:
+    """
+    Measure the memory the data takes, and would take with plain string columns.
+    
+    Categorical columns are costed uncompacted as if every row held its own
+    string, which is how they were stored before being compacted at load
+    time. Every column is measured once, as this walks all string objects.
+    
+    Returns:
+        Tuple of (current bytes, uncompacted bytes)
+    """
+    index_bytes = int(data.index.memory_usage())
+    current = uncompacted = index_bytes
+    for name in data.columns:
+        column = data[name]
+        used = int(column.memory_usage(deep=True, index=False))
+        current += used
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            sizes = np.array([sys.getsizeof(value) for value in column.cat.categories] + [sys.getsizeof(np.nan)])
+            uncompacted += 8 * len(column) + int(sizes.take(column.cat.codes.to_numpy()).sum())
+        else:
+            uncompacted += used
+    return current, uncompacted
+
+
+class ReloadResult(NamedTuple):
+    """
+    Outcome of ``PincodeData.reload``.
+    
+    ``added`` and ``removed`` count rows present only in the new or only in
+    the old data (an edited row counts once in each); ``changed_pincodes``
+    counts the distinct pincodes those rows belong to.
+    """
+    seconds: float
+    records: int
+    added: int
+    removed: int
+    changed_pincodes: int
+
+
+def _count_changes(old: pd.DataFrame, new: pd.DataFrame) -> Tuple[int, int, int]:
+    """Count rows added and removed between two datasets, and the pincodes they touch."""
+    columns = [name for name in new.columns if name in old.columns]
+    old_hashes = pd.util.hash_pandas_object(old[columns], index=False).to_numpy()
+    new_hashes = pd.util.hash_pandas_object(new[columns], index=False).to_numpy()
+    added = ~np.isin(new_hashes, old_hashes)
+    removed = ~np.isin(old_hashes, new_hashes)
+    pincodes = set(new['pincode'].to_numpy()[added]) | set(old['pincode'].to_numpy()[removed])
+    return int(added.sum()), int(removed.sum()), len(pincodes)
+
+
+def _typo_candidates(digits: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pincodes one typo away from ``digits``: adjacent transpositions and
+    single-digit substitutions.
+    
+    Returns:
+        Tuple of (candidate numbers, index into ``SUGGESTION_EDITS``)
+    """
+    values = np.frombuffer(digits.encode('ascii'), dtype=np.uint8).astype(np.int64) - ord('0')
+    number = int(values @ _PLACES)
+    
+    # Swapping digits i and i+1 changes the number by (b - a) * (10^p - 10^(p-1))
+    steps = values[1:] - values[:-1]
+    swapped = number + steps * (_PLACES[:-1] - _PLACES[1:])
+    swapped = swapped[steps != 0]
+    
+    changes = (np.arange(10)[None, :] - values[:, None]) * _PLACES[:, None]
+    substituted = number + changes[changes != 0]
+    
+    candidates = np.concatenate([swapped, substituted])
+    edits = np.repeat([0, 1], [len(swapped), len(substituted)])
+    return candidates, edits
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Size and modification time of a file, or None if it cannot be read."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def default_data_file() -> str:
+    """Get the path to the default bundled data file."""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(current_dir, "All_India_pincode_data.csv")
+
+
+def _normalize_pincode(pincode: Union[str, int]) -> str:
+    """
+    Validate and normalize a single pincode.
+    
+    Accepts the same layouts as ``normalize_pincodes``, e.g. ``110 001``,
+    ``PIN: 110001`` or ``110001.0``.
+    
+    Raises:
+        InvalidPincodeError: If pincode format is invalid
+    """
+    pincode_str, reason = classify_pincode(pincode)
+    if pincode_str is None:
+        text = str(pincode).strip()
+        if reason == LEADING_ZERO:
+            raise InvalidPincodeError(text, f"Invalid pincode: '{text}'. Pincodes do not start with 0.")
+        raise InvalidPincodeError(text)
+    return pincode_str
 
 
 class PincodeData:
@@ -20,27 +154,101 @@ class PincodeData:
     - Office names and types
     - Delivery status
     - Regional and divisional information
+    
+    Thread safety: once constructed, the loaded data and its indexes are
+    never modified in place, so any number of threads may query one instance
+    concurrently. Index structures built lazily on first use (e.g. the office
+    name index) are only published once complete; the lookup cache is
+    protected by a lock. Callers must not modify ``data`` in place.
+    
+    ``reload()`` (or ``watch()``) replaces the dataset without stopping
+    readers: the new data and indexes are built off to the side and swapped
+    in at once, and calls already running finish on the old data.
     """
     
-    def __init__(self, data_file: Optional[str] = None):
+    def __init__(self, data_file: Optional[str] = None, use_snapshot: Optional[bool] = None,
+                 cache_size: int = 2048, cache_policy: str = 'lru',
+                 record_format: str = 'dict', metrics: Optional[bool] = None,
+                 on_metric: Optional[Callable[[MetricEvent], None]] = None,
+                 columns: Union[str, Sequence[str], None] = None):
         """
         Initialize the PincodeData with CSV data.
         
         Args:
             data_file: Path to CSV file containing pincode data.
                       If None, uses the default bundled data file.
+            use_snapshot: Load from (and maintain) a compiled binary snapshot
+                      of the CSV instead of parsing it on every start.
+                      Defaults to True unless ``PININ_SNAPSHOT=0`` is set.
+            cache_size: Number of pincodes whose records are kept in the
+                      lookup cache; 0 disables the cache.
+            cache_policy: Cache eviction policy, ``'lru'`` (least recently
+                      used) or ``'lfu'`` (least frequently used).
+            record_format: Type of the records returned by lookups and
+                      office searches: ``'dict'`` (plain dictionaries) or
+                      ``'record'`` (compact, lazily decoded ``PincodeRecord``
+                      objects).
+            metrics: Record call counts, latencies, load phase and index
+                      build timings, readable with ``get_metrics()``.
+                      Defaults to False unless ``PININ_METRICS=1`` is set;
+                      when off, methods are not instrumented at all.
+            on_metric: Callback receiving every measurement as a
+                      ``MetricEvent``; implies ``metrics=True``.
+            columns: Columns to keep in memory: a profile name
+                      (``'minimal'``: pincode, state and district;
+                      ``'standard'``: the required columns; ``'full'``:
+                      every column) or a list of column names. Only these
+                      columns are parsed, stored and indexed; methods that
+                      need another column raise ``ColumnNotAvailableError``.
         
         Raises:
             DataLoadError: If the data file cannot be loaded
+            ValueError: If the cache size, cache policy, record format or
+                        column profile is invalid
         """
+        if record_format not in RECORD_FORMATS:
+            raise ValueError(f"Unknown record format '{record_format}', expected one of {RECORD_FORMATS}")
+        
         self.data: Optional[pd.DataFrame] = None
+        self._index: Optional[PincodeIndex] = None
+        self._cache = RecordCache(cache_size, cache_policy)
+        self._swap_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._watch_stop: Optional[threading.Event] = None
+        self._record_format = record_format
+        self._columns = loader.resolve_columns(columns)
         self._data_file = data_file or self._get_default_data_file()
+        self._use_snapshot = snapshot.snapshot_enabled() if use_snapshot is None else use_snapshot
+        
+        if metrics is None:
+            metrics = metrics_enabled()
+        self._metrics = MetricsRecorder(on_metric) if metrics or on_metric is not None else None
+        
+        start = time.perf_counter()
+        # Taken before loading, so a change made meanwhile is seen by watch()
+        self._signature = _file_signature(self._data_file)
+        self._footprint: Optional[Tuple[pd.DataFrame, int, int]] = None
         self._load_data()
+        if self._index is not None:
+            # Built up front (125 KB) so that exists() never waits for it
+            self._index.bitmap
+        
+        if self._metrics is not None:
+            self._record_load('total', start)
+            if self._index is not None:
+                self._index.on_build = self._metrics.record_build
+            # Instance attributes shadow the class methods, which stay untimed
+            for name in INSTRUMENTED_METHODS:
+                setattr(self, name, self._metrics.wrap(name, getattr(self, name)))
+    
+    def _record_load(self, phase: str, start: float) -> None:
+        """Record the duration of a load phase that began at ``start``."""
+        if self._metrics is not None:
+            self._metrics.record(MetricEvent('load', phase, time.perf_counter() - start))
     
     def _get_default_data_file(self) -> str:
         """Get the path to the default bundled data file."""
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        return os.path.join(current_dir, "All_India_pincode_data.csv")
+        return default_data_file()
     
     def _load_data(self) -> None:
         """Load pincode data from CSV file."""
@@ -48,31 +256,61 @@ class PincodeData:
             if not os.path.exists(self._data_file):
                 raise DataLoadError(f"Data file not found: {self._data_file}")
             
-            # Try different encodings to handle various CSV file formats
-            encodings = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']
+            # A current snapshot already holds the parsed columns and index
+            if self._use_snapshot:
+                start = time.perf_counter()
+                loaded = snapshot.load_snapshot(self._data_file, self._columns)
+                if loaded is not None:
+                    self._check_columns(loaded[0])
+                    self.data, self._index = loaded
+                    self._record_load('snapshot_load', start)
+                    self._measure_footprint()
+                    return
             
-            for encoding in encodings:
-                try:
-                    self.data = pd.read_csv(self._data_file, encoding=encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                raise DataLoadError("Could not decode CSV file with any supported encoding")
+            start = time.perf_counter()
             
-            # Validate required columns
-            required_columns = [
-                'pincode', 'officename', 'statename', 'districtname', 
-                'taluk', 'officetype', 'Deliverystatus'
-            ]
+            # Taken before parsing, so a snapshot never pairs these rows with
+            # a newer file's signature
+            source = snapshot.source_signature(self._data_file) if self._use_snapshot else None
             
-            missing_columns = [col for col in required_columns if col not in self.data.columns]
-            if missing_columns:
-                raise DataLoadError(f"Missing required columns: {missing_columns}")
+            # One pass detects the encoding, so the file is parsed only once.
+            # A snapshot is written with every column, whatever is kept here.
+            usecols = None if self._use_snapshot else self._columns
+            self.data = loader.read_csv(self._data_file, usecols)
+            self._record_load('read_csv', start)
+            
+            start = time.perf_counter()
+            self._check_columns(self.data)
             
             # Convert pincode to string for consistent handling
             self.data['pincode'] = self.data['pincode'].astype(str)
             
+            # Already categorical when parsed by the loader; this covers other sources
+            for column in CATEGORICAL_COLUMNS:
+                if column in self.data.columns and not isinstance(self.data[column].dtype, pd.CategoricalDtype):
+                    self.data[column] = self.data[column].astype('category')
+            self._record_load('prepare', start)
+            
+            # Build the lookup index once so point lookups avoid full scans
+            start = time.perf_counter()
+            self._index = PincodeIndex(self.data)
+            self._record_load('index', start)
+            
+            if self._use_snapshot:
+                start = time.perf_counter()
+                snapshot.write_snapshot(self._data_file, self.data, self._index, source)
+                self._record_load('snapshot_write', start)
+            
+            if self._columns is not None:
+                kept = [col for col in self.data.columns if col in self._columns]
+                if len(kept) < len(self.data.columns):
+                    self.data = self.data[kept]
+                    self._index = PincodeIndex.from_arrays(
+                        self.data, self._index.keys, self._index.order, self._index.offsets
+                    )
+            
+            self._measure_footprint()
+            
         except pd.errors.EmptyDataError:
             raise DataLoadError("Data file is empty", self._data_file)
         except pd.errors.ParserError as e:
@@ -80,6 +318,45 @@ class PincodeData:
         except Exception as e:
             raise DataLoadError(f"Unexpected error loading data: {str(e)}", self._data_file)
     
+    def _measure_footprint(self) -> None:
+        """Measure the loaded data's memory once, for ``get_statistics``."""
+        data = self.data
+        if data is not None:
+            self._footprint = (data, *_memory_footprint(data))
+    
+    def _check_columns(self, data: pd.DataFrame) -> None:
+        """Check that loaded data has the required (or selected) columns."""
+        required = REQUIRED_COLUMNS if self._columns is None else self._columns
+        missing_columns = [col for col in required if col not in data.columns]
+        if missing_columns:
+            raise DataLoadError(f"Missing required columns: {missing_columns}")
+    
+    def _require(self, *columns: str) -> None:
+        """
+        Check that the columns an operation needs were loaded.
+        
+        Raises:
+            ColumnNotAvailableError: If a column was left out with ``columns=``
+        """
+        if self._columns is not None:
+            for column in columns:
+                if column not in self._columns:
+                    raise ColumnNotAvailableError(column)
+    
+    def _projected_away(self, names: Sequence[str]) -> List[str]:
+        """
+        Get the names that are dataset columns left out with ``columns=``.
+        
+        Known pincode columns are recognized directly; other names are
+        looked up in the data file's header, which is only read when needed.
+        """
+        if self._columns is None or not names:
+            return []
+        known = set(REQUIRED_COLUMNS) | set(CATEGORICAL_COLUMNS) | set(ENRICH_COLUMNS)
+        if any(name not in known for name in names):
+            known.update(loader.read_header(self._data_file) or ())
+        return [name for name in names if name in known and name not in self._columns]
+    
     def _validate_pincode(self, pincode: Union[str, int]) -> str:
         """
         Validate and normalize pincode format.
@@ -93,31 +370,122 @@ class PincodeData:
         Raises:
             InvalidPincodeError: If pincode format is invalid
         """
-        # Convert to string and remove any whitespace
-        pincode_str = str(pincode).strip()
-        
-        # Check if it's a valid 6-digit pincode
-        if not re.match(r'^\d{6}$', pincode_str):
-            raise InvalidPincodeError(pincode_str)
-        
-        return pincode_str
+        return _normalize_pincode(pincode)
     
+    def _get_index(self) -> PincodeIndex:
+        """Get the lookup index, rebuilding it if ``data`` has been replaced."""
+        index = self._index
+        if index is not None and index.data is self.data:
+            return index
+        # Either ``data`` was assigned directly or a reload is swapping both
+        with self._swap_lock:
+            if self.data is None:
+                raise DataLoadError("Data not loaded")
+            index = self._index
+            if index is None or index.data is not self.data:
+                start = time.perf_counter()
+                index = PincodeIndex(self.data)
+                if self._metrics is not None:
+                    self._metrics.record_build('index', time.perf_counter() - start)
+                    index.on_build = self._metrics.record_build
+                self._index = index
+                self._cache = RecordCache(self._cache.maxsize, self._cache.policy)
+        return index
+
     def _get_matching_rows(self, pincode: str) -> pd.DataFrame:
         """Get matching rows for a given pincode."""
+        index = self._get_index()
+        return index.data.iloc[index.positions(pincode)]
+
+    def _make_records(self, index: PincodeIndex, rows: np.ndarray) -> List[Record]:
+        """Build the records of the given row positions in the configured format."""
+        if self._record_format == 'record':
+            columns = index.record_columns
+            return [PincodeRecord(columns, row) for row in rows.tolist()]
+        return index.data.iloc[rows].to_dict('records')  # type: ignore
+    
+    def _get_records(self, pincode: Union[str, int]) -> PincodeRecords:
+        """
+        Get the records of a pincode, through the lookup cache.
+        
+        Records are read-only mappings shared by every caller, so a hit costs
+        a dictionary probe instead of rebuilding them from the DataFrame.
+        
+        Raises:
+            InvalidPincodeError: If pincode format is invalid
+            DataNotFoundError: If no data found for the pincode
+        """
         if self.data is None:
             raise DataLoadError("Data not loaded")
-        return self.data[self.data['pincode'] == pincode]
-
+        
+        pincode_str = self._validate_pincode(pincode)
+        
+        # The cache is replaced whenever the index is; retry if that happened
+        # meanwhile, so records are never cached for the wrong data
+        while True:
+            cache = self._cache
+            index = self._get_index()
+            if cache is self._cache:
+                break
+        records = cache.get(pincode_str)
+        if records is not None:
+            return records  # type: ignore
+        
+        filtered_data = index.data.iloc[index.positions(pincode_str)]
+        if filtered_data.empty:
+            raise DataNotFoundError(pincode_str)
+        
+        records = tuple(MappingProxyType(record) for record in filtered_data.to_dict('records'))
+        cache.put(pincode_str, records)
+        return records  # type: ignore
+    
+    def cache_info(self) -> CacheInfo:
+        """
+        Get lookup cache statistics.
+        
+        Returns:
+            Named tuple of ``hits``, ``misses``, ``maxsize``, ``currsize``
+            and ``policy``
+        """
+        return self._cache.info()
+    
+    def cache_clear(self) -> None:
+        """Empty the lookup cache and reset its statistics."""
+        self._cache.clear()
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the collected metrics.
+        
+        Returns:
+            Dictionary with ``enabled``; ``calls`` (per public method: count,
+            errors, total, mean, max, p50 and p99 seconds and the latency
+            histogram ``buckets``, keyed by upper bound); ``load`` (seconds
+            per load phase); ``index_builds`` (seconds of every build of each
+            index structure) and ``cache`` (``cache_info()`` plus
+            ``hit_rate``). Only ``cache`` is populated when metrics are
+            disabled.
+        """
+        if self._metrics is not None:
+            collected = self._metrics.snapshot()
+        else:
+            collected = {'calls': {}, 'load': {}, 'index_builds': {}}
+        info = self._cache.info()
+        lookups = info.hits + info.misses
+        cache = dict(info._asdict(), hit_rate=info.hits / lookups if lookups else 0.0)
+        return dict(enabled=self._metrics is not None, **collected, cache=cache)
+    
     def _get_info_field(self, pincode: Union[str, int], field_name: str) -> Union[str, List[str]]:
         """
         Helper to get a specific field or list of fields for a pincode.
         """
-        info = self.get_pincode_info(pincode)
+        self._require(field_name)
+        info = self._get_records(pincode)
         if field_name == 'officename':
             return [str(office[field_name]) for office in info]
         return str(info[0][field_name])
 
-    def get_pincode_info(self, pincode: Union[str, int]) -> List[Dict[str, Any]]:
+    def get_pincode_info(self, pincode: Union[str, int]) -> List[Record]:
         """
         Get complete information for a pincode.
         
@@ -125,26 +493,26 @@ class PincodeData:
             pincode: The pincode to lookup
             
         Returns:
-            List of dictionaries containing pincode information.
+            List of dictionaries containing pincode information (or
+            ``PincodeRecord`` objects with ``record_format='record'``).
             Multiple entries may exist for a single pincode.
             
         Raises:
             InvalidPincodeError: If pincode format is invalid
             DataNotFoundError: If no data found for the pincode
         """
-        if self.data is None:
-            raise DataLoadError("Data not loaded")
-        
-        pincode_str = self._validate_pincode(pincode)
-        
-        # Filter data for the given pincode
-        filtered_data = self._get_matching_rows(pincode_str)
-        
-        if filtered_data.empty:
-            raise DataNotFoundError(pincode_str)
+        if self._record_format == 'record':
+            if self.data is None:
+                raise DataLoadError("Data not loaded")
+            pincode_str = self._validate_pincode(pincode)
+            index = self._get_index()
+            rows = index.positions(pincode_str)
+            if not len(rows):
+                raise DataNotFoundError(pincode_str)
+            return self._make_records(index, rows)
         
-        # Convert to list of dictionaries
-        return filtered_data.to_dict('records')  # type: ignore
+        # Fresh dictionaries, so callers may modify them without touching the cache
+        return [dict(record) for record in self._get_records(pincode)]
     
     def get_state(self, pincode: Union[str, int]) -> str:
         """
@@ -221,7 +589,250 @@ class PincodeData:
             return self._get_info_field(pincode, 'officename') # type: ignore
         except IndexError:
             return []
+    
+    def exists(self, pincode: Union[str, int]) -> bool:
+        """
+        Check whether a pincode exists, without raising.
+        
+        A bit test in the existence bitmap built at load time; no records
+        are read.
+        
+        Args:
+            pincode: The pincode to check, in any form ``normalize_pincodes``
+                     accepts
+            
+        Returns:
+            True if the pincode is in the dataset, False if it is unknown
+            or malformed
+        """
+        pincode_str, _ = classify_pincode(pincode)
+        if pincode_str is None:
+            return False
+        number = int(pincode_str)
+        return bool((self._get_index().bitmap[number >> 3] >> (7 - (number & 7))) & 1)
+    
+    def exists_many(self, pincodes: PincodeArray) -> np.ndarray:
+        """
+        Check many pincodes at once against the existence bitmap.
+        
+        Integer arrays are tested directly; other input is normalized first
+        (see ``normalize_pincodes``).
+        
+        Args:
+            pincodes: List, NumPy array or pandas Series of pincodes
+            
+        Returns:
+            Boolean array aligned with the input, False for unknown or
+            malformed pincodes
+        """
+        index = self._get_index()
+        values = pincodes.to_numpy() if isinstance(pincodes, pd.Series) else np.asarray(pincodes)
+        if values.dtype.kind in 'iu':
+            # Numbers below 100000 would be written with a leading zero
+            return index.contains(values) & (values >= 100_000)
+        
+        normalized = _normalize_formats(pincodes)
+        valid = (normalized['reason'] == OK).to_numpy(dtype=bool)
+        result = np.zeros(len(normalized), dtype=bool)
+        if valid.any():
+            numbers = normalized['pincode'].to_numpy(dtype=object)[valid].astype(np.int64)
+            result[valid] = index.contains(numbers)
+        return result
+
+    def _lookup_many(self, pincodes: PincodeArray) -> Tuple[PincodeIndex, pd.DataFrame, np.ndarray, np.ndarray]:
+        """
+        Validate and probe many pincodes in one vectorized pass.
+        
+        Returns:
+            Tuple of (index, ``normalize_pincodes`` result without the
+            ``'unknown'`` reason, validity mask, slots), where slots are -1
+            for invalid or unknown pincodes
+        """
+        index = self._get_index()
+        
+        normalized = _normalize_formats(pincodes)
+        valid = (normalized['reason'] == OK).to_numpy(dtype=bool)
+        
+        slots = np.full(len(normalized), -1, dtype=np.intp)
+        if valid.any():
+            slots[valid] = index.lookup(normalized['pincode'].to_numpy(dtype=object)[valid])
+        return index, normalized, valid, slots
+    
+    def normalize_pincodes(self, pincodes: PincodeArray) -> pd.DataFrame:
+        """
+        Normalize and validate many pincodes in one vectorized pass.
+        
+        Cleans common real-world layouts (``110 001``, ``110-001``,
+        ``PIN: 110001``, Excel floats such as ``110001.0``) and reports why
+        each remaining value is rejected.
+        
+        Args:
+            pincodes: List, NumPy array or pandas Series of pincodes
+            
+        Returns:
+            DataFrame aligned with the input (keeping a Series input's index)
+            with a ``pincode`` column holding the normalized 6-digit string
+            (missing for rejected values) and a categorical ``reason``
+            column: ``'ok'``, ``'missing'``, ``'bad_length'``,
+            ``'non_numeric'``, ``'leading_zero'`` or ``'unknown'`` (well
+            formed but not in the dataset)
+        """
+        _, normalized, valid, slots = self._lookup_many(pincodes)
+        
+        unknown = valid & (slots < 0)
+        if unknown.any():
+            reason = normalized['reason'].to_numpy(copy=True)
+            reason[unknown] = UNKNOWN
+            normalized['reason'] = pd.Categorical(reason, categories=normalized['reason'].cat.categories)
+            normalized.loc[unknown, 'pincode'] = None
+        return normalized
+
+    def get_pincode_info_many(self, pincodes: PincodeArray) -> List[Union[List[Record], PininError]]:
+        """
+        Get complete information for many pincodes at once.
+        
+        Args:
+            pincodes: List, NumPy array or pandas Series of pincodes
+            
+        Returns:
+            List aligned with the input. Each item is the list of records
+            ``get_pincode_info`` would return, or an ``InvalidPincodeError`` /
+            ``DataNotFoundError`` instance (returned, not raised) for pincodes
+            that are malformed or unknown.
+        """
+        index, normalized, valid, slots = self._lookup_many(pincodes)
+        
+        found = slots >= 0
+        rows, counts = index.rows_for_slots(slots[found])
+        records = self._make_records(index, rows)
+        
+        results: List[Union[List[Record], PininError]] = []
+        ends = iter(np.cumsum(counts).tolist())
+        start = 0
+        raw = pincodes.tolist() if isinstance(pincodes, (pd.Series, np.ndarray)) else list(pincodes)
+        for value, pincode_str, is_valid, is_found in zip(raw, normalized['pincode'].tolist(),
+                                                          valid.tolist(), found.tolist()):
+            if is_found:
+                end = next(ends)
+                results.append(records[start:end])  # type: ignore
+                start = end
+            elif is_valid:
+                results.append(DataNotFoundError(pincode_str))
+            else:
+                results.append(InvalidPincodeError(str(value).strip()))
+        return results
+
+    def _get_field_many(self, pincodes: PincodeArray, field_name: str) -> pd.Series:
+        """
+        Helper to get one field for many pincodes in a single vectorized pass.
+        """
+        self._require(field_name)
+        index, normalized, _, slots = self._lookup_many(pincodes)
+        
+        found = slots >= 0
+        result = np.full(len(slots), None, dtype=object)
+        if found.any():
+            rows = index.first_rows[slots[found]]
+            result[found] = index.data[field_name].iloc[rows].to_numpy(dtype=object)
+        return pd.Series(result, index=normalized.index, name=field_name, dtype=object)
+
+    def get_states_many(self, pincodes: PincodeArray) -> pd.Series:
+        """
+        Get the state names for many pincodes at once.
+        
+        Args:
+            pincodes: List, NumPy array or pandas Series of pincodes
+            
+        Returns:
+            Series aligned with the input (keeping a Series input's index),
+            holding None for malformed or unknown pincodes; use ``isna()``
+            for the miss mask
+        """
+        return self._get_field_many(pincodes, 'statename')
+
+    def get_districts_many(self, pincodes: PincodeArray) -> pd.Series:
+        """
+        Get the district names for many pincodes at once.
+        
+        Args:
+            pincodes: List, NumPy array or pandas Series of pincodes
+            
+        Returns:
+            Series aligned with the input, holding None for misses
+        """
+        return self._get_field_many(pincodes, 'districtname')
+
+    def get_taluks_many(self, pincodes: PincodeArray) -> pd.Series:
+        """
+        Get the taluk names for many pincodes at once.
+        
+        Args:
+            pincodes: List, NumPy array or pandas Series of pincodes
+            
+        Returns:
+            Series aligned with the input, holding None for misses
+        """
+        return self._get_field_many(pincodes, 'taluk')
+
+    def enrich(self, df: pd.DataFrame, column: str = 'pincode',
+               columns: Optional[Sequence[str]] = None, prefix: str = '',
+               inplace: bool = False) -> pd.DataFrame:
+        """
+        Add pincode details to a DataFrame as one hash join.
+        
+        Every distinct pincode is looked up once in a per-pincode summary
+        table cached on this instance, rather than calling
+        ``get_pincode_info`` for each row.
+        
+        Args:
+            df: DataFrame with a pincode column (int, float or string values)
+            column: Name of the pincode column in ``df``
+            columns: Columns to add; any dataset column or ``'office_count'``.
+                     Defaults to state, district, taluk and office count
+                     (those that were loaded).
+            prefix: Prefix for the added column names
+            inplace: Add the columns to ``df`` itself instead of a shallow copy
+            
+        Returns:
+            DataFrame with the added columns. Rows with malformed or unknown
+            pincodes get missing values and an office count of 0.
+            
+        Raises:
+            ValueError: If ``column`` is not in ``df`` or a requested column
+                        does not exist in the dataset
+            ColumnNotAvailableError: If a requested column was left out with
+                        ``columns=`` when this instance was created
+        """
+        if column not in df.columns:
+            raise ValueError(f"Column '{column}' not found in DataFrame")
+        
+        index, _, _, slots = self._lookup_many(df[column])
+        summary = index.summary
+        
+        if columns is not None:
+            selected = list(columns)
+        else:
+            selected = [name for name in ENRICH_COLUMNS if name in summary.columns]
+        unknown = [name for name in selected if name not in summary.columns]
+        dropped = self._projected_away(unknown)
+        if dropped:
+            raise ColumnNotAvailableError(dropped[0])
+        if unknown:
+            raise ValueError(f"Unknown enrichment columns: {unknown}")
+        
+        # Slot -1 picks the summary's trailing empty row for misses
+        joined = summary[selected].take(slots)
+        
+        result = df if inplace else df.copy(deep=False)
+        for name in selected:
+            result[prefix + name] = joined[name].to_numpy()
+        return result
 
+    def _get_groups(self) -> GroupIndex:
+        """Get the state and district groupings, which need both columns."""
+        self._require('statename', 'districtname')
+        return self._get_index().groups
+    
     def search_by_state(self, state_name: str) -> List[str]:
         """
         Get all pincodes for a given state.
@@ -232,15 +843,10 @@ class PincodeData:
         Returns:
             List of unique pincodes in the state
         """
-        if self.data is None:
-            raise DataLoadError("Data not loaded")
+        groups = self._get_groups()
         
         # Case-insensitive search
-        filtered_data = self.data[
-            self.data['statename'].str.upper() == state_name.upper()
-        ]
-        
-        return sorted(filtered_data['pincode'].unique().tolist()) if not filtered_data.empty else []
+        return list(groups.state_pincodes.get(state_name.upper(), []))
     
     def search_by_district(self, district_name: str, state_name: Optional[str] = None) -> List[str]:
         """
@@ -253,40 +859,256 @@ class PincodeData:
         Returns:
             List of unique pincodes in the district
         """
-        if self.data is None:
-            raise DataLoadError("Data not loaded")
+        groups = self._get_groups()
         
         # Case-insensitive search
-        filtered_data = self.data[
-            self.data['districtname'].str.upper() == district_name.upper()
-        ]
-        
         if state_name:
-            filtered_data = filtered_data[
-                filtered_data['statename'].str.upper() == state_name.upper()
-            ]
+            key = (state_name.upper(), district_name.upper())
+            return list(groups.state_district_pincodes.get(key, []))
         
-        return sorted(filtered_data['pincode'].unique().tolist()) if not filtered_data.empty else []
+        return list(groups.district_pincodes.get(district_name.upper(), []))
     
-    def search_by_office(self, office_name: str) -> List[Dict[str, Any]]:
+    def _prefix_bounds(self, prefix: Union[str, int]) -> Tuple[int, int]:
+        """
+        Validate a pincode prefix and get the range of pincodes it covers.
+        
+        Raises:
+            InvalidPincodeError: If the prefix is not 1 to 6 digits
+        """
+        prefix_str = str(prefix).strip()
+        if not re.match(r'^\d{1,6}$', prefix_str):
+            raise InvalidPincodeError(
+                prefix_str, f"Invalid pincode prefix: '{prefix_str}'. Prefix must be 1 to 6 digits."
+            )
+        
+        width = 10 ** (6 - len(prefix_str))
+        low = int(prefix_str) * width
+        return low, low + width - 1
+    
+    def _range_bounds(self, start: Union[str, int], end: Union[str, int]) -> Tuple[int, int]:
+        """Validate the ends of a pincode range and get them as numbers."""
+        return int(self._validate_pincode(start)), int(self._validate_pincode(end))
+    
+    def _iter_slots(self, index: PincodeIndex, slots: np.ndarray, chunk_size: int = 1024) -> Iterator[str]:
+        """Yield the pincodes of a slot range, decoding one chunk at a time."""
+        for offset in range(0, len(slots), chunk_size):
+            yield from index.keys[slots[offset:offset + chunk_size]].tolist()
+    
+    def search_by_prefix(self, prefix: Union[str, int]) -> List[str]:
+        """
+        Get all pincodes starting with a prefix.
+        
+        The first digit of a pincode is the postal zone and the first three
+        identify the sorting district, so e.g. ``"560"`` returns every
+        pincode of the Bangalore sorting district.
+        
+        Args:
+            prefix: Leading 1 to 6 digits of the pincodes
+            
+        Returns:
+            Sorted list of unique pincodes with the prefix
+            
+        Raises:
+            InvalidPincodeError: If the prefix is not 1 to 6 digits
+        """
+        low, high = self._prefix_bounds(prefix)
+        index = self._get_index()
+        return index.keys[index.slot_range(low, high)].tolist()  # type: ignore
+    
+    def search_by_range(self, start: Union[str, int], end: Union[str, int]) -> List[str]:
+        """
+        Get all pincodes between two pincodes (inclusive).
+        
+        Args:
+            start: First pincode of the range
+            end: Last pincode of the range
+            
+        Returns:
+            Sorted list of unique pincodes in the range (empty if ``start``
+            is greater than ``end``)
+            
+        Raises:
+            InvalidPincodeError: If either end is not a valid pincode
+        """
+        low, high = self._range_bounds(start, end)
+        index = self._get_index()
+        return index.keys[index.slot_range(low, high)].tolist()  # type: ignore
+    
+    def iter_by_prefix(self, prefix: Union[str, int]) -> Iterator[str]:
+        """
+        Iterate over the pincodes starting with a prefix, in ascending order.
+        
+        Like :meth:`search_by_prefix`, but pincodes are produced lazily, so
+        a broad prefix such as a single zone digit does not build one large
+        list up front.
+        
+        Args:
+            prefix: Leading 1 to 6 digits of the pincodes
+            
+        Returns:
+            Iterator over the matching pincodes
+            
+        Raises:
+            InvalidPincodeError: If the prefix is not 1 to 6 digits
+        """
+        low, high = self._prefix_bounds(prefix)
+        index = self._get_index()
+        return self._iter_slots(index, index.slot_range(low, high))
+    
+    def iter_by_range(self, start: Union[str, int], end: Union[str, int]) -> Iterator[str]:
+        """
+        Iterate over the pincodes between two pincodes (inclusive), in ascending order.
+        
+        Args:
+            start: First pincode of the range
+            end: Last pincode of the range
+            
+        Returns:
+            Iterator over the matching pincodes
+            
+        Raises:
+            InvalidPincodeError: If either end is not a valid pincode
+        """
+        low, high = self._range_bounds(start, end)
+        index = self._get_index()
+        return self._iter_slots(index, index.slot_range(low, high))
+    
+    def search_by_office(self, office_name: str, limit: Optional[int] = None) -> List[Record]:
         """
         Search for pincodes by office name (partial match).
         
+        The query is matched as a literal substring, so characters such as
+        ``.`` or ``(`` have no special meaning. Candidates come from a trigram
+        index over the distinct office names and are then verified.
+        
         Args:
             office_name: Office name to search for (case-insensitive, partial match)
+            limit: Maximum number of records to return (in file order)
             
         Returns:
             List of dictionaries containing matching office information
+            (or ``PincodeRecord`` objects with ``record_format='record'``)
         """
-        if self.data is None:
-            raise DataLoadError("Data not loaded")
+        self._require('officename')
+        index = self._get_index()
+        if index.data.empty:
+            return []
+        
+        names = index.names('officename')
+        rows = names.rows(names.find(office_name.upper(), limit), limit)
+        
+        return self._make_records(index, rows)
+    
+    def fuzzy_search(self, field: str, query: str, k: int = 10,
+                     max_distance: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Find the names closest to a possibly misspelled query.
         
-        # Case-insensitive partial match
-        filtered_data = self.data[
-            self.data['officename'].str.upper().str.contains(office_name.upper(), na=False)
+        Candidates are preselected by trigram similarity and then ranked by
+        case-insensitive edit distance, so only a few dozen of the distinct
+        names are compared in detail.
+        
+        Args:
+            field: Column to search, e.g. ``'officename'`` or ``'districtname'``
+            query: Name to match
+            k: Maximum number of matches to return
+            max_distance: Only return names within this many edits
+            
+        Returns:
+            List of dictionaries with the matched ``value``, its edit
+            ``distance``, trigram ``similarity`` (0 to 1) and the number of
+            ``records`` holding it, best match first
+            
+        Raises:
+            ValueError: If the field is not a column of the dataset
+            ColumnNotAvailableError: If the field was left out with ``columns=``
+        """
+        index = self._get_index()
+        if field not in index.data.columns and self._columns is not None:
+            raise ColumnNotAvailableError(field)
+        if field not in index.data.columns or field == 'pincode':
+            raise ValueError(f"Cannot search field '{field}'")
+        
+        names = index.names(field)
+        return [
+            {
+                'value': names.display[name_id],
+                'distance': distance,
+                'similarity': round(similarity, 3),
+                'records': int(names.offsets[name_id + 1] - names.offsets[name_id]),
+            }
+            for name_id, distance, similarity in names.nearest(query.strip().upper(), k, max_distance)
         ]
+    
+    def suggest(self, pincode: Union[str, int], k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Suggest existing pincodes that a mistyped one was probably meant to be.
+        
+        Candidates are the adjacent transpositions and single-digit
+        substitutions of the pincode, plus the numerically closest pincodes
+        of its 3-digit sorting district. They are filtered with the
+        existence bitmap, so no records are read.
         
-        return filtered_data.to_dict('records')  # type: ignore
+        Args:
+            pincode: The pincode as typed, in any form ``normalize_pincodes``
+                     accepts; a leading 0 is allowed here
+            k: Maximum number of suggestions
+            
+        Returns:
+            List of dictionaries with the suggested ``pincode``, the
+            ``edit`` that leads to it (``'transposition'``,
+            ``'substitution'`` or ``'nearby'``) and the number of
+            ``records`` (offices) it has. Ranked by edit kind in that order,
+            then by office count, then by numeric distance. The typed
+            pincode itself is never suggested.
+            
+        Raises:
+            InvalidPincodeError: If the value does not hold six digits
+        """
+        digits, _ = pincode_digits(pincode)
+        if digits is None:
+            raise InvalidPincodeError(str(pincode).strip())
+        if k <= 0:
+            return []
+        index = self._get_index()
+        number = int(digits)
+        
+        candidates, edits = _typo_candidates(digits)
+        
+        # Up to k existing pincodes on either side within the sorting district
+        numbers, slots = index.numbers
+        district = number - number % 1000
+        low = np.searchsorted(numbers, district, side='left')
+        high = np.searchsorted(numbers, district + 1000, side='left')
+        at = np.searchsorted(numbers, number, side='left')
+        below = numbers[max(low, at - k):at]
+        above = numbers[at:min(high, at + k + 1)]
+        nearby = np.concatenate([below, above[above != number]])
+        
+        candidates = np.concatenate([candidates, nearby])
+        edits = np.concatenate([edits, np.full(len(nearby), 2)])
+        found = index.contains(candidates) & (candidates >= 100_000) & (candidates != number)
+        candidates, edits = candidates[found], edits[found]
+        
+        # Keep the most likely edit of candidates reached in several ways
+        order = np.lexsort((edits, candidates))
+        candidates, edits = candidates[order], edits[order]
+        unique = np.ones(len(candidates), dtype=bool)
+        unique[1:] = candidates[1:] != candidates[:-1]
+        candidates, edits = candidates[unique], edits[unique]
+        
+        found_slots = slots[np.searchsorted(numbers, candidates)]
+        counts = index.offsets[found_slots + 1] - index.offsets[found_slots]
+        ranked = np.lexsort((candidates, np.abs(candidates - number), -counts, edits))[:k]
+        return [
+            {
+                'pincode': f"{candidate:06d}",
+                'edit': SUGGESTION_EDITS[edit],
+                'records': int(count),
+            }
+            for candidate, edit, count in zip(candidates[ranked].tolist(), edits[ranked].tolist(),
+                                              counts[ranked].tolist())
+        ]
     
     def get_states(self) -> List[str]:
         """
@@ -295,10 +1117,7 @@ class PincodeData:
         Returns:
             Sorted list of unique state names
         """
-        if self.data is None:
-            raise DataLoadError("Data not loaded")
-        
-        return sorted(self.data['statename'].unique().tolist()) if not self.data.empty else []
+        return list(self._get_groups().states)
     
     def get_districts(self, state_name: Optional[str] = None) -> List[str]:
         """
@@ -310,16 +1129,12 @@ class PincodeData:
         Returns:
             Sorted list of unique district names
         """
-        if self.data is None:
-            raise DataLoadError("Data not loaded")
+        groups = self._get_groups()
         
         if state_name:
-            filtered_data = self.data[
-                self.data['statename'].str.upper() == state_name.upper()
-            ]
-            return sorted(filtered_data['districtname'].unique().tolist()) if not filtered_data.empty else []
+            return list(groups.state_districts.get(state_name.upper(), []))
         
-        return sorted(self.data['districtname'].unique().tolist()) if not self.data.empty else []
+        return list(groups.districts)
     
     def get_statistics(self) -> Dict[str, int]:
         """
@@ -328,22 +1143,206 @@ class PincodeData:
         Returns:
             Dictionary containing dataset statistics
         """
-        if self.data is None:
+        data = self.data
+        if data is None:
             raise DataLoadError("Data not loaded")
         
-        return {
-            'total_records': len(self.data),
-            'unique_pincodes': self.data['pincode'].nunique() if not self.data.empty else 0,
-            'unique_states': self.data['statename'].nunique() if not self.data.empty else 0,
-            'unique_districts': self.data['districtname'].nunique() if not self.data.empty else 0,
-            'unique_offices': self.data['officename'].nunique() if not self.data.empty else 0,
-        }
+        stats = {'total_records': len(data)}
+        # Columns left out with ``columns=`` have no count
+        for key, column in (('unique_pincodes', 'pincode'), ('unique_states', 'statename'),
+                            ('unique_districts', 'districtname'), ('unique_offices', 'officename')):
+            if data.empty:
+                stats[key] = 0
+            elif column in data.columns:
+                stats[key] = data[column].nunique()
+        # Measured at load time; data assigned directly is measured on first use
+        footprint = self._footprint
+        if footprint is None or footprint[0] is not data:
+            footprint = self._footprint = (data, *_memory_footprint(data))
+        stats['memory_bytes'] = footprint[1]
+        stats['uncompacted_memory_bytes'] = footprint[2]
+        return stats
+    
+    def reload(self, data_file: Optional[str] = None) -> ReloadResult:
+        """
+        Load the data file again and swap the new data in atomically.
+        
+        The new data and its indexes (including the lazily built ones the
+        current data already has) are built in the calling thread while
+        other threads keep answering from the current data; the switch is a
+        single locked assignment, after which the lookup cache starts empty.
+        Calls that started before the switch complete on the old data.
+        
+        Args:
+            data_file: Load this file instead of the current one from now on.
+            
+        Returns:
+            ``ReloadResult`` with the elapsed seconds, the new record count
+            and the number of rows added, rows removed and pincodes changed
+            
+        Raises:
+            DataLoadError: If the data file cannot be loaded; the current data
+                           stays in place
+        """
+        with self._reload_lock:
+            start = time.perf_counter()
+            path = data_file or self._data_file
+            signature = _file_signature(path)
+            fresh = PincodeData(path, use_snapshot=self._use_snapshot, cache_size=0, metrics=False,
+                                columns=self._columns)
+            new_data, new_index, new_footprint = fresh.data, fresh._index, fresh._footprint
+            assert new_data is not None and new_index is not None
+            
+            # Warm the same structures as the current index, so that the
+            # first lookups after the swap do not pay for building them
+            old_data, old_index = self.data, self._index
+            if old_index is not None:
+                for name in ('key_index', 'first_rows', 'row_slots', 'numbers', 'bitmap',
+                             'record_columns', 'groups', 'summary'):
+                    if name in vars(old_index):
+                        getattr(new_index, name)
+                for field_name in list(old_index._names):
+                    if field_name in new_data.columns:
+                        new_index.names(field_name)
+            if self._metrics is not None:
+                new_index.on_build = self._metrics.record_build
+            
+            with self._swap_lock:
+                self._index = new_index
+                self.data = new_data
+                self._footprint = new_footprint
+                self._cache = RecordCache(self._cache.maxsize, self._cache.policy)
+                self._data_file = path
+                self._signature = signature
+            
+            added, removed, changed = (
+                _count_changes(old_data, new_data) if old_data is not None else (len(new_data), 0, len(new_index))
+            )
+            self._record_load('reload', start)
+            return ReloadResult(time.perf_counter() - start, len(new_data), added, removed, changed)
+    
+    def watch(self, interval: float = 30.0,
+              on_reload: Optional[Callable[[ReloadResult], None]] = None,
+              on_error: Optional[Callable[[Exception], None]] = None) -> threading.Thread:
+        """
+        Reload automatically whenever the data file changes.
+        
+        A daemon thread checks the file's size and modification time every
+        ``interval`` seconds and reloads once they have been stable for one
+        interval, so a file that is still being written is not picked up
+        half-way. A failed reload keeps the current data and is retried
+        after the file changes again.
+        
+        Args:
+            interval: Seconds between checks.
+            on_reload: Called with the ``ReloadResult`` of every reload.
+            on_error: Called with the exception of every failed reload.
+            
+        Returns:
+            The watcher thread; ``stop_watching()`` ends it
+            
+        Raises:
+            ValueError: If the interval is not positive
+        """
+        if interval <= 0:
+            raise ValueError(f"Watch interval must be positive, got {interval}")
+        self.stop_watching()
+        stop = self._watch_stop = threading.Event()
+        
+        def run() -> None:
+            pending = self._signature
+            failed = None
+            while not stop.wait(interval):
+                current = _file_signature(self._data_file)
+                if current is None or current == self._signature or current == failed:
+                    pending = current
+                    continue
+                if current != pending:
+                    # Changed since the last check; wait until it settles
+                    pending = current
+                    continue
+                try:
+                    result = self.reload()
+                except DataLoadError as e:
+                    failed = current
+                    if on_error is not None:
+                        on_error(e)
+                    continue
+                if on_reload is not None:
+                    on_reload(result)
+        
+        thread = threading.Thread(target=run, name="pinin-watch", daemon=True)
+        thread.start()
+        return thread
+    
+    def stop_watching(self) -> None:
+        """Stop the thread started by ``watch()``, if any."""
+        if self._watch_stop is not None:
+            self._watch_stop.set()
+            self._watch_stop = None
+
+
+class _DefaultInstance:
+    """
+    Lazily created, process-wide default ``PincodeData`` instance.
+    
+    Creation uses double-checked locking: concurrent first callers wait for
+    a single load instead of each building their own copy, and once the
+    instance exists it is returned without taking the lock.
+    """
+    
+    def __init__(self) -> None:
+        self._instance: Optional[PincodeData] = None
+        self._lock = threading.Lock()
+    
+    def __call__(self) -> PincodeData:
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    instance = self._instance = PincodeData()
+        return instance
+    
+    @property
+    def loaded(self) -> bool:
+        """Whether the default instance has been created."""
+        return self._instance is not None
+    
+    def cache_clear(self) -> None:
+        """Forget the default instance, so the next call loads it again."""
+        with self._lock:
+            self._instance = None
+
 
+_get_default_instance = _DefaultInstance()
 
-@lru_cache(maxsize=1)
-def _get_default_instance() -> PincodeData:
-    """Get or create the default PincodeData instance."""
-    return PincodeData()
+
+def preload(background: bool = False) -> Optional[threading.Thread]:
+    """
+    Load the default dataset ahead of the first lookup.
+    
+    Calls made while a background preload is running wait for it instead
+    of starting a second load.
+    
+    Args:
+        background: Load in a daemon thread and return immediately
+        
+    Returns:
+        The loading thread when ``background`` is True (join it to wait),
+        otherwise None once the data is loaded
+        
+    Raises:
+        DataLoadError: If the data cannot be loaded (foreground only; a
+                       failed background load is retried by the next call)
+    """
+    if not background:
+        _get_default_instance()
+        return None
+    
+    thread = threading.Thread(target=_get_default_instance, name="pinin-preload", daemon=True)
+    thread.start()
+    return thread
 
 
 # Convenience functions
@@ -412,6 +1411,98 @@ def get_offices(pincode: Union[str, int]) -> List[str]:
     return _get_default_instance().get_offices(pincode)
 
 
+def exists(pincode: Union[str, int]) -> bool:
+    """
+    Convenience function to check whether a pincode exists.
+    
+    Args:
+        pincode: The pincode to check
+        
+    Returns:
+        True if the pincode is in the dataset; never raises for bad input
+    """
+    return _get_default_instance().exists(pincode)
+
+
+def exists_many(pincodes: PincodeArray) -> np.ndarray:
+    """
+    Convenience function to check many pincodes at once.
+    
+    Args:
+        pincodes: List, NumPy array or pandas Series of pincodes
+        
+    Returns:
+        Boolean array aligned with the input
+    """
+    return _get_default_instance().exists_many(pincodes)
+
+
+def get_pincode_info_many(pincodes: PincodeArray) -> List[Union[List[Dict[str, Any]], PininError]]:
+    """
+    Convenience function to get complete information for many pincodes.
+    
+    Args:
+        pincodes: List, NumPy array or pandas Series of pincodes
+        
+    Returns:
+        List aligned with the input of record lists or per-item errors
+    """
+    return _get_default_instance().get_pincode_info_many(pincodes)
+
+
+def normalize_pincodes(pincodes: PincodeArray) -> pd.DataFrame:
+    """
+    Convenience function to normalize and validate many pincodes.
+    
+    Args:
+        pincodes: List, NumPy array or pandas Series of pincodes
+        
+    Returns:
+        DataFrame aligned with the input with ``pincode`` and ``reason``
+        columns (see ``PincodeData.normalize_pincodes``)
+    """
+    return _get_default_instance().normalize_pincodes(pincodes)
+
+
+def get_states_many(pincodes: PincodeArray) -> pd.Series:
+    """
+    Convenience function to get state names for many pincodes.
+    
+    Args:
+        pincodes: List, NumPy array or pandas Series of pincodes
+        
+    Returns:
+        Series of state names aligned with the input, None for misses
+    """
+    return _get_default_instance().get_states_many(pincodes)
+
+
+def get_districts_many(pincodes: PincodeArray) -> pd.Series:
+    """
+    Convenience function to get district names for many pincodes.
+    
+    Args:
+        pincodes: List, NumPy array or pandas Series of pincodes
+        
+    Returns:
+        Series of district names aligned with the input, None for misses
+    """
+    return _get_default_instance().get_districts_many(pincodes)
+
+
+def get_taluks_many(pincodes: PincodeArray) -> pd.Series:
+    """
+    Convenience function to get taluk names for many pincodes.
+    
+    Args:
+        pincodes: List, NumPy array or pandas Series of pincodes
+        
+    Returns:
+        Series of taluk names aligned with the input, None for misses
+    """
+    return _get_default_instance().get_taluks_many(pincodes)
+
+
 def search_by_state(state_name: str) -> List[str]:
     """
     Convenience function to search pincodes by state.
@@ -439,6 +1530,47 @@ def search_by_district(district_name: str, state_name: Optional[str] = None) ->
     return _get_default_instance().search_by_district(district_name, state_name)
 
 
+def search_by_prefix(prefix: Union[str, int]) -> List[str]:
+    """
+    Convenience function to search pincodes by prefix.
+    
+    Args:
+        prefix: Leading 1 to 6 digits of the pincodes
+        
+    Returns:
+        Sorted list of pincodes with the prefix
+    """
+    return _get_default_instance().search_by_prefix(prefix)
+
+
+def search_by_range(start: Union[str, int], end: Union[str, int]) -> List[str]:
+    """
+    Convenience function to search pincodes in a range.
+    
+    Args:
+        start: First pincode of the range
+        end: Last pincode of the range
+        
+    Returns:
+        Sorted list of pincodes in the range
+    """
+    return _get_default_instance().search_by_range(start, end)
+
+
+def suggest(pincode: Union[str, int], k: int = 5) -> List[Dict[str, Any]]:
+    """
+    Convenience function to suggest existing pincodes for a mistyped one.
+    
+    Args:
+        pincode: The pincode as typed
+        k: Maximum number of suggestions
+        
+    Returns:
+        List of suggestion dictionaries, best first (see ``PincodeData.suggest``)
+    """
+    return _get_default_instance().suggest(pincode, k)
+
+
 def get_states() -> List[str]:
     """
     Convenience function to get all states.
@@ -460,3 +1592,16 @@ def get_districts(state_name: Optional[str] = None) -> List[str]:
         List of district names
     """
     return _get_default_instance().get_districts(state_name)
+
+
+def get_metrics() -> Dict[str, Any]:
+    """
+    Convenience function to get the metrics of the default instance.
+    
+    Call counts and timings are collected only when ``PININ_METRICS=1`` is
+    set before the default instance is created.
+    
+    Returns:
+        Metrics snapshot, see ``PincodeData.get_metrics``
+    """
+    return _get_default_instance().get_metrics()
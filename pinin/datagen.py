@@ -0,0 +1,323 @@
+"""
+Synthetic pincode datasets for scale and performance testing.
+
+Generates CSV files with the columns of the bundled dataset
+(``pincode``, ``officename``, ``statename``, ``districtname``, ``taluk``,
+``officetype``, ``Deliverystatus``, plus ``divisionname``, ``regionname`` and
+``circlename``) and a realistic shape:
+
+- pincodes follow the real postal zone layout (the first two digits belong to
+  a state, the first three to a sorting district) and are dense at low
+  suffixes, like ``560001``, ``560002``, ...
+- states get rows in proportion to their real share of post offices
+- the number of offices per pincode is heavily skewed (most pincodes have a
+  handful, some have dozens), averaging about 8
+- office names reuse a pool of locality names with a Zipf-like distribution,
+  so common names (``Rampur``) occur in many states
+- each pincode has one head or sub office and mostly branch offices
+
+Everything is generated with vectorized NumPy operations from a seed, so a
+given ``(rows, seed)`` always produces the same file. Rows are written in
+chunks, keeping memory bounded for files of millions of rows.
+
+Usage::
+
+    python -m pinin.datagen synthetic.csv --rows 1000000 --seed 0
+
+    from pinin.datagen import generate, write_csv
+    frame = generate(10_000)
+    write_csv("synthetic.csv", rows=5_000_000)
+"""
+
+import argparse
+import sys
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = (
+    'pincode', 'officename', 'statename', 'districtname', 'taluk', 'officetype',
+    'Deliverystatus', 'divisionname', 'regionname', 'circlename',
+)
+
+# State, leading two pincode digits, relative number of post offices
+STATES = (
+    ('DELHI', (11,), 0.5),
+    ('HARYANA', (12, 13), 2.7),
+    ('PUNJAB', (14, 15, 16), 3.8),
+    ('HIMACHAL PRADESH', (17,), 2.8),
+    ('JAMMU AND KASHMIR', (18, 19), 1.7),
+    ('UTTAR PRADESH', (20, 21, 22, 23, 27, 28), 17.7),
+    ('UTTARAKHAND', (24, 26), 2.7),
+    ('RAJASTHAN', (30, 31, 32, 33, 34), 10.3),
+    ('GUJARAT', (36, 37, 38, 39), 8.9),
+    ('MAHARASHTRA', (40, 41, 42, 43, 44), 12.6),
+    ('MADHYA PRADESH', (45, 46, 47, 48), 8.3),
+    ('CHHATTISGARH', (49,), 3.1),
+    ('TELANGANA', (50,), 5.8),
+    ('ANDHRA PRADESH', (51, 52, 53), 10.2),
+    ('KARNATAKA', (56, 57, 58, 59), 9.6),
+    ('TAMIL NADU', (60, 61, 62, 63, 64), 11.8),
+    ('KERALA', (67, 68, 69), 5.0),
+    ('WEST BENGAL', (70, 71, 72, 73, 74), 8.8),
+    ('ODISHA', (75, 76, 77), 8.1),
+    ('ASSAM', (78,), 4.0),
+    ('MEGHALAYA', (79,), 0.5),
+    ('BIHAR', (80, 84, 85), 9.0),
+    ('JHARKHAND', (81, 82, 83), 3.0),
+)
+
+_NAME_STARTS = (
+    "Ram", "Shiv", "Krishna", "Hari", "Ganga", "Chandra", "Sur", "Ganesh", "Lakshmi",
+    "Durga", "Madhu", "Raj", "Anand", "Bhavani", "Kali", "Nand", "Vishnu", "Indra",
+    "Som", "Dev", "Jay", "Mani", "Nara", "Kamal", "Sita", "Gopal", "Bala", "Kottai",
+    "Thiru", "Sri", "Vel", "Mal", "Pal", "Bel", "Kun", "Nil", "Sundar", "Hosa",
+    "Chik", "Dodda", "Amba", "Kanchi", "Bhim", "Arjun", "Mohan", "Kesh", "Sona",
+    "Hira", "Moti", "Chand", "Basant", "Phul", "Gulab", "Kamla", "Radha", "Uday",
+)
+_NAME_MIDDLES = ("", "", "", "a", "i", "ma", "ra", "na", "la", "va")
+_NAME_ENDS = (
+    "pur", "puram", "nagar", "abad", "ganj", "kot", "gaon", "halli", "palayam",
+    "palli", "wadi", "garh", "pet", "kuppam", "kere", "patti", "ur", "khera",
+    "tola", "sar", "wara", "pada", "nagaram", "guda", "vadi", "bagh", "kund",
+)
+
+# Optional second word of an office name ("Rampur Bazar B.O")
+_NAME_QUALIFIERS = (
+    "", " Bazar", " Road", " Colony", " Chowk", " East", " West", " North", " South",
+    " Market", " Town", " Camp", " Gate", " Station", " Extension", " Layout",
+)
+
+OFFICE_TYPES = ('B.O', 'S.O', 'H.O')
+DELIVERY_STATUSES = ('Delivery', 'Non-Delivery')
+
+
+def _name_pool(rng: np.random.Generator) -> np.ndarray:
+    """All locality names, in a random order that defines their popularity."""
+    starts, middles, ends = np.meshgrid(
+        np.array(_NAME_STARTS, dtype=object),
+        np.array(sorted(set(_NAME_MIDDLES)), dtype=object),
+        np.array(_NAME_ENDS, dtype=object),
+        indexing='ij',
+    )
+    names = (starts + middles + ends).ravel()
+    return names[rng.permutation(len(names))]
+
+
+def _zipf_weights(size: int, exponent: float = 0.5) -> np.ndarray:
+    """Probabilities proportional to ``1 / rank ** exponent``."""
+    weights = 1.0 / np.arange(1, size + 1) ** exponent
+    return weights / weights.sum()
+
+
+class _Plan:
+    """
+    Per-row integer codes for a synthetic dataset plus the string tables they
+    index into, so chunks of rows can be rendered independently.
+    """
+
+    def __init__(self, rows: int, seed: int, offices_per_pincode: float):
+        rng = np.random.default_rng(seed)
+        pool = _name_pool(rng)
+        popularity = _zipf_weights(len(pool))
+
+        # Pincodes, grouped by state and 3-digit sorting district
+        capacity = sum(len(prefixes) for _, prefixes, _ in STATES) * 10 * 999
+        pincode_count = int(min(max(rows // max(offices_per_pincode, 1.0), 1), capacity, rows))
+        shares = np.array([weight for _, _, weight in STATES])
+        per_state = rng.multinomial(pincode_count, shares / shares.sum())
+
+        numbers: List[np.ndarray] = []
+        prefix_of: List[np.ndarray] = []
+        prefixes: List[int] = []
+        prefix_state: List[int] = []
+        suffix_weights = _zipf_weights(999, 0.8)
+        for state_id, ((_, leading, _), count) in enumerate(zip(STATES, per_state)):
+            state_prefixes = [lead * 10 + digit for lead in leading for digit in range(10)]
+            count = min(int(count), len(state_prefixes) * 999)
+            spread = rng.gamma(2.0, size=len(state_prefixes))
+            per_prefix = np.minimum(rng.multinomial(count, spread / spread.sum()), 999)
+            for prefix, k in zip(state_prefixes, per_prefix.tolist()):
+                prefix_id = len(prefixes)
+                prefixes.append(prefix)
+                prefix_state.append(state_id)
+                if not k:
+                    continue
+                suffixes = np.sort(rng.choice(np.arange(1, 1000), size=k, replace=False, p=suffix_weights))
+                numbers.append(prefix * 1000 + suffixes)
+                prefix_of.append(np.full(k, prefix_id))
+
+        pincodes = np.concatenate(numbers)
+        pincode_prefix = np.concatenate(prefix_of)
+        n_pincodes = len(pincodes)
+        prefix_states = np.array(prefix_state)
+
+        # Each sorting district is a district with a handful of taluks; taluks
+        # cover contiguous runs of the district's pincodes
+        n_prefixes = len(prefixes)
+        district_names = pool[rng.choice(len(pool), size=n_prefixes, replace=False)]
+        taluks_per_district = rng.integers(2, 10, size=n_prefixes)
+        starts = np.searchsorted(pincode_prefix, np.arange(n_prefixes))
+        sizes = np.bincount(pincode_prefix, minlength=n_prefixes)
+        rank = np.arange(n_pincodes) - starts[pincode_prefix]
+        taluk_rank = rank * taluks_per_district[pincode_prefix] // np.maximum(sizes[pincode_prefix], 1)
+        taluk_offsets = np.zeros(n_prefixes + 1, dtype=np.int64)
+        np.cumsum(taluks_per_district, out=taluk_offsets[1:])
+        pincode_taluk = taluk_offsets[pincode_prefix] + taluk_rank
+        taluk_names = pool[rng.choice(len(pool), size=int(taluk_offsets[-1]), p=popularity)]
+
+        # Regions group neighbouring sorting districts of a state
+        region_of_prefix = np.zeros(n_prefixes, dtype=np.int64)
+        region_names: List[str] = []
+        for state_id in range(len(STATES)):
+            members = np.flatnonzero(prefix_states == state_id)
+            regions = max(1, len(members) // 8)
+            first = len(region_names)
+            region_of_prefix[members] = first + np.arange(len(members)) * regions // len(members)
+            for region in range(regions):
+                lead = members[np.searchsorted(region_of_prefix[members], first + region)]
+                region_names.append(f"{district_names[lead]} Region")
+
+        # Offices per pincode: at least one, heavily skewed
+        extra = rows - n_pincodes
+        spread = rng.gamma(0.8, size=n_pincodes)
+        counts = 1 + rng.multinomial(extra, spread / spread.sum())
+        row_pincode = np.repeat(np.arange(n_pincodes), counts)
+        position = np.arange(rows) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        # The first office of a pincode is a sub office (a head office for the
+        # first pincode of a district); the rest are mostly branch offices
+        head_pincodes = np.zeros(n_pincodes, dtype=bool)
+        head_pincodes[starts[sizes > 0]] = True
+        office_type = np.where(rng.random(rows) < 0.9, 0, 1)
+        office_type[position == 0] = 1
+        office_type[(position == 0) & head_pincodes[row_pincode]] = 2
+        non_delivery = rng.random(rows) < np.array([0.05, 0.35, 0.15])[office_type]
+
+        locality = rng.choice(len(pool), size=rows, p=popularity)
+        qualifiers = len(_NAME_QUALIFIERS) - 1
+        qualifier = rng.choice(len(_NAME_QUALIFIERS), size=rows, p=[0.5] + [0.5 / qualifiers] * qualifiers)
+        row_prefix = pincode_prefix[row_pincode]
+
+        # Per-row codes in compact types: ten columns of 10M rows stay small
+        is_head = office_type == 2
+        self.rows = rows
+        self.pincodes = pincodes[row_pincode].astype(np.int32)
+        self.state = prefix_states[row_prefix].astype(np.int8)
+        self.district = row_prefix.astype(np.int16)
+        self.taluk = pincode_taluk[row_pincode].astype(np.int32)
+        self.region = region_of_prefix[row_prefix].astype(np.int16)
+        self.office_type = office_type.astype(np.int8)
+        self.delivery = non_delivery.astype(np.int8)
+        # Head offices are named after their district
+        self.locality = np.where(is_head, -1 - row_prefix, locality).astype(np.int32)
+        self.qualifier = np.where(is_head, 0, qualifier).astype(np.int8)
+        self.tables: Dict[str, np.ndarray] = {
+            'pool': pool,
+            'statename': np.array([name for name, _, _ in STATES], dtype=object),
+            'districtname': district_names,
+            'taluk': taluk_names,
+            'regionname': np.array(region_names, dtype=object),
+            'circlename': np.array([f"{name.title()} Circle" for name, _, _ in STATES], dtype=object),
+        }
+
+    def frame(self, start: int, stop: int) -> pd.DataFrame:
+        """Render rows ``start:stop`` as a DataFrame."""
+        rows = slice(start, stop)
+        tables = self.tables
+        office_type = self.office_type[rows]
+        locality = self.locality[rows]
+        district = self.district[rows]
+
+        names = np.where(locality >= 0, tables['pool'].take(np.maximum(locality, 0)),
+                         tables['districtname'].take(-1 - np.minimum(locality, -1)))
+        types = np.array(OFFICE_TYPES, dtype=object).take(office_type)
+        districts = tables['districtname'].take(district)
+        return pd.DataFrame({
+            'pincode': self.pincodes[rows].astype(np.int64),
+            'officename': names + np.array(_NAME_QUALIFIERS, dtype=object).take(self.qualifier[rows]) + " " + types,
+            'statename': tables['statename'].take(self.state[rows]),
+            'districtname': districts,
+            'taluk': tables['taluk'].take(self.taluk[rows]),
+            'officetype': types,
+            'Deliverystatus': np.array(DELIVERY_STATUSES, dtype=object).take(self.delivery[rows]),
+            'divisionname': districts + " Division",
+            'regionname': tables['regionname'].take(self.region[rows]),
+            'circlename': tables['circlename'].take(self.state[rows]),
+        }, columns=list(COLUMNS))
+
+
+def _check_rows(rows: int) -> None:
+    if rows < 1:
+        raise ValueError(f"Row count must be positive, got {rows}")
+
+
+def generate(rows: int = 10_000, seed: int = 0, offices_per_pincode: float = 8.0) -> pd.DataFrame:
+    """
+    Generate a synthetic dataset in memory.
+
+    Args:
+        rows: Number of rows (post offices)
+        seed: Random seed; the same seed and row count give the same data
+        offices_per_pincode: Average number of rows per pincode
+
+    Returns:
+        DataFrame with the dataset columns, pincodes as integers
+
+    Raises:
+        ValueError: If ``rows`` is not positive
+    """
+    _check_rows(rows)
+    return _Plan(rows, seed, offices_per_pincode).frame(0, rows)
+
+
+def write_csv(path: str, rows: int = 10_000, seed: int = 0, offices_per_pincode: float = 8.0,
+              chunk_size: int = 500_000) -> str:
+    """
+    Generate a synthetic dataset and write it to a CSV file in chunks.
+
+    Args:
+        path: Output file path
+        rows: Number of rows (post offices)
+        seed: Random seed; the same seed and row count give the same file
+        offices_per_pincode: Average number of rows per pincode
+        chunk_size: Rows rendered and written at a time
+
+    Returns:
+        The output path
+
+    Raises:
+        ValueError: If ``rows`` is not positive
+    """
+    _check_rows(rows)
+    plan = _Plan(rows, seed, offices_per_pincode)
+    with open(path, 'w', newline='', encoding='utf-8') as handle:
+        for start in range(0, rows, chunk_size):
+            plan.frame(start, min(start + chunk_size, rows)).to_csv(handle, index=False, header=(start == 0))
+    return path
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command line entry point: ``python -m pinin.datagen OUTPUT [--rows N]``."""
+    parser = argparse.ArgumentParser(
+        prog="python -m pinin.datagen",
+        description="Write a synthetic pincode CSV file for scale and performance testing.",
+    )
+    parser.add_argument("output", help="Output CSV path")
+    parser.add_argument("--rows", type=int, default=155_000, help="Number of rows (default: 155000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--offices-per-pincode", type=float, default=8.0,
+                        help="Average rows per pincode (default: 8)")
+    parser.add_argument("--chunk-size", type=int, default=500_000, help="Rows written at a time")
+    args = parser.parse_args(argv)
+
+    try:
+        write_csv(args.output, args.rows, args.seed, args.offices_per_pincode, args.chunk_size)
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -52,3 +52,20 @@ class DataLoadError(PininError):
             full_message += f"\nOriginal Exception: {type(original_exception).__name__}: {original_exception}"
         
         super().__init__(full_message)
+
+
+class ColumnNotAvailableError(PininError):
+    """Raised when an operation needs a column that was not loaded."""
+    
+    def __init__(self, column: str, message: Optional[str] = None):
+        self.column = column
+        
+        if message:
+            full_message = message
+        else:
+            full_message = (
+                f"Column '{column}' is not loaded; create PincodeData with a "
+                f"columns= selection that includes it"
+            )
+        
+        super().__init__(full_message)
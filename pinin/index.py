@@ -0,0 +1,671 @@
+"""
+Lookup indexes built over the loaded pincode data.
+"""
+
+import functools
+import time
+from functools import cached_property
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from .record import RecordColumns
+
+
+T = TypeVar("T")
+
+# Number of distinct 6-digit codes, the size of the existence bitmap in bits
+PINCODE_SPACE = 1_000_000
+
+
+def _timed_build(func: Callable[["PincodeIndex"], T]) -> Callable[["PincodeIndex"], T]:
+    """Report the build time of a lazy index structure to ``on_build``, if set."""
+    @functools.wraps(func)
+    def build(self: "PincodeIndex") -> T:
+        on_build = self.on_build
+        if on_build is None:
+            return func(self)
+        start = time.perf_counter()
+        value = func(self)
+        on_build(func.__name__, time.perf_counter() - start)
+        return value
+
+    return build
+
+
+def _upper_codes(column: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Factorize a text column case-insensitively.
+
+    Returns:
+        Tuple of (code per row, -1 for missing; upper-cased name per code)
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        # Fold each distinct category once, then remap the row codes
+        folded = [str(value).upper() for value in column.cat.categories]
+        category_codes, names = pd.factorize(pd.Series(folded, dtype=object))
+        row_codes = column.cat.codes.to_numpy()
+        codes = np.where(row_codes >= 0, category_codes.take(row_codes), -1)
+    else:
+        codes, names = pd.factorize(column.str.upper())
+    return codes, np.asarray(names, dtype=object)
+
+
+class GroupIndex:
+    """
+    Case-folded state and district groupings.
+
+    Keys are upper-cased names; values are sorted lists. Callers must copy a
+    list before handing it out, since the same list serves every request.
+    """
+
+    def __init__(self, index: "PincodeIndex"):
+        """
+        Build the groupings from a pincode index.
+
+        Args:
+            index: Index over data with ``statename`` and ``districtname``
+                   columns
+        """
+        data = index.data
+        self.states: List[str] = []
+        self.districts: List[str] = []
+        self.state_pincodes: Dict[str, List[str]] = {}
+        self.district_pincodes: Dict[str, List[str]] = {}
+        self.state_district_pincodes: Dict[Tuple[str, str], List[str]] = {}
+        self.state_districts: Dict[str, List[str]] = {}
+        if data.empty:
+            return
+
+        self.states = sorted(data['statename'].dropna().unique().tolist())
+        self.districts = sorted(data['districtname'].dropna().unique().tolist())
+
+        # Work on integer codes: pincode slot, folded state/district, district name
+        slots = index.row_slots
+        states, state_names = _upper_codes(data['statename'])
+        districts, district_names = _upper_codes(data['districtname'])
+        names, name_values = pd.factorize(data['districtname'])
+        name_values = np.asarray(name_values, dtype=object)
+
+        def pairs(outer: np.ndarray, inner: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+            keep = (outer >= 0) & (inner >= 0)
+            combined = np.sort(outer[keep].astype(np.int64) * size + inner[keep])
+            if len(combined):
+                combined = combined[np.concatenate(([True], combined[1:] != combined[:-1]))]
+            return combined // size, combined % size
+
+        def split(outer: np.ndarray, values: List) -> Dict[int, List]:
+            if not len(outer):
+                return {}
+            bounds = np.flatnonzero(np.diff(outer)) + 1
+            starts = [0] + bounds.tolist()
+            ends = bounds.tolist() + [len(outer)]
+            return {int(outer[a]): values[a:b] for a, b in zip(starts, ends)}
+
+        # Slots are in pincode order, so each group's pincodes come out sorted
+        n_slots = max(len(index.keys), 1)
+        outer, inner = pairs(states, slots, n_slots)
+        for code, group in split(outer, index.keys[inner].tolist()).items():
+            self.state_pincodes[state_names[code]] = group
+
+        outer, inner = pairs(districts, slots, n_slots)
+        for code, group in split(outer, index.keys[inner].tolist()).items():
+            self.district_pincodes[district_names[code]] = group
+
+        n_districts = max(len(district_names), 1)
+        state_district = np.where((states >= 0) & (districts >= 0), states * n_districts + districts, -1)
+        outer, inner = pairs(state_district, slots, n_slots)
+        for code, group in split(outer, index.keys[inner].tolist()).items():
+            key = (state_names[code // n_districts], district_names[code % n_districts])
+            self.state_district_pincodes[key] = group
+
+        outer, inner = pairs(states, names, max(len(name_values), 1))
+        for code, group in split(outer, name_values[inner].tolist()).items():
+            self.state_districts[state_names[code]] = sorted(group)
+
+
+def edit_distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    Levenshtein distance between two strings.
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Stop early once the distance is known to exceed this;
+                      the result is then ``max_distance + 1``
+
+    Returns:
+        Number of single-character insertions, deletions and substitutions
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    limit = len(a) if max_distance is None else max_distance
+    if len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class TrigramIndex:
+    """
+    Inverted index from character trigrams to the strings containing them.
+
+    Each string is indexed with a leading and trailing space, so trigrams at
+    word boundaries are included for similarity scoring. Characters are
+    mapped to a dense alphabet and each trigram to one integer; postings are
+    stored as one sorted array of string ids per trigram.
+    """
+
+    def __init__(self, values: Sequence[str]):
+        """
+        Build the index.
+
+        Args:
+            values: Strings to index; their positions are the ids returned
+                    by queries
+        """
+        padded = [f" {value.replace(chr(0), '')} " for value in values]
+        lengths = np.fromiter((len(value) for value in padded), dtype=np.int64, count=len(padded))
+        self.size = len(padded)
+
+        # One pass over all strings joined by NUL; trigrams may not cross a join
+        points = np.frombuffer('\0'.join(padded).encode('utf-32-le'), dtype=np.uint32)
+        present = np.bincount(points) > 0 if len(points) else np.zeros(1, dtype=bool)
+        self.alphabet = np.flatnonzero(present)
+        dense = (np.cumsum(present) - 1)[points] if len(points) else points.astype(np.int64)
+        width = max(len(self.alphabet), 1)
+
+        owner = np.repeat(np.arange(self.size), lengths + 1)
+        letters = points != 0
+        starts = np.flatnonzero(letters[:-2] & letters[1:-1] & letters[2:])
+        keys = (dense[starts] * width + dense[starts + 1]) * width + dense[starts + 2]
+        ids = owner[starts]
+
+        # Pack (trigram, id) into one integer so a plain sort groups the
+        # postings with ids ascending; repeats within a string collapse
+        pairs = np.sort(keys * max(self.size, 1) + ids)
+        if len(pairs):
+            pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))]
+        keys, ids = np.divmod(pairs, max(self.size, 1))
+        bounds = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1]))) if len(keys) else keys
+
+        self.width = width
+        self.keys = keys[bounds]
+        self.offsets = np.append(bounds, len(ids)).astype(np.int64)
+        self.ids = ids
+
+    def query_keys(self, query: str, strict: bool = True) -> Optional[np.ndarray]:
+        """
+        Encode the distinct trigrams of a query.
+
+        Args:
+            query: Folded query text
+            strict: Return None if the query uses a character that no indexed
+                    string contains; otherwise skip the trigrams holding it
+
+        Returns:
+            Sorted trigram keys, or None (strict mode only)
+        """
+        points = np.frombuffer(query.encode('utf-32-le'), dtype=np.uint32)
+        dense = np.minimum(np.searchsorted(self.alphabet, points), max(len(self.alphabet) - 1, 0))
+        known = self.alphabet[dense] == points if len(self.alphabet) else np.zeros(len(points), dtype=bool)
+        if strict and not known.all():
+            return None
+        dense = dense.astype(np.int64)
+        width = self.width
+        keys = (dense[:-2] * width + dense[1:-1]) * width + dense[2:]
+        return np.unique(keys[known[:-2] & known[1:-1] & known[2:]])
+
+    @cached_property
+    def trigram_counts(self) -> np.ndarray:
+        """Number of distinct trigrams in each indexed string."""
+        return np.bincount(self.ids, minlength=self.size)
+
+    def similarity(self, query: str) -> np.ndarray:
+        """
+        Score every indexed string by trigram overlap with ``query``.
+
+        Args:
+            query: Folded query text (padded like the indexed strings)
+
+        Returns:
+            Jaccard similarity of trigram sets, by string id
+        """
+        keys = self.query_keys(query, strict=False)
+        if keys is None or not len(keys):
+            return np.zeros(self.size)
+        shared = np.bincount(np.concatenate([self.postings(int(key)) for key in keys]),
+                             minlength=self.size)
+        union = self.trigram_counts + len(keys) - shared
+        return shared / np.maximum(union, 1)
+
+    def postings(self, key: int) -> np.ndarray:
+        """Get the sorted ids of the strings containing a trigram key."""
+        slot = int(np.searchsorted(self.keys, key))
+        if slot == len(self.keys) or self.keys[slot] != key:
+            return self.ids[:0]
+        return self.ids[self.offsets[slot]:self.offsets[slot + 1]]
+
+    def candidates(self, query: str) -> Optional[np.ndarray]:
+        """
+        Get the ids of strings containing every trigram of ``query``.
+
+        Args:
+            query: Folded query text
+
+        Returns:
+            Sorted candidate ids (a superset of the true matches), or None if
+            the query is too short to have trigrams
+        """
+        if len(query) < 3:
+            return None
+        keys = self.query_keys(query)
+        if keys is None:
+            return self.ids[:0]
+        lists = sorted((self.postings(int(key)) for key in keys), key=len)
+        result = lists[0]
+        for postings in lists[1:]:
+            if not len(result):
+                break
+            # Probe the longer sorted list for each surviving candidate
+            found = np.searchsorted(postings, result)
+            found[found == len(postings)] = 0
+            result = result[postings[found] == result]
+        return result
+
+
+class NameIndex:
+    """
+    Case-folded distinct values of a text column and the rows holding them.
+    """
+
+    def __init__(self, column: pd.Series):
+        """
+        Build the index for a column.
+
+        Args:
+            column: Text column of the pincode data
+        """
+        codes, names = _upper_codes(column)
+        self.names = names
+        self.order = np.argsort(codes, kind='stable')
+        counts = np.bincount(codes[codes >= 0], minlength=len(names))
+        self.offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.offsets[1:])
+        self.offsets += int(np.count_nonzero(codes < 0))
+
+        # Original spelling of each folded name, taken from its first row
+        first = self.order[self.offsets[:-1]] if len(names) else self.order[:0]
+        self.display = column.take(first).to_numpy(dtype=object)
+
+    @cached_property
+    def trigrams(self) -> TrigramIndex:
+        """Trigram index over the folded names, built on first use."""
+        return TrigramIndex(self.names.tolist())
+
+    @cached_property
+    def first_rows(self) -> np.ndarray:
+        """Row position of the first row holding each name."""
+        if not len(self.names):
+            return self.order[:0]
+        return self.order[self.offsets[:-1]]
+
+    @cached_property
+    def file_order(self) -> np.ndarray:
+        """Name ids ordered by the position of their first row."""
+        return np.argsort(self.first_rows, kind='stable')
+
+    def _containing(self, ids: np.ndarray, query: str) -> np.ndarray:
+        """Get the ids whose names contain ``query``, checked in one vectorized pass."""
+        if not len(ids):
+            return ids
+        return ids[np.char.find(self.names[ids].astype(str), query) >= 0]
+
+    def find(self, query: str, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Find the names containing ``query`` as a literal substring.
+
+        With a limit, candidates are checked in chunks in the file order of
+        their first rows, stopping once ``limit`` names match: the first
+        ``limit`` matching rows in file order can only belong to those names.
+
+        Args:
+            query: Folded query text
+            limit: Only find the ``limit`` names whose first rows come first
+
+        Returns:
+            Sorted ids of the matching names
+        """
+        candidates = self.trigrams.candidates(query)
+        if limit is None:
+            if candidates is None:
+                candidates = np.arange(len(self.names))
+            return self._containing(candidates, query)
+
+        if candidates is None:
+            candidates = self.file_order
+        else:
+            candidates = candidates[np.argsort(self.first_rows[candidates], kind='stable')]
+        found = []
+        count = start = 0
+        chunk = max(4 * limit, 256)
+        while count < limit and start < len(candidates):
+            matches = self._containing(candidates[start:start + chunk], query)
+            found.append(matches)
+            count += len(matches)
+            start += chunk
+            chunk *= 2
+        if not found:
+            return candidates[:0]
+        return np.sort(np.concatenate(found)[:max(limit, 0)])
+
+    def nearest(self, query: str, k: int, max_distance: Optional[int] = None,
+                pool: int = 64) -> List[Tuple[int, int, float]]:
+        """
+        Rank names by edit distance to ``query``.
+
+        Trigram similarity picks a small pool of candidates, so edit distance
+        is only computed for a few dozen names rather than all of them.
+
+        Args:
+            query: Folded query text
+            k: Maximum number of matches
+            max_distance: Drop names further than this many edits away
+            pool: Minimum number of candidates to score by edit distance
+
+        Returns:
+            List of (name id, distance, similarity), best first
+        """
+        if k <= 0 or not len(self.names):
+            return []
+        scores = self.trigrams.similarity(f" {query} ")
+        size = min(len(self.names), max(k * 8, pool))
+        if size < len(self.names):
+            ids = np.argpartition(-scores, size - 1)[:size]
+        else:
+            ids = np.arange(len(self.names))
+
+        ranked = []
+        for i in ids.tolist():
+            distance = edit_distance(query, self.names[i], max_distance)
+            if max_distance is None or distance <= max_distance:
+                ranked.append((distance, -float(scores[i]), self.names[i], i))
+        ranked.sort()
+        return [(i, distance, -score) for distance, score, _, i in ranked[:k]]
+
+    def rows(self, ids: np.ndarray, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Get the row positions of the given names, in file order.
+
+        Args:
+            ids: Name ids
+            limit: Only get the first ``limit`` rows; each name's rows are
+                   in file order, so no more than ``limit`` are read per name
+        """
+        if limit is not None:
+            limit = max(limit, 0)
+            if len(ids) > limit:
+                ids = ids[np.argpartition(self.first_rows[ids], limit - 1)[:limit]] if limit else ids[:0]
+        if not len(ids):
+            return self.order[:0]
+        starts = self.offsets[ids]
+        lengths = self.offsets[ids + 1] - starts
+        if limit is not None:
+            lengths = np.minimum(lengths, limit)
+        # Positions of every selected slice of ``order``, gathered in one step
+        ends = np.cumsum(lengths)
+        positions = np.arange(ends[-1]) + np.repeat(starts - (ends - lengths), lengths)
+        rows = np.sort(self.order[positions])
+        return rows if limit is None else rows[:limit]
+
+
+class PincodeIndex:
+    """
+    Hash index mapping each pincode to the positions of its rows.
+
+    The index is built once from a DataFrame and never modified afterwards.
+    Row positions are stored grouped by pincode (``order``) with one slice per
+    pincode (``offsets``), so a lookup is a dictionary probe plus an array
+    slice instead of a boolean scan over the whole dataset.
+
+    Structures needed only by some queries are built on first use; set
+    ``on_build`` to a ``(name, seconds)`` callback to be told how long each
+    took.
+    """
+
+    on_build: Optional[Callable[[str, float], None]] = None
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Build the index for a DataFrame.
+
+        Args:
+            data: Pincode data with a string ``pincode`` column
+        """
+        if data.empty or 'pincode' not in data.columns:
+            labels = np.empty(0, dtype=np.intp)
+            keys = np.empty(0, dtype=object)
+        else:
+            labels, uniques = pd.factorize(data['pincode'], sort=True)
+            keys = np.asarray(uniques, dtype=object)
+
+        # Rows grouped by pincode, keeping file order within each group
+        order = np.argsort(labels, kind='stable')
+        counts = np.bincount(labels[labels >= 0], minlength=len(keys))
+        offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        # Rows without a pincode sort first; skip past them
+        offsets += int(np.count_nonzero(labels < 0))
+
+        self._assign(data, keys, order, offsets)
+
+    @classmethod
+    def from_arrays(cls, data: pd.DataFrame, keys: np.ndarray,
+                    order: np.ndarray, offsets: np.ndarray) -> "PincodeIndex":
+        """
+        Create an index from previously built arrays, e.g. from a snapshot.
+
+        Args:
+            data: Pincode data the arrays were built from
+            keys: Sorted distinct pincodes
+            order: Row positions grouped by pincode
+            offsets: Start of each pincode's group in ``order``
+
+        Returns:
+            The index
+        """
+        index = cls.__new__(cls)
+        index._assign(data, keys, order, offsets)
+        return index
+
+    def _assign(self, data: pd.DataFrame, keys: np.ndarray,
+                order: np.ndarray, offsets: np.ndarray) -> None:
+        self.data = data
+        self.keys = keys
+        self.order = order
+        self.offsets = offsets
+        self.slots: Dict[str, int] = {key: slot for slot, key in enumerate(keys)}
+        self._names: Dict[str, NameIndex] = {}
+
+    def __len__(self) -> int:
+        """Number of distinct pincodes in the index."""
+        return len(self.keys)
+
+    def __contains__(self, pincode: object) -> bool:
+        return pincode in self.slots
+
+    def positions(self, pincode: str) -> np.ndarray:
+        """
+        Get the row positions for a pincode.
+
+        Args:
+            pincode: Normalized 6-digit pincode string
+
+        Returns:
+            Array of row positions (empty if the pincode is not indexed)
+        """
+        slot = self.slots.get(pincode)
+        if slot is None:
+            return self.order[:0]
+        return self.order[self.offsets[slot]:self.offsets[slot + 1]]
+
+    @cached_property
+    @_timed_build
+    def key_index(self) -> pd.Index:
+        """Pandas hash index over the distinct pincodes, for vectorized probes."""
+        return pd.Index(self.keys)
+
+    @cached_property
+    @_timed_build
+    def first_rows(self) -> np.ndarray:
+        """Position of the first row of each pincode, by slot."""
+        return self.order[self.offsets[:-1]] if len(self.keys) else self.order[:0]
+
+    @cached_property
+    @_timed_build
+    def row_slots(self) -> np.ndarray:
+        """Slot of every row's pincode, -1 for rows without one."""
+        slots = np.full(len(self.data), -1, dtype=np.int64)
+        counts = np.diff(self.offsets)
+        slots[self.order[self.offsets[0]:]] = np.repeat(np.arange(len(self.keys)), counts)
+        return slots
+
+    @cached_property
+    @_timed_build
+    def numbers(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Numeric value and slot of every well-formed 6-digit pincode.
+
+        Equal-length digit strings sort the same way as their numbers, so
+        filtering the sorted keys keeps the result in ascending order.
+        """
+        keys = pd.Series(self.keys, dtype=object)
+        # str.match with an explicit end anchor: str.fullmatch needs pandas 1.1
+        valid = keys.str.match(r'\d{6}\Z', na=False).to_numpy(dtype=bool)
+        slots = np.flatnonzero(valid)
+        return self.keys[slots].astype(np.int64), slots
+
+    @cached_property
+    @_timed_build
+    def bitmap(self) -> np.ndarray:
+        """
+        Existence bitmap over the 6-digit pincode space.
+
+        Bit ``n`` (most significant bit first within each byte) is set when
+        pincode ``n`` is indexed, so the whole space takes 125 KB.
+        """
+        bits = np.zeros(PINCODE_SPACE, dtype=bool)
+        bits[self.numbers[0]] = True
+        return np.packbits(bits)
+
+    def contains(self, numbers: np.ndarray) -> np.ndarray:
+        """
+        Test numeric pincodes against the existence bitmap.
+
+        Args:
+            numbers: Integer array of pincodes
+
+        Returns:
+            Boolean array, True for indexed pincodes; numbers outside the
+            6-digit space are False
+        """
+        in_range = (numbers >= 0) & (numbers < PINCODE_SPACE)
+        safe = np.where(in_range, numbers, 0).astype(np.uint32)
+        # Shift each pincode's bit to the top of its byte
+        shifted = np.left_shift(self.bitmap[safe >> 3], (safe & 7).astype(np.uint8))
+        return (shifted >= 0x80) & in_range
+
+    def slot_range(self, low: int, high: int) -> np.ndarray:
+        """
+        Get the slots of all pincodes between two numbers.
+
+        Args:
+            low: Smallest pincode to include
+            high: Largest pincode to include
+
+        Returns:
+            Slots of the matching pincodes, in ascending pincode order
+        """
+        numbers, slots = self.numbers
+        start = np.searchsorted(numbers, low, side='left')
+        stop = np.searchsorted(numbers, high, side='right')
+        return slots[start:max(start, stop)]
+
+    @cached_property
+    @_timed_build
+    def record_columns(self) -> RecordColumns:
+        """Column arrays that ``PincodeRecord`` objects read their fields from."""
+        return RecordColumns(self.data)
+
+    @cached_property
+    @_timed_build
+    def groups(self) -> GroupIndex:
+        """State and district groupings, built on first use."""
+        return GroupIndex(self)
+
+    def names(self, field_name: str) -> NameIndex:
+        """Get the name index for a text column, building it on first use."""
+        names = self._names.get(field_name)
+        if names is None:
+            start = time.perf_counter()
+            names = self._names[field_name] = NameIndex(self.data[field_name])
+            if self.on_build is not None:
+                self.on_build(f'names.{field_name}', time.perf_counter() - start)
+        return names
+
+    @cached_property
+    @_timed_build
+    def summary(self) -> pd.DataFrame:
+        """
+        Deduplicated per-pincode table, by slot.
+
+        Holds the first row of every pincode plus an ``office_count`` column,
+        followed by one empty row (office count 0) so that slot -1 selects a
+        miss in a single ``take``.
+        """
+        columns = [name for name in self.data.columns if name != 'pincode']
+        table = self.data.iloc[self.first_rows][columns].reset_index(drop=True)
+        table['office_count'] = np.diff(self.offsets)
+        missing = table.iloc[:0].reindex([len(table)])
+        missing['office_count'] = 0
+        return pd.concat([table, missing])
+
+    def lookup(self, pincodes: np.ndarray) -> np.ndarray:
+        """
+        Find the slot of many pincodes in one vectorized probe.
+
+        Args:
+            pincodes: Array of normalized pincode strings
+
+        Returns:
+            Array of slots, with -1 for pincodes that are not indexed
+        """
+        if not len(self.keys):
+            return np.full(len(pincodes), -1, dtype=np.intp)
+        return np.asarray(self.key_index.get_indexer(pincodes), dtype=np.intp)
+
+    def rows_for_slots(self, slots: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gather the row positions of many pincodes at once.
+
+        Args:
+            slots: Array of valid slots
+
+        Returns:
+            Tuple of (row positions of every slot concatenated, row count per slot)
+        """
+        starts = self.offsets[slots]
+        counts = self.offsets[slots + 1] - starts
+        total = int(counts.sum())
+        # Position within the concatenated output, shifted to each group's start
+        shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        return self.order[np.arange(total) + shift], counts
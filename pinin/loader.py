@@ -0,0 +1,172 @@
+"""
+CSV loading for the pincode dataset.
+
+The encoding is detected in one pass over the raw bytes before parsing, so
+the file is parsed exactly once. Columns are read with explicit types (the
+pincode as a string, repeated names directly as categoricals) instead of
+being inferred and converted afterwards, only the requested columns are
+parsed, and the pyarrow CSV engine is used when pyarrow is installed.
+"""
+
+import codecs
+import csv
+import importlib.util
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+REQUIRED_COLUMNS = (
+    'pincode', 'officename', 'statename', 'districtname',
+    'taluk', 'officetype', 'Deliverystatus',
+)
+
+# Named column selections for ``PincodeData(columns=...)``; None keeps all
+COLUMN_PROFILES: Dict[str, Optional[Tuple[str, ...]]] = {
+    'minimal': ('pincode', 'statename', 'districtname'),
+    'standard': REQUIRED_COLUMNS,
+    'full': None,
+}
+
+# Low-cardinality text columns stored as categoricals (codes into a shared
+# table of distinct strings) instead of one Python string per row
+CATEGORICAL_COLUMNS = (
+    'statename', 'districtname', 'taluk', 'officetype', 'Deliverystatus',
+    'divisionname', 'regionname', 'circlename',
+)
+
+ENGINES = ('c', 'pyarrow')
+
+# Bytes per chunk when checking that the file is valid UTF-8
+_CHUNK_SIZE = 1 << 20
+
+# Bytes cp1252 leaves undefined; any of them means the file is Latin-1
+_CP1252_UNDEFINED = frozenset(b'\x81\x8d\x8f\x90\x9d')
+
+
+def detect_encoding(path: str) -> str:
+    """
+    Detect the encoding of a CSV file in a single pass.
+
+    The file is decoded incrementally as UTF-8; files that are not valid
+    UTF-8 are read as cp1252 (the usual encoding of spreadsheet exports),
+    or as Latin-1 if they use bytes cp1252 does not define.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        ``'utf-8-sig'``, ``'utf-8'``, ``'cp1252'`` or ``'latin-1'``; ``'utf-8'``
+        if the file cannot be read
+    """
+    try:
+        handle = open(path, 'rb')
+    except OSError:
+        return 'utf-8'
+    with handle:
+        head = handle.read(_CHUNK_SIZE)
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        chunk = head
+        try:
+            while chunk:
+                decoder.decode(chunk)
+                chunk = handle.read(_CHUNK_SIZE)
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            handle.seek(0)
+            while True:
+                chunk = handle.read(_CHUNK_SIZE)
+                if not chunk:
+                    return 'cp1252'
+                if not _CP1252_UNDEFINED.isdisjoint(chunk):
+                    return 'latin-1'
+    return 'utf-8-sig' if head.startswith(codecs.BOM_UTF8) else 'utf-8'
+
+
+def resolve_columns(columns: Union[str, Sequence[str], None]) -> Optional[Tuple[str, ...]]:
+    """
+    Turn a profile name or column list into the columns to load.
+
+    Args:
+        columns: A name from ``COLUMN_PROFILES``, a sequence of column
+                 names, or None for every column
+
+    Returns:
+        Column names starting with ``pincode``, or None for every column
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    if columns is None:
+        return None
+    if isinstance(columns, str):
+        if columns not in COLUMN_PROFILES:
+            raise ValueError(f"Unknown column profile '{columns}', expected one of {tuple(COLUMN_PROFILES)}")
+        return COLUMN_PROFILES[columns]
+    return tuple(dict.fromkeys(('pincode', *columns)))
+
+
+def read_header(path: str, encoding: Optional[str] = None) -> Optional[List[str]]:
+    """
+    Read the column names from the first line of a CSV file.
+
+    Args:
+        path: Path to the CSV file
+        encoding: Encoding of the file; None uses :func:`detect_encoding`
+
+    Returns:
+        The column names, or None if the file cannot be read
+    """
+    if encoding is None:
+        encoding = detect_encoding(path)
+    try:
+        with open(path, encoding=encoding, newline='') as handle:
+            return next(csv.reader(handle), None)
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def default_engine() -> str:
+    """Return ``'pyarrow'`` when pyarrow is installed, else ``'c'``."""
+    return 'pyarrow' if importlib.util.find_spec('pyarrow') is not None else 'c'
+
+
+def read_csv(path: str, usecols: Optional[Sequence[str]] = None,
+             engine: Optional[str] = None) -> pd.DataFrame:
+    """
+    Parse a pincode CSV file.
+
+    Args:
+        path: Path to the CSV file
+        usecols: Columns to parse (``pincode`` is always included); None
+                 parses every column. Columns the file lacks are skipped.
+        engine: ``'c'`` or ``'pyarrow'``; None picks :func:`default_engine`.
+                If the pyarrow engine fails, the file is parsed again with
+                the C engine.
+
+    Returns:
+        The parsed data, with ``pincode`` as strings and the repeated name
+        columns as categoricals
+
+    Raises:
+        ValueError: If the engine is unknown
+    """
+    engine = engine or default_engine()
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown CSV engine '{engine}', expected one of {ENGINES}")
+
+    dtype: Dict[str, str] = {'pincode': 'str', 'officename': 'str'}
+    dtype.update((column, 'category') for column in CATEGORICAL_COLUMNS)
+    encoding = detect_encoding(path)
+    options = {'encoding': encoding, 'dtype': dtype}
+    if usecols is not None:
+        wanted = set(usecols) | {'pincode'}
+        header = read_header(path, encoding)
+        # A list works with every engine; missing columns are reported later
+        options['usecols'] = [name for name in header if name in wanted] if header else wanted.__contains__
+
+    if engine == 'pyarrow':
+        try:
+            return pd.read_csv(path, engine='pyarrow', **options)
+        except (ValueError, TypeError, ImportError):
+            pass
+    return pd.read_csv(path, **options)
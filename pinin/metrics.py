@@ -0,0 +1,169 @@
+"""
+Optional per-operation metrics for ``PincodeData``.
+
+Instrumentation is off by default and then costs nothing: the public methods
+are the plain class methods. With ``PincodeData(metrics=True)`` (or
+``PININ_METRICS=1``, or an ``on_metric`` callback) each instance wraps its
+public methods (except the lazy ``iter_by_*`` iterators, see
+``INSTRUMENTED_METHODS``) to count calls and errors and to record latencies in a
+fixed-bucket histogram, and it records the duration of every load phase and
+of every index structure it builds.
+
+Read the totals with ``PincodeData.get_metrics()``, or pass ``on_metric`` to
+receive every measurement as a :class:`MetricEvent` and forward it to another
+metrics system. The callback runs synchronously on the calling thread, so it
+should be fast and must not raise.
+"""
+
+import bisect
+import functools
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+# Upper bounds (seconds) of the latency histogram buckets; the last is open
+LATENCY_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, float("inf"),
+)
+
+# Public PincodeData methods that are timed when metrics are enabled. The lazy
+# iter_by_prefix and iter_by_range are left out: timing the call would only
+# cover creating the iterator, and timing the iteration would include the
+# caller's own work between items. search_by_prefix/search_by_range measure
+# the same lookups eagerly.
+INSTRUMENTED_METHODS = (
+    'get_pincode_info', 'get_state', 'get_district', 'get_taluk', 'get_offices',
+    'exists', 'exists_many', 'get_pincode_info_many', 'get_states_many', 'get_districts_many',
+    'get_taluks_many', 'normalize_pincodes', 'enrich', 'search_by_state', 'search_by_district',
+    'search_by_prefix', 'search_by_range', 'search_by_office',
+    'fuzzy_search', 'suggest', 'get_states', 'get_districts', 'get_statistics',
+)
+
+
+def metrics_enabled() -> bool:
+    """Return True when metrics are enabled with ``PININ_METRICS=1``."""
+    return os.environ.get("PININ_METRICS", "0").lower() in ("1", "true", "yes", "on")
+
+
+class MetricEvent(NamedTuple):
+    """
+    A single measurement passed to the ``on_metric`` callback.
+
+    ``kind`` is ``'call'`` (a public method call, ``name`` is the method),
+    ``'load'`` (a load phase such as ``'read_csv'`` or ``'index'``) or
+    ``'build'`` (a lazily built index structure such as ``'groups'``).
+    ``error`` is True when a call raised.
+    """
+    kind: str
+    name: str
+    seconds: float
+    error: bool = False
+
+
+class Histogram:
+    """Call count, error count and latency histogram of one operation."""
+
+    __slots__ = ('counts', 'count', 'errors', 'total', 'max')
+
+    def __init__(self) -> None:
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float, error: bool) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.errors += error
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of calls."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total_seconds': self.total,
+            'mean_seconds': self.total / self.count if self.count else 0.0,
+            'max_seconds': self.max,
+            'p50_seconds': self.percentile(0.5),
+            'p99_seconds': self.percentile(0.99),
+            'buckets': {str(bound): count for bound, count in zip(LATENCY_BUCKETS, self.counts)},
+        }
+
+
+class MetricsRecorder:
+    """
+    Thread-safe collector of call, load and index build measurements.
+
+    Args:
+        on_metric: Optional callback receiving every :class:`MetricEvent`
+    """
+
+    def __init__(self, on_metric: Optional[Callable[[MetricEvent], None]] = None):
+        self.on_metric = on_metric
+        self._calls: Dict[str, Histogram] = {}
+        self._load: Dict[str, float] = {}
+        self._builds: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, event: MetricEvent) -> None:
+        """Add a measurement and pass it to the callback."""
+        with self._lock:
+            if event.kind == 'call':
+                histogram = self._calls.get(event.name)
+                if histogram is None:
+                    histogram = self._calls[event.name] = Histogram()
+                histogram.add(event.seconds, event.error)
+            elif event.kind == 'load':
+                self._load[event.name] = event.seconds
+            else:
+                self._builds.setdefault(event.name, []).append(event.seconds)
+        if self.on_metric is not None:
+            self.on_metric(event)
+
+    def record_build(self, name: str, seconds: float) -> None:
+        """Record the build time of an index structure."""
+        self.record(MetricEvent('build', name, seconds))
+
+    def wrap(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``method`` wrapped to record the latency of every call."""
+        record = self.record
+        perf_counter = time.perf_counter
+
+        @functools.wraps(method)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            except BaseException:
+                record(MetricEvent('call', name, perf_counter() - start, True))
+                raise
+            record(MetricEvent('call', name, perf_counter() - start))
+            return result
+
+        return timed
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy of the collected measurements."""
+        with self._lock:
+            return {
+                'calls': {name: histogram.to_dict() for name, histogram in self._calls.items()},
+                'load': dict(self._load),
+                'index_builds': {name: list(times) for name, times in self._builds.items()},
+            }
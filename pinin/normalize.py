@@ -0,0 +1,235 @@
+"""
+Pincode normalization and validation.
+
+Real-world pincode columns hold more than clean 6-digit strings: Excel turns
+them into floats (``110001.0``), people type ``110 001`` or ``110-001``, and
+forms prefix them with ``PIN:``. :func:`normalize_pincodes` cleans a whole
+column at once and reports why each rejected value was rejected.
+
+Most values in a column are either already clean or follow one of a few
+common layouts, so those are recognized with NumPy operations over a
+fixed-width character array. Only the remaining values go through the
+per-value regular expression, which is also what :func:`classify_pincode`
+uses for single values.
+"""
+
+import re
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Reason codes, in the order of the categories of the ``reason`` column
+OK = 'ok'
+MISSING = 'missing'
+BAD_LENGTH = 'bad_length'
+NON_NUMERIC = 'non_numeric'
+LEADING_ZERO = 'leading_zero'
+UNKNOWN = 'unknown'
+REASONS = (OK, MISSING, BAD_LENGTH, NON_NUMERIC, LEADING_ZERO, UNKNOWN)
+
+# Accepted layouts: an optional "PIN"/"PIN code" label, three digits, an
+# optional space or hyphen, three digits and an optional ".0" float suffix
+_PINCODE = re.compile(r'(?:PIN(?:\s*CODE)?\s*[:#.\-]?\s*)?([0-9]{3})[ \-]?([0-9]{3})(?:\.0+)?', re.IGNORECASE)
+_LABEL = re.compile(r'^PIN(?:\s*CODE)?\s*[:#.\-]?\s*', re.IGNORECASE)
+_FLOAT_SUFFIX = re.compile(r'\.0+$')
+_DIGITS = re.compile(r'[0-9]+')
+
+# Width of the character array for the vectorized pass; longer values are
+# checked one by one
+_WIDTH = 16
+
+_CODES = {reason: code for code, reason in enumerate(REASONS)}
+
+PincodeValues = Union[Sequence[object], np.ndarray, pd.Series]
+
+
+def classify_pincode(value: object) -> Tuple[Optional[str], str]:
+    """
+    Normalize and validate a single pincode.
+
+    Args:
+        value: Pincode as a string, integer or float
+
+    Returns:
+        Tuple of (normalized 6-digit pincode or None, reason code). The
+        reason is ``'ok'``, ``'missing'``, ``'bad_length'``,
+        ``'non_numeric'`` or ``'leading_zero'``; the pincode is only set
+        for ``'ok'``.
+    """
+    digits, reason = pincode_digits(value)
+    if digits is not None and digits[0] == '0':
+        return None, LEADING_ZERO
+    return digits, reason
+
+
+def pincode_digits(value: object) -> Tuple[Optional[str], str]:
+    """
+    Extract the six digits of a pincode in any accepted layout.
+
+    Like :func:`classify_pincode`, but six digits starting with 0 are
+    returned with reason ``'ok'`` instead of being rejected.
+    """
+    if value is None or (isinstance(value, float) and value != value):
+        return None, MISSING
+    if isinstance(value, float):
+        if not value.is_integer():
+            return None, NON_NUMERIC
+        value = int(value)
+    text = str(value).strip()
+    if len(text) == 6 and text.isascii() and text.isdigit():
+        return text, OK
+    match = _PINCODE.fullmatch(text)
+    if match is None:
+        return None, _rejection(text)
+    return match.group(1) + match.group(2), OK
+
+
+def _rejection(text: str) -> str:
+    """Reason a stripped value that matches no accepted layout is invalid."""
+    if not text:
+        return MISSING
+    body = _FLOAT_SUFFIX.sub('', _LABEL.sub('', text))
+    return BAD_LENGTH if _DIGITS.fullmatch(body) else NON_NUMERIC
+
+
+def _classify_numbers(numbers: np.ndarray, codes: np.ndarray) -> None:
+    """Classify integral numbers, filling ``codes``; the caller formats the pincodes."""
+    codes[:] = _CODES[BAD_LENGTH]
+    codes[numbers < 0] = _CODES[NON_NUMERIC]
+    codes[(numbers >= 100_000) & (numbers <= 999_999)] = _CODES[OK]
+
+
+def _format_numbers(numbers: np.ndarray) -> np.ndarray:
+    """Format 6-digit integers as strings by writing their digits into a character array."""
+    digits = numbers[:, None] // (10 ** np.arange(5, -1, -1)) % 10 + ord('0')
+    return np.ascontiguousarray(digits, dtype=np.uint32).view('U6').ravel().astype(object)
+
+
+def _classify_strings(text: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Classify an object array of strings.
+
+    Returns:
+        Tuple of (normalized pincodes as an object array, reason codes)
+    """
+    n = len(text)
+    pincodes = np.full(n, None, dtype=object)
+    codes = np.full(n, _CODES[OK], dtype=np.int8)
+
+    # Clean values are kept as they are, without creating new strings
+    lengths = np.fromiter(map(len, text), dtype=np.intp, count=n)
+    head = text.astype('U6').view(np.uint32).reshape(n, 6)
+    clean = (lengths == 6) & ((head >= ord('0')) & (head <= ord('9'))).all(axis=1)
+    pincodes[clean] = text[clean]
+    codes[clean & (head[:, 0] == ord('0'))] = _CODES[LEADING_ZERO]
+
+    rest = np.flatnonzero(~clean)
+    if len(rest):
+        found, found_codes = _classify_layouts(text[rest])
+        pincodes[rest] = found
+        codes[rest] = found_codes
+    pincodes[codes != _CODES[OK]] = None
+    return pincodes, codes
+
+
+def _classify_layouts(text: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Classify strings that are not plain 6-digit pincodes.
+
+    Padded values, ``110 001``/``110-001`` and ``110001.0`` are recognized
+    over a fixed-width character array; anything else goes through
+    :func:`classify_pincode`.
+    """
+    n = len(text)
+    pincodes = np.full(n, None, dtype=object)
+    codes = np.full(n, -1, dtype=np.int8)
+
+    raw = text.astype(f'U{_WIDTH}')
+    # A value filling the whole width may have been cut off
+    truncated = np.fromiter(map(len, text), dtype=np.intp, count=n) >= _WIDTH
+    matrix = np.char.strip(raw).astype(f'U{_WIDTH}').view(np.uint32).reshape(n, _WIDTH)
+    length = np.count_nonzero(matrix, axis=1)
+    digit = (matrix[:, :8] >= ord('0')) & (matrix[:, :8] <= ord('9'))
+    six_digits = digit[:, :6].all(axis=1)
+
+    plain = (length == 6) & six_digits
+    excel = (length == 8) & six_digits & (matrix[:, 6] == ord('.')) & (matrix[:, 7] == ord('0'))
+    separated = ((length == 7) & digit[:, :3].all(axis=1) & digit[:, 4:7].all(axis=1)
+                 & ((matrix[:, 3] == ord(' ')) | (matrix[:, 3] == ord('-'))))
+    accepted = (plain | excel | separated) & ~truncated
+
+    rows = matrix[accepted]
+    digits = np.where(separated[accepted][:, None], rows[:, [0, 1, 2, 4, 5, 6]], rows[:, :6])
+    leading_zero = digits[:, 0] == ord('0')
+    pincodes[accepted] = np.ascontiguousarray(digits).view('U6').ravel().astype(object)
+    codes[accepted] = np.where(leading_zero, _CODES[LEADING_ZERO], _CODES[OK])
+
+    for i in np.flatnonzero(codes < 0).tolist():
+        pincode, reason = classify_pincode(text[i])
+        pincodes[i] = pincode
+        codes[i] = _CODES[reason]
+    return pincodes, codes
+
+
+def normalize_pincodes(values: PincodeValues) -> pd.DataFrame:
+    """
+    Normalize and validate many pincodes in one pass.
+
+    Accepts 6-digit strings and integers, floats such as ``110001.0``,
+    ``110 001`` and ``110-001``, and a leading ``PIN:`` label, with
+    surrounding whitespace. Other values are rejected with a reason code.
+    Whether a well-formed pincode exists is not checked here; see
+    ``PincodeData.normalize_pincodes``.
+
+    Args:
+        values: List, NumPy array or pandas Series of pincodes
+
+    Returns:
+        DataFrame aligned with the input (keeping a Series input's index)
+        with a ``pincode`` column holding the normalized 6-digit string
+        (missing for rejected values), and a categorical ``reason`` column holding ``'ok'``,
+        ``'missing'``, ``'bad_length'``, ``'non_numeric'`` or
+        ``'leading_zero'``
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    n = len(series)
+    pincodes = np.full(n, None, dtype=object)
+    codes = np.full(n, _CODES[MISSING], dtype=np.int8)
+
+    kind = series.dtype.kind
+    if kind in 'iuf':
+        numbers = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(numbers)
+        # The remainder of an infinity is invalid; only take it for finite values
+        integral = np.isfinite(numbers)
+        integral[integral] = numbers[integral] % 1 == 0
+        codes[present & ~integral] = _CODES[NON_NUMERIC]
+        if integral.any():
+            selected = codes[integral]
+            _classify_numbers(numbers[integral], selected)
+            codes[integral] = selected
+            ok = np.flatnonzero(integral)[selected == _CODES[OK]]
+            pincodes[ok] = _format_numbers(numbers[ok].astype(np.int64))
+    else:
+        objects = series.to_numpy(dtype=object)
+        present = ~pd.isna(objects)
+        if present.any():
+            text = objects[present]
+            if pd.api.types.infer_dtype(text, skipna=False) != 'string':
+                # Numbers mixed into an object column are checked as text
+                text = np.array([value if isinstance(value, str) else _format(value)
+                                 for value in text.tolist()], dtype=object)
+            found, found_codes = _classify_strings(text)
+            pincodes[present] = found
+            codes[present] = found_codes
+
+    reason = pd.Categorical.from_codes(codes, categories=list(REASONS))
+    return pd.DataFrame({'pincode': pincodes, 'reason': reason}, index=series.index)
+
+
+def _format(value: object) -> str:
+    """Text of a non-string value, writing integral floats without a fraction."""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
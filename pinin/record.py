@@ -0,0 +1,158 @@
+"""
+Compact, lazily decoded pincode records.
+
+``PincodeRecord`` is an alternative to the dictionaries returned by
+``get_pincode_info``. A record holds only a reference to the column arrays
+and its row position; a field is read from the arrays when it is accessed,
+so a lookup allocates one small object per row instead of a dictionary with
+every column.
+"""
+
+from typing import Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+RECORD_FORMATS = ("dict", "record")
+
+
+class RecordColumns:
+    """
+    Column arrays of a DataFrame, extracted on first access.
+
+    Categorical columns are kept as their integer codes plus the table of
+    categories, so reading a field never materializes a whole column of
+    strings.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Wrap a DataFrame.
+
+        Args:
+            data: Pincode data the records are read from
+        """
+        self.data = data
+        self.names: Tuple[str, ...] = tuple(str(name) for name in data.columns)
+        self.positions: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self._arrays: Dict[str, Tuple[np.ndarray, Any]] = {}
+
+    def arrays(self, name: str) -> Tuple[np.ndarray, Any]:
+        """Get the (values or codes, categories or None) arrays of a column."""
+        arrays = self._arrays.get(name)
+        if arrays is None:
+            series = self.data.iloc[:, self.positions[name]]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                categories = np.asarray(series.cat.categories, dtype=object)
+                arrays = (series.cat.codes.to_numpy(), categories)
+            else:
+                arrays = (series.to_numpy(), None)
+            self._arrays[name] = arrays
+        return arrays
+
+    def value(self, name: str, row: int) -> Any:
+        """
+        Read one field.
+
+        Args:
+            name: Column name
+            row: Row position
+
+        Returns:
+            The value as a plain Python object (NaN for missing values)
+        """
+        values, categories = self.arrays(name)
+        if categories is not None:
+            code = values[row]
+            return categories[code] if code >= 0 else np.nan
+        value = values[row]
+        return value.item() if isinstance(value, np.generic) else value
+
+
+class PincodeRecord:
+    """
+    Read-only view of one row of the pincode data.
+
+    Fields are available as attributes (``record.statename``) or by key
+    (``record['statename']``) and are decoded only when read. Use
+    :meth:`to_dict` to get the dictionary ``get_pincode_info`` returns by
+    default.
+    """
+
+    __slots__ = ("_columns", "_row")
+
+    def __init__(self, columns: RecordColumns, row: int):
+        """
+        Create a record.
+
+        Args:
+            columns: Column arrays of the dataset
+            row: Row position of the record
+        """
+        object.__setattr__(self, "_columns", columns)
+        object.__setattr__(self, "_row", row)
+
+    def __getattr__(self, name: str) -> Any:
+        columns = self._columns
+        if name not in columns.positions:
+            raise AttributeError(f"PincodeRecord has no field '{name}'")
+        return columns.value(name, self._row)
+
+    def __getitem__(self, name: str) -> Any:
+        columns = self._columns
+        if name not in columns.positions:
+            raise KeyError(name)
+        return columns.value(name, self._row)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("PincodeRecord is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("PincodeRecord is read-only")
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._columns.positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns.names)
+
+    def __len__(self) -> int:
+        return len(self._columns.names)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PincodeRecord):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(object.__dir__(self)) | set(self._columns.names))
+
+    def __repr__(self) -> str:
+        return f"PincodeRecord(pincode={self['pincode']!r}, officename={self['officename']!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickle the fields, not the whole dataset the record points into
+        return (_record_from_dict, (self.to_dict(),))
+
+    def keys(self) -> Tuple[str, ...]:
+        """Get the field names, in column order."""
+        return self._columns.names
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record to a dictionary.
+
+        Returns:
+            Dictionary with every field, as ``get_pincode_info`` returns it
+        """
+        columns, row = self._columns, self._row
+        return {name: columns.value(name, row) for name in columns.names}
+
+
+def _record_from_dict(fields: Dict[str, Any]) -> PincodeRecord:
+    """Rebuild an unpickled record over a one-row dataset."""
+    return PincodeRecord(RecordColumns(pd.DataFrame([fields])), 0)
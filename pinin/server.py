@@ -0,0 +1,222 @@
+"""
+Lookup daemon keeping the pincode dataset resident.
+
+Started with ``pypinindia serve``; the CLI (and any ``pinin.client`` user)
+then answers lookups through it instead of loading the dataset in every
+process. See ``pinin.client`` for the line-delimited JSON protocol.
+
+Each connection is served by its own thread and may send any number of
+requests. ``PincodeData`` is safe for concurrent readers, so all connections
+share one instance.
+"""
+
+import json
+import os
+import signal
+import socketserver
+import sys
+import threading
+from typing import Any, Callable, Optional
+
+from . import __version__
+from .client import METHODS, Address, DaemonClient, check_private, parse_address, private_dir
+from .core import PincodeData, ReloadResult, default_data_file
+from .record import PincodeRecord
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert values ``json`` cannot encode: NumPy scalars and records."""
+    if isinstance(value, PincodeRecord):
+        return value.to_dict()
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _error(exc: Exception) -> dict:
+    error = {'type': type(exc).__name__, 'message': str(exc)}
+    if hasattr(exc, 'pincode'):
+        error['pincode'] = exc.pincode  # type: ignore
+    return {'error': error}
+
+
+def handle_request(pincode_data: PincodeData, line: bytes, info: dict) -> bytes:
+    """
+    Answer one request line.
+
+    Args:
+        pincode_data: Dataset to answer from
+        line: JSON request
+        info: Answer to ``ping`` requests
+
+    Returns:
+        JSON response line, including the trailing newline
+    """
+    try:
+        request = json.loads(line)
+        method = request['method']
+        if method == 'ping':
+            response = {'result': info}
+        elif method in METHODS:
+            result = getattr(pincode_data, method)(*request.get('args', ()), **request.get('kwargs', {}))
+            response = {'result': result}
+        else:
+            raise ValueError(f"Unknown method '{method}'")
+    except Exception as e:  # noqa: BLE001 - reported to the client
+        response = _error(e)
+    try:
+        encoded = json.dumps(response, default=_jsonable, ensure_ascii=False)
+    except (TypeError, ValueError) as e:
+        encoded = json.dumps(_error(e))
+    return encoded.encode("utf-8") + b"\n"
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Serves the requests of one connection until the client disconnects."""
+
+    server: "_ServerMixin"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            self.wfile.write(handle_request(self.server.pincode_data, line, self.server.info))
+            self.wfile.flush()
+
+
+class _ServerMixin:
+    pincode_data: PincodeData
+    info: dict
+
+
+class _TCPServer(_ServerMixin, socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class _UnixServer(_ServerMixin, socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+        def server_close(self) -> None:
+            super().server_close()
+            try:
+                os.unlink(self.server_address)  # type: ignore
+            except OSError:
+                pass
+
+
+def _prepare_socket_dir(path: str) -> None:
+    """Create the per-user socket directory when ``path`` is in it, and check who owns it."""
+    directory = os.path.dirname(os.path.abspath(path))
+    if directory != private_dir():
+        return
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    check_private(directory, directory=True)
+
+
+def _claim_socket_path(path: str) -> None:
+    """Remove a stale socket file, refusing if a daemon is still listening on it."""
+    if not os.path.lexists(path):
+        return
+    if hasattr(os, "getuid") and os.lstat(path).st_uid != os.getuid():
+        raise PermissionError(f"{path} belongs to another user")
+    try:
+        DaemonClient(path, timeout=1.0).close()
+    except OSError:
+        os.unlink(path)
+    else:
+        raise OSError(f"A lookup daemon is already listening on {path}")
+
+
+def make_server(pincode_data: PincodeData, address: Optional[str] = None,
+                default_data: bool = False) -> socketserver.BaseServer:
+    """
+    Create a daemon server for a loaded dataset, without starting it.
+
+    Args:
+        pincode_data: Dataset to serve
+        address: Unix socket path or ``HOST:PORT``; None uses
+                 ``pinin.client.default_address()``.
+        default_data: Whether the dataset is the default bundled data, which
+                 clients that do not name a data file require.
+
+    Returns:
+        The bound server; call ``serve_forever()`` to run it and
+        ``server_close()`` when done (which removes the socket file)
+
+    Raises:
+        PermissionError: If the socket path, or the per-user socket
+                 directory, belongs to another user
+        OSError: If the address is in use
+    """
+    parsed: Address = parse_address(address)
+    server: Any
+    if isinstance(parsed, tuple):
+        server = _TCPServer(parsed, _Handler)
+    else:
+        _prepare_socket_dir(parsed)
+        _claim_socket_path(parsed)
+        # Create the socket file owner-only; a chmod after binding would
+        # leave it open to other users for a moment
+        umask = os.umask(0o177)
+        try:
+            server = _UnixServer(parsed, _Handler)
+        finally:
+            os.umask(umask)
+    server.pincode_data = pincode_data
+    server.info = {
+        'pid': os.getpid(),
+        'version': __version__,
+        'data_file': os.path.abspath(pincode_data._data_file),
+        'default_data': default_data,
+    }
+    return server
+
+
+def serve(address: Optional[str] = None, data_file: Optional[str] = None,
+          ready: Optional[Callable[[socketserver.BaseServer], None]] = None,
+          watch: Optional[float] = None,
+          on_reload: Optional[Callable[[ReloadResult], None]] = None) -> None:
+    """
+    Load the dataset and answer requests until interrupted.
+
+    Args:
+        address: Unix socket path or ``HOST:PORT``; None uses
+                 ``pinin.client.default_address()``.
+        data_file: Path to CSV file containing pincode data.
+                   If None, uses the default bundled data file.
+        ready: Called with the server once it is listening.
+        watch: Reload the data file this many seconds after it changes
+               (see ``PincodeData.watch``); None never reloads.
+        on_reload: Called with the result of every reload.
+
+    Raises:
+        DataLoadError: If the data file cannot be loaded
+        OSError: If the address is in use
+    """
+    default_data = data_file is None or os.path.abspath(data_file) == os.path.abspath(default_data_file())
+    pincode_data = PincodeData(data_file)
+    # Build the lazily created structures before the first client waits on them
+    index = pincode_data._get_index()
+    index.groups
+    index.numbers
+    server = make_server(pincode_data, address, default_data)
+    if watch is not None:
+        pincode_data.watch(watch, on_reload)
+    if threading.current_thread() is threading.main_thread():
+        # Exit through the cleanup below (removing the socket file) on kill
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        if ready is not None:
+            ready(server)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pincode_data.stop_watching()
+        server.server_close()
+
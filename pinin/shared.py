@@ -0,0 +1,224 @@
+"""
+Read-only pincode lookups served directly from a memory-mapped snapshot.
+
+Every ``PincodeData`` instance holds its own pandas copy of the dataset. In a
+prefork server (e.g. gunicorn with many workers) that means one copy per
+worker, and even pages inherited from the master through ``fork`` are
+gradually copied again as Python writes reference counts into them.
+
+``SharedPincodeData`` instead attaches to the snapshot file written by
+``pinin.snapshot``. Pincodes are found by binary search over the sorted
+numeric pincode array and strings are decoded one field at a time from the
+string tables, so lookups never copy the dataset into the process. The file
+is mapped read-only: its pages live in the OS page cache and are shared by
+every process attached to it, so total memory stays roughly constant as
+workers are added.
+
+Typical use with gunicorn::
+
+    # gunicorn.conf.py
+    def on_starting(server):
+        SharedPincodeData.prepare()     # parse once, write the snapshot
+
+    # application code, in each worker
+    pincodes = SharedPincodeData()      # attach, no parsing
+    pincodes.get_state("110001")
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .core import PincodeData, _normalize_pincode, default_data_file
+from .exceptions import DataLoadError, DataNotFoundError
+from . import snapshot
+
+
+def _view(snap: snapshot.Snapshot, spec: Dict[str, Any]) -> np.ndarray:
+    """Plain ndarray view of a mapped array (indexing an ``np.memmap`` is slower)."""
+    return np.asarray(snap.array(spec))
+
+
+class _StringColumn:
+    """A dictionary-encoded string column inside the mapping."""
+
+    def __init__(self, snap: snapshot.Snapshot, spec: Dict[str, Any]):
+        self.codes = _view(snap, spec["codes"])
+        self.offsets = _view(snap, spec["table"]["offsets"])
+        self.blob = memoryview(_view(snap, spec["table"]["data"]))
+
+    def value(self, row: int) -> Any:
+        code = int(self.codes[row])
+        if code < 0:
+            return np.nan
+        # Each string is stored NUL-terminated
+        return bytes(self.blob[int(self.offsets[code]):int(self.offsets[code + 1]) - 1]).decode("utf-8")
+
+
+class _NumericColumn:
+    """A numeric column inside the mapping."""
+
+    def __init__(self, snap: snapshot.Snapshot, spec: Dict[str, Any]):
+        self.values = _view(snap, spec["values"])
+
+    def value(self, row: int) -> Any:
+        return self.values[row].item()
+
+
+class SharedPincodeData:
+    """
+    Pincode lookups over a memory-mapped snapshot, without a pandas copy.
+
+    Supports the point lookups of ``PincodeData`` (``get_pincode_info``,
+    ``get_state``, ``get_district``, ``get_taluk`` and ``get_offices``) with
+    the same results and exceptions. Instances are immutable and may be used
+    from several threads.
+    """
+
+    def __init__(self, data_file: Optional[str] = None, build: bool = True):
+        """
+        Attach to the snapshot of a CSV file.
+
+        Args:
+            data_file: Path to CSV file containing pincode data.
+                      If None, uses the default bundled data file.
+            build: Parse the CSV and write the snapshot if there is no
+                   current one. Pass False in workers that must never parse.
+
+        Raises:
+            DataLoadError: If there is no usable snapshot and none can be built
+        """
+        self._data_file = data_file or default_data_file()
+        snap = snapshot.find_snapshot(self._data_file)
+        if snap is None and build:
+            self.prepare(self._data_file)
+            snap = snapshot.find_snapshot(self._data_file)
+        if snap is None:
+            raise DataLoadError("No current snapshot available", self._data_file)
+
+        self._snapshot = snap
+        arrays = snap.header["index"]
+        self._order = _view(snap, arrays["order"])
+        self._offsets = _view(snap, arrays["offsets"])
+        self._numbers = _view(snap, arrays["numbers"])
+        self._number_slots = _view(snap, arrays["number_slots"])
+        self._columns: Dict[str, Union[_StringColumn, _NumericColumn]] = {}
+        for spec in snap.header["columns"]:
+            column_type = _NumericColumn if spec["kind"] == "numeric" else _StringColumn
+            self._columns[spec["name"]] = column_type(snap, spec)
+
+    @staticmethod
+    def prepare(data_file: Optional[str] = None) -> str:
+        """
+        Make sure a current snapshot exists, parsing the CSV if needed.
+
+        Call this once in the parent process before workers attach.
+
+        Args:
+            data_file: Path to CSV file containing pincode data.
+                      If None, uses the default bundled data file.
+
+        Returns:
+            Path of the snapshot file
+
+        Raises:
+            DataLoadError: If the data cannot be loaded or the snapshot
+                           cannot be written
+        """
+        data_file = data_file or default_data_file()
+        snap = snapshot.find_snapshot(data_file)
+        if snap is None:
+            PincodeData(data_file, use_snapshot=True)
+            snap = snapshot.find_snapshot(data_file)
+        if snap is None:
+            raise DataLoadError("Could not write snapshot", data_file)
+        return snap.path
+
+    @property
+    def snapshot_path(self) -> str:
+        """Path of the mapped snapshot file."""
+        return self._snapshot.path
+
+    @property
+    def columns(self) -> List[str]:
+        """Names of the dataset columns."""
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        """Number of distinct pincodes."""
+        return len(self._offsets) - 1
+
+    def _rows(self, pincode: Union[str, int]) -> Tuple[str, np.ndarray]:
+        """Validate a pincode and get its row positions."""
+        pincode_str = _normalize_pincode(pincode)
+        number = int(pincode_str)
+        position = int(np.searchsorted(self._numbers, number))
+        if position == len(self._numbers) or self._numbers[position] != number:
+            raise DataNotFoundError(pincode_str)
+        slot = int(self._number_slots[position])
+        return pincode_str, self._order[self._offsets[slot]:self._offsets[slot + 1]]
+
+    def _field(self, pincode: Union[str, int], field_name: str) -> Any:
+        """Read one field of the first row of a pincode."""
+        _, rows = self._rows(pincode)
+        return self._columns[field_name].value(int(rows[0]))
+
+    def get_pincode_info(self, pincode: Union[str, int]) -> List[Dict[str, Any]]:
+        """
+        Get complete information for a pincode.
+
+        Args:
+            pincode: The pincode to lookup
+
+        Returns:
+            List of dictionaries containing pincode information
+
+        Raises:
+            InvalidPincodeError: If pincode format is invalid
+            DataNotFoundError: If no data found for the pincode
+        """
+        _, rows = self._rows(pincode)
+        columns = self._columns.items()
+        return [{name: column.value(row) for name, column in columns} for row in rows.tolist()]
+
+    def get_state(self, pincode: Union[str, int]) -> str:
+        """
+        Get the state name for a pincode.
+
+        Raises:
+            InvalidPincodeError: If pincode format is invalid
+            DataNotFoundError: If no data found for the pincode
+        """
+        return str(self._field(pincode, "statename"))
+
+    def get_district(self, pincode: Union[str, int]) -> str:
+        """
+        Get the district name for a pincode.
+
+        Raises:
+            InvalidPincodeError: If pincode format is invalid
+            DataNotFoundError: If no data found for the pincode
+        """
+        return str(self._field(pincode, "districtname"))
+
+    def get_taluk(self, pincode: Union[str, int]) -> str:
+        """
+        Get the taluk name for a pincode.
+
+        Raises:
+            InvalidPincodeError: If pincode format is invalid
+            DataNotFoundError: If no data found for the pincode
+        """
+        return str(self._field(pincode, "taluk"))
+
+    def get_offices(self, pincode: Union[str, int]) -> List[str]:
+        """
+        Get all office names for a pincode.
+
+        Raises:
+            InvalidPincodeError: If pincode format is invalid
+            DataNotFoundError: If no data found for the pincode
+        """
+        _, rows = self._rows(pincode)
+        column = self._columns["officename"]
+        return [str(column.value(row)) for row in rows.tolist()]
@@ -0,0 +1,370 @@
+"""
+Compiled binary snapshots of the pincode dataset.
+
+Parsing the CSV is by far the most expensive part of creating a
+``PincodeData`` instance. After the first parse, the data is written to a
+snapshot file next to the CSV (or to a cache directory when that location is
+not writable). The snapshot holds every column as a flat array, with string
+columns dictionary-encoded as integer codes plus a string table (categorical
+columns keep their own codes), together with the prebuilt pincode index.
+Later loads memory-map the snapshot instead of parsing the CSV, and
+``pinin.shared`` serves lookups straight from the mapping.
+
+A snapshot records the size, modification time and hash of the CSV it was
+built from and is ignored (and rebuilt) as soon as the CSV changes.
+
+File layout::
+
+    8 bytes   magic (``PINSNAP`` + NUL)
+    8 bytes   header length, little-endian unsigned
+    N bytes   JSON header describing every array
+    ...       arrays, each aligned to 64 bytes
+"""
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .index import PincodeIndex
+
+MAGIC = b"PINSNAP\0"
+FORMAT_VERSION = 3
+SUFFIX = ".pinsnap"
+ALIGNMENT = 64
+
+_HEADER_PREFIX = struct.Struct("<8sQ")
+
+
+def snapshot_enabled() -> bool:
+    """Return False when snapshots are disabled with ``PININ_SNAPSHOT=0``."""
+    return os.environ.get("PININ_SNAPSHOT", "1").lower() not in ("0", "false", "no", "off")
+
+
+def _cache_dir() -> str:
+    """Directory used for snapshots of CSV files in read-only locations."""
+    configured = os.environ.get("PININ_CACHE_DIR")
+    if configured:
+        return configured
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pypinindia")
+
+
+def _candidate_paths(data_file: str) -> List[str]:
+    """Possible snapshot locations for a CSV file, in order of preference."""
+    data_file = os.path.abspath(data_file)
+    digest = hashlib.sha1(data_file.encode("utf-8")).hexdigest()[:16]
+    name = f"{os.path.basename(data_file)}.{digest}{SUFFIX}"
+    return [data_file + SUFFIX, os.path.join(_cache_dir(), name)]
+
+
+def _file_hash(path: str) -> str:
+    """Hash the contents of a file."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_signature(data_file: str) -> Dict[str, Any]:
+    """
+    Describe a CSV file so that snapshots can detect when it changes.
+
+    Args:
+        data_file: Path to the CSV file
+
+    Returns:
+        Dictionary with the file size, modification time and content hash
+    """
+    stat = os.stat(data_file)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "hash": _file_hash(data_file),
+    }
+
+
+def _is_current(recorded: Dict[str, Any], data_file: str) -> bool:
+    """Check whether a recorded source signature still matches the CSV."""
+    stat = os.stat(data_file)
+    if stat.st_size != recorded.get("size"):
+        return False
+    if stat.st_mtime_ns == recorded.get("mtime_ns"):
+        return True
+    # Same size but touched: only the content hash can tell
+    return bool(_file_hash(data_file) == recorded.get("hash"))
+
+
+class _Writer:
+    """Accumulates aligned arrays and their header descriptions."""
+
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+        self.size = 0
+
+    def add(self, array: np.ndarray) -> Dict[str, Any]:
+        array = np.ascontiguousarray(array)
+        padding = -self.size % ALIGNMENT
+        if padding:
+            self.chunks.append(b"\0" * padding)
+            self.size += padding
+        spec = {"offset": self.size, "dtype": array.dtype.str, "shape": list(array.shape)}
+        data = array.tobytes()
+        self.chunks.append(data)
+        self.size += len(data)
+        return spec
+
+
+def _encode_strings(writer: _Writer, values: List[Any]) -> Dict[str, Any]:
+    """Store a list of strings as a NUL-separated UTF-8 blob plus offsets."""
+    encoded = [str(value).encode("utf-8") for value in values]
+    lengths = np.fromiter((len(item) + 1 for item in encoded), dtype=np.int64, count=len(encoded))
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    blob = b"".join(item + b"\0" for item in encoded)
+    return {
+        "offsets": writer.add(offsets),
+        "data": writer.add(np.frombuffer(blob, dtype=np.uint8)),
+        "nul_free": not any(b"\0" in item for item in encoded),
+    }
+
+
+def _encode_column(writer: _Writer, name: str, series: pd.Series, sort: bool = False) -> Dict[str, Any]:
+    """Describe and store one DataFrame column."""
+    if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+        return {"name": name, "kind": "numeric", "values": writer.add(series.to_numpy())}
+
+    categorical = isinstance(series.dtype, pd.CategoricalDtype)
+    if categorical:
+        codes, uniques = series.cat.codes.to_numpy(), list(series.cat.categories)
+    else:
+        codes, raw_uniques = pd.factorize(series, sort=sort)
+        uniques = list(raw_uniques)
+    dtype = np.int32 if len(uniques) < 2 ** 31 else np.int64
+    return {
+        "name": name,
+        "kind": "strings",
+        "categorical": categorical,
+        "codes": writer.add(codes.astype(dtype)),
+        "table": _encode_strings(writer, uniques),
+    }
+
+
+def write_snapshot(data_file: str, data: pd.DataFrame, index: PincodeIndex,
+                   signature: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """
+    Write a snapshot of loaded data and its index for a CSV file.
+
+    Failures are not fatal: the snapshot is only an optimization, so any
+    error while writing is swallowed and ``None`` is returned.
+
+    The CSV must not change between taking ``signature`` and parsing it, or
+    the snapshot would pair old rows with the new file's signature. Pass the
+    signature taken before parsing; it is checked again just before the
+    snapshot is moved into place, and nothing is written if the CSV has
+    changed since.
+
+    Args:
+        data_file: Path to the CSV file the data was loaded from
+        data: Loaded pincode data
+        index: Index built over ``data``
+        signature: :func:`source_signature` of the CSV taken before it was
+                   parsed; None takes it now
+
+    Returns:
+        Path of the written snapshot, or None if it could not be written or
+        the CSV changed while the data was loaded
+    """
+    try:
+        if signature is None:
+            signature = source_signature(data_file)
+        writer = _Writer()
+        columns = []
+        for name in data.columns:
+            # Pincode codes are sorted so they line up with the index slots
+            columns.append(_encode_column(writer, str(name), data[name], sort=(name == "pincode")))
+        header = {
+            "version": FORMAT_VERSION,
+            "source": signature,
+            "rows": len(data),
+            "columns": columns,
+            "index": {
+                "order": writer.add(index.order.astype(np.int64)),
+                "offsets": writer.add(index.offsets.astype(np.int64)),
+                # Sorted numeric pincodes, so readers can search without
+                # decoding the pincode strings
+                "numbers": writer.add(index.numbers[0].astype(np.int64)),
+                "number_slots": writer.add(index.numbers[1].astype(np.int64)),
+            },
+        }
+    except Exception:
+        return None
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    start = _HEADER_PREFIX.size + len(header_bytes)
+    start += -start % ALIGNMENT
+
+    for path in _candidate_paths(data_file):
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        except OSError:
+            continue
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(_HEADER_PREFIX.pack(MAGIC, len(header_bytes)))
+                handle.write(header_bytes)
+                handle.write(b"\0" * (start - _HEADER_PREFIX.size - len(header_bytes)))
+                for chunk in writer.chunks:
+                    handle.write(chunk)
+            if source_signature(data_file) != signature:
+                # Replaced while it was parsed: the rows are not the new file's
+                os.unlink(tmp_path)
+                return None
+            os.replace(tmp_path, path)
+            return path
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    return None
+
+
+class Snapshot:
+    """
+    A memory-mapped snapshot file.
+
+    Arrays returned by :meth:`array` are read-only views into the mapping and
+    share pages with every other process mapping the same file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a snapshot file.
+
+        Args:
+            path: Path to the snapshot file
+
+        Raises:
+            ValueError: If the file is not a snapshot of a supported version
+        """
+        self.path = path
+        self.buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        if len(self.buffer) < _HEADER_PREFIX.size:
+            raise ValueError("Truncated snapshot")
+        magic, header_length = _HEADER_PREFIX.unpack(bytes(self.buffer[:_HEADER_PREFIX.size]))
+        if magic != MAGIC:
+            raise ValueError("Not a pincode snapshot")
+        end = _HEADER_PREFIX.size + header_length
+        self.header: Dict[str, Any] = json.loads(bytes(self.buffer[_HEADER_PREFIX.size:end]))
+        if self.header.get("version") != FORMAT_VERSION:
+            raise ValueError("Unsupported snapshot version")
+        self.base = end + (-end % ALIGNMENT)
+
+    def array(self, spec: Dict[str, Any]) -> np.ndarray:
+        """Get a read-only view of an array described in the header."""
+        dtype = np.dtype(spec["dtype"])
+        shape = tuple(spec["shape"])
+        count = int(np.prod(shape)) if shape else 1
+        start = self.base + spec["offset"]
+        view = self.buffer[start:start + count * dtype.itemsize]
+        return view.view(dtype).reshape(shape)
+
+    def strings(self, spec: Dict[str, Any]) -> List[str]:
+        """Decode a string table described in the header."""
+        blob = self.array(spec["data"]).tobytes()
+        if spec.get("nul_free", False):
+            return blob.decode("utf-8").split("\0")[:-1]
+        offsets = self.array(spec["offsets"])
+        return [blob[offsets[i]:offsets[i + 1] - 1].decode("utf-8") for i in range(len(offsets) - 1)]
+
+    def to_frame(self, columns: Optional[Sequence[str]] = None) -> Tuple[pd.DataFrame, PincodeIndex]:
+        """
+        Rebuild the DataFrame and pincode index stored in the snapshot.
+
+        Args:
+            columns: Columns to include (``pincode`` always is); None
+                     includes every column. Other columns are never read.
+        """
+        values: Dict[str, Any] = {}
+        keys: List[str] = []
+        for column in self.header["columns"]:
+            if columns is not None and column["name"] != "pincode" and column["name"] not in columns:
+                continue
+            if column["kind"] == "numeric":
+                values[column["name"]] = self.array(column["values"])
+                continue
+            strings = self.strings(column["table"])
+            if column["name"] == "pincode":
+                keys = strings
+            if column.get("categorical", False):
+                values[column["name"]] = pd.Categorical.from_codes(
+                    self.array(column["codes"]), categories=pd.Index(strings, dtype=object)
+                )
+                continue
+            table = np.empty(len(strings) + 1, dtype=object)
+            table[:-1] = strings
+            table[-1] = np.nan  # code -1 marks a missing value
+            values[column["name"]] = table.take(self.array(column["codes"]))
+
+        data = pd.DataFrame(values)
+        arrays = self.header["index"]
+        index = PincodeIndex.from_arrays(
+            data,
+            np.array(keys, dtype=object),
+            self.array(arrays["order"]),
+            self.array(arrays["offsets"]),
+        )
+        index.numbers = (self.array(arrays["numbers"]), self.array(arrays["number_slots"]))
+        return data, index
+
+
+def find_snapshot(data_file: str) -> Optional[Snapshot]:
+    """
+    Find an up-to-date snapshot for a CSV file.
+
+    Args:
+        data_file: Path to the CSV file
+
+    Returns:
+        The mapped snapshot, or None if there is no usable snapshot
+    """
+    for path in _candidate_paths(data_file):
+        if not os.path.exists(path):
+            continue
+        try:
+            snapshot = Snapshot(path)
+            if _is_current(snapshot.header["source"], data_file):
+                return snapshot
+        except (OSError, ValueError, KeyError):
+            continue
+    return None
+
+
+def load_snapshot(data_file: str,
+                  columns: Optional[Sequence[str]] = None) -> Optional[Tuple[pd.DataFrame, PincodeIndex]]:
+    """
+    Load the data and index for a CSV file from its snapshot.
+
+    Args:
+        data_file: Path to the CSV file
+        columns: Columns to load; None loads every column
+
+    Returns:
+        Tuple of (data, index), or None if there is no usable snapshot
+    """
+    snapshot = find_snapshot(data_file)
+    if snapshot is None:
+        return None
+    try:
+        return snapshot.to_frame(columns)
+    except (OSError, ValueError, KeyError):
+        return None
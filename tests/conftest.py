@@ -0,0 +1,20 @@
+"""
+Shared pytest configuration for pypinindia tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def disable_snapshots(monkeypatch):
+    """Keep mocked CSV reads from being bypassed by an on-disk snapshot."""
+    monkeypatch.setenv("PININ_SNAPSHOT", "0")
+
+
+@pytest.fixture(scope="session")
+def synthetic_csv(tmp_path_factory):
+    """Write a realistic synthetic dataset of 20,000 rows once per test session."""
+    from pinin.datagen import write_csv
+
+    path = tmp_path_factory.mktemp("synthetic") / "pincodes.csv"
+    return write_csv(str(path), rows=20_000, seed=7)
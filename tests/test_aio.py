@@ -0,0 +1,128 @@
+"""
+Tests for the asyncio interface.
+"""
+
+import asyncio
+
+import pytest
+import pandas as pd
+from unittest.mock import patch
+
+from pinin.aio import AsyncPincodeData
+from pinin.exceptions import DataLoadError, DataNotFoundError
+
+
+@pytest.fixture
+def mock_data():
+    """Create mock pincode data."""
+    return pd.DataFrame({
+        'pincode': ['110001', '110001', '400001', '560001'],
+        'officename': ['Connaught Place S.O', 'Parliament Street S.O', 'Mumbai GPO', 'Bangalore GPO'],
+        'statename': ['DELHI', 'DELHI', 'MAHARASHTRA', 'KARNATAKA'],
+        'districtname': ['Central Delhi', 'Central Delhi', 'Mumbai', 'Bangalore'],
+        'taluk': ['New Delhi', 'New Delhi', 'Mumbai', 'Bangalore North'],
+        'officetype': ['S.O', 'S.O', 'H.O', 'H.O'],
+        'Deliverystatus': ['Delivery', 'Non-Delivery', 'Delivery', 'Delivery']
+    })
+
+
+class TestAsyncPincodeData:
+    """Test async loading and lookups."""
+
+    def test_concurrent_callers_share_one_load(self, mock_data):
+        """Test that concurrent lookups on a cold instance load the data once."""
+        async def run():
+            pincodes = AsyncPincodeData()
+            with patch('pandas.read_csv', return_value=mock_data) as read_csv, \
+                 patch('os.path.exists', return_value=True):
+                states = await asyncio.gather(*[pincodes.get_state("110001") for _ in range(10)])
+            return pincodes, states, read_csv.call_count
+
+        pincodes, states, calls = asyncio.run(run())
+        assert states == ['DELHI'] * 10
+        assert calls == 1
+        assert pincodes.loaded
+
+    def test_failed_load_is_retried(self, mock_data):
+        """Test that a failed load does not stick."""
+        async def run():
+            pincodes = AsyncPincodeData()
+            with patch('os.path.exists', return_value=False):
+                with pytest.raises(DataLoadError):
+                    await pincodes.load()
+            with patch('pandas.read_csv', return_value=mock_data), \
+                 patch('os.path.exists', return_value=True):
+                return await pincodes.get_offices("400001")
+
+        assert asyncio.run(run()) == ['Mumbai GPO']
+
+    def test_lookup_errors_propagate(self, mock_data):
+        """Test that lookup errors are raised to the awaiting caller."""
+        async def run():
+            pincodes = AsyncPincodeData()
+            with patch('pandas.read_csv', return_value=mock_data), \
+                 patch('os.path.exists', return_value=True):
+                await pincodes.get_state("999999")
+
+        with pytest.raises(DataNotFoundError):
+            asyncio.run(run())
+
+    def test_bulk_lookups_match_sync(self, mock_data):
+        """Test that chunked bulk lookups give the same results as one pass."""
+        pincodes_in = pd.Series(['110001', 400001, '999999', 'bad', '560001'] * 500,
+                                index=range(1000, 3500))
+
+        async def run():
+            pincodes = AsyncPincodeData(time_slice=1e-6)
+            with patch('pandas.read_csv', return_value=mock_data), \
+                 patch('os.path.exists', return_value=True):
+                data = await pincodes.load()
+            states = await pincodes.get_states_many(pincodes_in)
+            infos = await pincodes.get_pincode_info_many(list(pincodes_in))
+            frame = pd.DataFrame({'pincode': pincodes_in})
+            enriched = await pincodes.enrich(frame, columns=['statename'])
+            return data, states, infos, enriched, frame
+
+        data, states, infos, enriched, frame = asyncio.run(run())
+        assert states.equals(data.get_states_many(pincodes_in))
+        assert len(infos) == len(pincodes_in)
+        assert [type(item) for item in infos] == [type(item) for item in data.get_pincode_info_many(pincodes_in)]
+        assert enriched.equals(data.enrich(frame, columns=['statename']))
+
+    def test_exists_many_in_slices(self, mock_data):
+        """Test chunked existence checks for integer and string input, and that loading warms the index."""
+        numbers = [110001, 110002, 400001, 99999] * 500
+        strings = ['110001', '110 001', 'bad', '560001'] * 500
+
+        async def run():
+            pincodes = AsyncPincodeData(time_slice=1e-6)
+            with patch('pandas.read_csv', return_value=mock_data), \
+                 patch('os.path.exists', return_value=True):
+                data = await pincodes.load()
+            built = set(data._index.__dict__)
+            return (data, built, await pincodes.exists_many(numbers),
+                    await pincodes.exists_many(strings), await pincodes.exists_many([]))
+
+        data, built, from_numbers, from_strings, empty = asyncio.run(run())
+        assert {'numbers', 'bitmap', 'groups'} <= built
+        assert from_numbers.tolist() == data.exists_many(numbers).tolist()
+        assert from_numbers[:4].tolist() == [True, False, True, False]
+        assert from_strings[:4].tolist() == [True, True, False, True]
+        assert len(empty) == 0
+
+    def test_enrich_inplace_not_supported(self, mock_data):
+        """Test that in-place enrichment is rejected."""
+        async def run():
+            await AsyncPincodeData().enrich(pd.DataFrame({'pincode': ['110001']}), inplace=True)
+
+        with pytest.raises(ValueError):
+            asyncio.run(run())
+
+    def test_invalid_time_slice(self):
+        """Test that the time slice must be positive."""
+        with pytest.raises(ValueError):
+            AsyncPincodeData(time_slice=0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
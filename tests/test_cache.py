@@ -0,0 +1,76 @@
+"""
+Tests for the bounded lookup cache.
+"""
+
+import pytest
+
+from pinin.cache import RecordCache
+
+
+class TestRecordCache:
+    """Test cache eviction policies and statistics."""
+
+    def test_lru_evicts_least_recently_used(self):
+        """Test that the LRU policy drops the entry unused for longest."""
+        cache = RecordCache(maxsize=2, policy="lru")
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_lfu_evicts_least_frequently_used(self):
+        """Test that the LFU policy keeps frequently used entries."""
+        cache = RecordCache(maxsize=2, policy="lfu")
+        cache.put("hot", 1)
+        for _ in range(3):
+            cache.get("hot")
+        cache.put("a", 2)
+        cache.put("b", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("hot") == 1
+        assert cache.get("b") == 3
+
+    def test_lfu_breaks_ties_by_recency(self):
+        """Test that among equally used LFU entries the oldest is evicted."""
+        cache = RecordCache(maxsize=2, policy="lfu")
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.get("b")
+        cache.put("c", 3)
+
+        assert cache.get("a") is None
+        assert len(cache) == 2
+
+    def test_info_and_clear(self):
+        """Test hit and miss counters and clearing."""
+        cache = RecordCache(maxsize=4)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        assert tuple(cache.info()) == (1, 1, 4, 1, "lru")
+        cache.clear()
+        assert tuple(cache.info()) == (0, 0, 4, 0, "lru")
+
+    def test_zero_size_stores_nothing(self):
+        """Test that a cache of size 0 is disabled."""
+        cache = RecordCache(maxsize=0, policy="lfu")
+        cache.put("a", 1)
+        assert cache.get("a") is None
+
+    def test_invalid_arguments(self):
+        """Test that bad sizes and policies are rejected."""
+        with pytest.raises(ValueError):
+            RecordCache(maxsize=-1)
+        with pytest.raises(ValueError):
+            RecordCache(policy="fifo")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
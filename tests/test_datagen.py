@@ -0,0 +1,79 @@
+"""
+Tests for the synthetic dataset generator.
+"""
+
+import pytest
+import pandas as pd
+
+from pinin import PincodeData
+from pinin.datagen import COLUMNS, STATES, generate, main, write_csv
+
+
+class TestGenerate:
+    """Test the shape of generated datasets."""
+
+    def test_columns_and_row_count(self):
+        """Test that the requested number of rows is generated with every column."""
+        frame = generate(1_000)
+        assert len(frame) == 1_000
+        assert tuple(frame.columns) == COLUMNS
+        assert not frame.isna().any().any()
+
+    def test_deterministic(self):
+        """Test that the same seed gives the same data and another seed does not."""
+        assert generate(2_000, seed=3).equals(generate(2_000, seed=3))
+        assert not generate(2_000, seed=3).equals(generate(2_000, seed=4))
+
+    def test_pincodes_follow_state_prefixes(self):
+        """Test that pincodes are 6 digits and start with their state's digits."""
+        frame = generate(5_000)
+        assert frame['pincode'].between(110001, 859999).all()
+        leading = {name: prefixes for name, prefixes, _ in STATES}
+        first_two = frame['pincode'] // 10_000
+        assert all(lead in leading[state] for state, lead in zip(frame['statename'], first_two))
+
+    def test_skewed_offices_per_pincode(self):
+        """Test that offices per pincode average about 8 with a long tail."""
+        sizes = generate(50_000)['pincode'].value_counts()
+        assert 7 <= sizes.mean() <= 9
+        assert sizes.max() >= 4 * sizes.median()
+        # Each pincode has exactly one head or sub office listed first
+        frame = generate(5_000)
+        first = frame.groupby('pincode', sort=False)['officetype'].first()
+        assert set(first) <= {'S.O', 'H.O'}
+
+    def test_invalid_row_count(self):
+        """Test that a non-positive row count is rejected."""
+        with pytest.raises(ValueError):
+            generate(0)
+
+
+class TestWriteCsv:
+    """Test writing generated datasets to disk."""
+
+    def test_chunked_file_matches_generate(self, tmp_path):
+        """Test that chunked writing produces the same rows as generating in memory."""
+        path = write_csv(str(tmp_path / "data.csv"), rows=3_000, seed=1, chunk_size=700)
+        assert pd.read_csv(path).equals(generate(3_000, seed=1))
+
+    def test_loads_into_pincode_data(self, synthetic_csv):
+        """Test that a generated file loads and answers lookups."""
+        pincode_data = PincodeData(synthetic_csv)
+        frame = pd.read_csv(synthetic_csv)
+        pincode = str(frame['pincode'].iloc[-1])
+        assert pincode_data.get_state(pincode) == frame['statename'].iloc[-1]
+        assert pincode_data.get_statistics()['total_records'] == len(frame)
+
+    def test_command_line(self, tmp_path, capsys):
+        """Test the command line entry point."""
+        path = tmp_path / "cli.csv"
+        main([str(path), "--rows", "500", "--seed", "2"])
+        assert pd.read_csv(path).equals(generate(500, seed=2))
+
+        with pytest.raises(SystemExit):
+            main([str(path), "--rows", "0"])
+        assert "Error" in capsys.readouterr().err
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,119 @@
+"""
+Tests for the CSV loader.
+"""
+
+import pandas as pd
+import pytest
+
+from pinin import PincodeData
+from pinin.loader import detect_encoding, read_csv, read_header
+
+HEADER = "pincode,officename,statename,districtname,taluk,officetype,Deliverystatus,circlename\n"
+
+
+def write(tmp_path, content: bytes, name: str = "pincodes.csv") -> str:
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+class TestDetectEncoding:
+    """Test single-pass encoding detection."""
+
+    def test_utf8(self, tmp_path):
+        """Test plain UTF-8 and UTF-8 with a byte order mark."""
+        content = (HEADER + "110001,Café S.O,DELHI,Central,New Delhi,S.O,Delivery,Delhi\n").encode("utf-8")
+
+        assert detect_encoding(write(tmp_path, content)) == "utf-8"
+        assert detect_encoding(write(tmp_path, b"\xef\xbb\xbf" + content, "bom.csv")) == "utf-8-sig"
+
+    def test_non_utf8_late_in_file(self, tmp_path):
+        """Test that a cp1252 byte after the first chunk is still found."""
+        rows = "110001,Office,DELHI,Central,New Delhi,S.O,Delivery,Delhi\n" * 40_000
+        content = (HEADER + rows).encode("ascii") + b"110002,Caf\xe9 \x96 B.O,DELHI,C,N,B.O,Delivery,Delhi\n"
+        path = write(tmp_path, content)
+
+        assert detect_encoding(path) == "cp1252"
+        assert read_csv(path)['officename'].iloc[-1] == "Café – B.O"
+
+    def test_latin1_when_cp1252_undefined(self, tmp_path):
+        """Test that bytes undefined in cp1252 fall back to Latin-1."""
+        content = HEADER.encode("ascii") + b"110001,Office \x81,DELHI,C,N,S.O,Delivery,Delhi\n"
+
+        assert detect_encoding(write(tmp_path, content)) == "latin-1"
+
+    def test_unreadable_file(self, tmp_path):
+        """Test that a missing file reports the default encoding."""
+        assert detect_encoding(str(tmp_path / "missing.csv")) == "utf-8"
+
+
+class TestReadHeader:
+    """Test reading the column names of a CSV file."""
+
+    def test_header(self, tmp_path):
+        """Test a UTF-8 file with a byte order mark and a missing file."""
+        path = write(tmp_path, b"\xef\xbb\xbf" + HEADER.encode("utf-8"))
+
+        assert read_header(path) == HEADER.strip().split(",")
+        assert read_header(str(tmp_path / "missing.csv")) is None
+
+
+class TestReadCsv:
+    """Test typed, projected CSV parsing."""
+
+    @pytest.fixture
+    def csv_path(self, tmp_path):
+        content = HEADER + (
+            "011001,Office1,DELHI,Central Delhi,New Delhi,S.O,Delivery,Delhi\n"
+            "400001,Office2,MAHARASHTRA,Mumbai,Mumbai,H.O,Delivery,Maharashtra\n"
+        )
+        return write(tmp_path, content.encode("utf-8"))
+
+    def test_explicit_dtypes(self, csv_path):
+        """Test that pincodes stay strings and name columns are categoricals."""
+        data = read_csv(csv_path, engine="c")
+
+        assert data['pincode'].tolist() == ['011001', '400001']
+        for column in ['statename', 'districtname', 'taluk', 'officetype', 'Deliverystatus', 'circlename']:
+            assert isinstance(data[column].dtype, pd.CategoricalDtype)
+
+    def test_usecols_projection(self, csv_path):
+        """Test that projection parses only the requested columns plus the pincode."""
+        data = read_csv(csv_path, usecols=['statename', 'districtname'], engine="c")
+
+        assert list(data.columns) == ['pincode', 'statename', 'districtname']
+
+    def test_usecols_ignores_absent_columns(self, csv_path):
+        """Test that requesting a column the file lacks is not an error."""
+        data = read_csv(csv_path, usecols=['regionname'])
+
+        assert 'regionname' not in data.columns
+        assert len(data) == 2
+
+    def test_pyarrow_falls_back_to_c_engine(self, csv_path, monkeypatch):
+        """Test that a failing pyarrow engine falls back to the C parser."""
+        calls = []
+        original = pd.read_csv
+
+        def fake_read_csv(*args, **kwargs):
+            calls.append(kwargs.get('engine'))
+            if kwargs.get('engine') == 'pyarrow':
+                raise ImportError("pyarrow is not installed")
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(pd, 'read_csv', fake_read_csv)
+        data = read_csv(csv_path, engine="pyarrow")
+
+        assert calls == ['pyarrow', None]
+        assert len(data) == 2
+
+    def test_unknown_engine(self, csv_path):
+        """Test that unknown engines are rejected."""
+        with pytest.raises(ValueError):
+            read_csv(csv_path, engine="python")
+
+    def test_pincode_data_loads_cp1252_file(self, tmp_path):
+        """Test that PincodeData reads a cp1252 file in one parse."""
+        content = HEADER.encode("ascii") + b"110001,Caf\xe9 S.O,DELHI,Central,New Delhi,S.O,Delivery,Delhi\n"
+
+        assert PincodeData(write(tmp_path, content)).get_offices("110001") == ["Café S.O"]
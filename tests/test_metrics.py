@@ -0,0 +1,151 @@
+"""
+Tests for optional per-operation metrics.
+"""
+
+import pytest
+
+from pinin import PincodeData
+from pinin.exceptions import DataNotFoundError
+from pinin.metrics import LATENCY_BUCKETS, Histogram, MetricEvent, MetricsRecorder
+
+
+class TestHistogram:
+    """Test latency histogram bookkeeping."""
+
+    def test_counts_errors_and_buckets(self):
+        """Test that calls land in the bucket of their upper bound."""
+        histogram = Histogram()
+        histogram.add(3e-6, False)
+        histogram.add(3e-6, False)
+        histogram.add(2.0, True)
+
+        stats = histogram.to_dict()
+        assert stats['count'] == 3
+        assert stats['errors'] == 1
+        assert stats['max_seconds'] == 2.0
+        assert stats['buckets']['5e-06'] == 2
+        assert stats['buckets']['inf'] == 1
+        assert sum(stats['buckets'].values()) == 3
+        assert len(stats['buckets']) == len(LATENCY_BUCKETS)
+
+    def test_percentiles(self):
+        """Test that percentiles report the bucket bound, capped at the maximum."""
+        histogram = Histogram()
+        for _ in range(99):
+            histogram.add(2e-6, False)
+        histogram.add(0.3, False)
+
+        assert histogram.percentile(0.5) == 2.5e-6
+        assert histogram.percentile(0.99) == 2.5e-6
+        assert histogram.percentile(1.0) == 0.3
+        assert Histogram().percentile(0.5) == 0.0
+
+
+class TestMetricsRecorder:
+    """Test the thread-safe metrics collector."""
+
+    def test_wrap_records_calls_and_errors(self):
+        """Test that wrapped functions are timed and errors counted and re-raised."""
+        events = []
+        recorder = MetricsRecorder(events.append)
+
+        def fail():
+            raise KeyError('x')
+
+        assert recorder.wrap('double', lambda x: 2 * x)(4) == 8
+        with pytest.raises(KeyError):
+            recorder.wrap('fail', fail)()
+
+        calls = recorder.snapshot()['calls']
+        assert (calls['double']['count'], calls['double']['errors']) == (1, 0)
+        assert (calls['fail']['count'], calls['fail']['errors']) == (1, 1)
+        assert [(event.kind, event.name, event.error) for event in events] == [
+            ('call', 'double', False), ('call', 'fail', True),
+        ]
+
+    def test_load_and_build_events(self):
+        """Test that load phases keep the latest time and builds keep every time."""
+        recorder = MetricsRecorder()
+        recorder.record(MetricEvent('load', 'read_csv', 0.5))
+        recorder.record_build('groups', 0.1)
+        recorder.record_build('groups', 0.2)
+
+        snapshot = recorder.snapshot()
+        assert snapshot['load'] == {'read_csv': 0.5}
+        assert snapshot['index_builds'] == {'groups': [0.1, 0.2]}
+
+
+class TestPincodeDataMetrics:
+    """Test metrics collected by PincodeData."""
+
+    def test_disabled_by_default(self, synthetic_csv, monkeypatch):
+        """Test that without metrics the methods are not wrapped."""
+        monkeypatch.delenv('PININ_METRICS', raising=False)
+        pincode_data = PincodeData(synthetic_csv)
+        pincode = pincode_data.data['pincode'].iloc[0]
+        pincode_data.get_state(pincode)
+
+        assert 'get_state' not in vars(pincode_data)
+        metrics = pincode_data.get_metrics()
+        assert metrics['enabled'] is False
+        assert metrics['calls'] == {}
+        assert metrics['load'] == {}
+        assert metrics['cache']['misses'] == 1
+
+    def test_calls_cache_and_load_phases(self, synthetic_csv):
+        """Test call counts, cache hit rate and CSV load phases."""
+        pincode_data = PincodeData(synthetic_csv, metrics=True)
+        pincode = pincode_data.data['pincode'].iloc[0]
+        for _ in range(4):
+            pincode_data.get_state(pincode)
+        with pytest.raises(DataNotFoundError):
+            pincode_data.get_state('999999')
+
+        metrics = pincode_data.get_metrics()
+        assert metrics['enabled'] is True
+        assert metrics['calls']['get_state']['count'] == 5
+        assert metrics['calls']['get_state']['errors'] == 1
+        assert metrics['cache']['hit_rate'] == pytest.approx(3 / 5)
+        assert set(metrics['load']) == {'read_csv', 'prepare', 'index', 'total'}
+        assert metrics['load']['total'] >= metrics['load']['read_csv']
+
+    def test_index_builds_and_callback(self, synthetic_csv):
+        """Test that lazy index builds are reported once and events reach the callback."""
+        events = []
+        pincode_data = PincodeData(synthetic_csv, on_metric=events.append)
+        state = pincode_data.get_states()[0]
+        pincode_data.search_by_state(state)
+        pincode_data.search_by_state(state)
+        pincode_data.search_by_office('Nagar')
+
+        builds = pincode_data.get_metrics()['index_builds']
+        assert len(builds['groups']) == 1
+        assert 'names.officename' in builds
+        kinds = {(event.kind, event.name) for event in events}
+        assert ('build', 'groups') in kinds
+        assert ('call', 'search_by_state') in kinds
+        assert ('load', 'total') in kinds
+
+    def test_lazy_iterators_not_timed(self, synthetic_csv):
+        """Test that iter_by_* are left unwrapped, since a call only creates the iterator."""
+        pincode_data = PincodeData(synthetic_csv, metrics=True)
+        prefix = pincode_data.data['pincode'].iloc[0][:3]
+
+        assert list(pincode_data.iter_by_prefix(prefix)) == pincode_data.search_by_prefix(prefix)
+        calls = pincode_data.get_metrics()['calls']
+        assert 'search_by_prefix' in calls
+        assert 'iter_by_prefix' not in calls and 'iter_by_range' not in calls
+
+    def test_snapshot_load_phase(self, synthetic_csv, tmp_path, monkeypatch):
+        """Test that a snapshot load is reported as its own phase."""
+        monkeypatch.setenv('PININ_CACHE_DIR', str(tmp_path))
+        PincodeData(synthetic_csv, use_snapshot=True)
+        pincode_data = PincodeData(synthetic_csv, use_snapshot=True, metrics=True)
+
+        assert set(pincode_data.get_metrics()['load']) == {'snapshot_load', 'total'}
+
+    def test_enabled_from_environment(self, synthetic_csv, monkeypatch):
+        """Test that PININ_METRICS=1 enables metrics."""
+        monkeypatch.setenv('PININ_METRICS', '1')
+
+        assert PincodeData(synthetic_csv).get_metrics()['enabled'] is True
@@ -0,0 +1,87 @@
+"""
+Tests for pincode normalization.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pinin.normalize import REASONS, classify_pincode, normalize_pincodes
+
+CASES = [
+    ("110001", "110001", "ok"),
+    (" 110001 ", "110001", "ok"),
+    ("110 001", "110001", "ok"),
+    ("110-001", "110001", "ok"),
+    ("PIN: 110001", "110001", "ok"),
+    ("Pin Code 560 001", "560001", "ok"),
+    ("110001.0", "110001", "ok"),
+    (110001, "110001", "ok"),
+    (110001.0, "110001", "ok"),
+    ("11 0001", None, "non_numeric"),
+    ("11000A", None, "non_numeric"),
+    (110001.5, None, "non_numeric"),
+    ("12345", None, "bad_length"),
+    ("00110001", None, "bad_length"),
+    ("PIN: 1100011", None, "bad_length"),
+    ("011001", None, "leading_zero"),
+    ("011 001", None, "leading_zero"),
+    ("", None, "missing"),
+    (None, None, "missing"),
+    (float("nan"), None, "missing"),
+]
+
+
+class TestClassifyPincode:
+    """Test single-value normalization."""
+
+    @pytest.mark.parametrize("value, pincode, reason", CASES)
+    def test_cases(self, value, pincode, reason):
+        """Test accepted layouts and reason codes of rejected values."""
+        assert classify_pincode(value) == (pincode, reason)
+
+
+class TestNormalizePincodes:
+    """Test vectorized normalization."""
+
+    def test_matches_single_value_path(self):
+        """Test that the vectorized pass agrees with classify_pincode on every case."""
+        values = [value for value, _, _ in CASES]
+        result = normalize_pincodes(values)
+
+        assert result['reason'].tolist() == [reason for _, _, reason in CASES]
+        pincodes = [None if pd.isna(pincode) else pincode for pincode in result['pincode']]
+        assert pincodes == [pincode for _, pincode, _ in CASES]
+        assert list(result['reason'].cat.categories) == list(REASONS)
+
+    def test_numeric_input(self):
+        """Test integer and float arrays without a per-value pass."""
+        result = normalize_pincodes(np.array([110001, 11001, -560001, 1100011]))
+        assert result['reason'].tolist() == ['ok', 'bad_length', 'non_numeric', 'bad_length']
+
+        floats = pd.Series([110001.0, np.nan, 560001.5], index=['a', 'b', 'c'])
+        result = normalize_pincodes(floats)
+        assert result.index.tolist() == ['a', 'b', 'c']
+        assert result['pincode'].iloc[0] == "110001"
+        assert result['reason'].tolist() == ['ok', 'missing', 'non_numeric']
+
+    def test_infinite_values(self):
+        """Test that infinities are rejected without a floating-point warning."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = normalize_pincodes([np.inf, 110001.0, -np.inf])
+        assert result['reason'].tolist() == ['non_numeric', 'ok', 'non_numeric']
+        assert classify_pincode(float("inf")) == (None, "non_numeric")
+
+    def test_long_values_are_not_truncated(self):
+        """Test that values longer than the vectorized width are still checked in full."""
+        result = normalize_pincodes(["110001" + " " * 20 + "9", "PIN CODE :   110 001  "])
+        assert result['reason'].tolist() == ['non_numeric', 'ok']
+
+    def test_empty_input(self):
+        """Test that no values give an empty result."""
+        result = normalize_pincodes([])
+        assert list(result.columns) == ['pincode', 'reason']
+        assert len(result) == 0
@@ -2,12 +2,20 @@
 Tests for pypinindia library.
 """
 
+import io
+import json
+import os
+import sys
+import threading
+
 import pytest
+import numpy as np
 import pandas as pd
 from unittest.mock import patch, MagicMock
 
 from pinin import (
     PincodeData,
+    PincodeRecord,
     get_pincode_info,
     get_state,
     get_district,
@@ -17,12 +25,16 @@ from pinin import (
     search_by_district,
     get_states,
     get_districts,
+    get_states_many,
 )
 
+from pinin.cli import enrich_stream, main as cli_main
+from pinin.index import edit_distance
 from pinin.exceptions import (
     InvalidPincodeError,
     DataNotFoundError,
     DataLoadError,
+    ColumnNotAvailableError,
 )
 
 
@@ -211,6 +223,391 @@ class TestPincodeLookup:
         """Test get_offices when no data is found for the pincode."""
         result = mock_pincode_data.get_offices("110001")
         assert result != []
+    
+    def test_lookup_cache_hits(self, mock_pincode_data):
+        """Test that repeated lookups are served from the cache."""
+        mock_pincode_data.get_pincode_info("110001")
+        mock_pincode_data.get_state("110001")
+        mock_pincode_data.get_offices("110001")
+        
+        info = mock_pincode_data.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+        assert info.maxsize == 2048 and info.policy == 'lru'
+    
+    def test_lookup_cache_records_are_isolated(self, mock_pincode_data):
+        """Test that modifying a returned record does not affect later lookups."""
+        result = mock_pincode_data.get_pincode_info("110001")
+        result[0]['statename'] = 'CHANGED'
+        result.pop()
+        
+        assert mock_pincode_data.get_pincode_info("110001")[0]['statename'] == 'DELHI'
+        assert len(mock_pincode_data.get_pincode_info("110001")) == 2
+        with pytest.raises(TypeError):
+            mock_pincode_data._get_records("110001")[0]['statename'] = 'CHANGED'
+    
+    def test_lookup_cache_invalidated_when_data_replaced(self, mock_pincode_data):
+        """Test that replacing the data drops cached records."""
+        assert mock_pincode_data.get_state("110001") == 'DELHI'
+        
+        data = mock_pincode_data.data.copy()
+        data['statename'] = 'NEW DELHI'
+        mock_pincode_data.data = data
+        
+        assert mock_pincode_data.get_state("110001") == 'NEW DELHI'
+        assert mock_pincode_data.cache_info().hits == 0
+    
+    def test_lookup_cache_disabled(self):
+        """Test that a cache size of 0 disables caching."""
+        data = pd.DataFrame({
+            'pincode': ['110001'], 'officename': ['Connaught Place S.O'], 'statename': ['DELHI'],
+            'districtname': ['Central Delhi'], 'taluk': ['New Delhi'], 'officetype': ['S.O'],
+            'Deliverystatus': ['Delivery']
+        })
+        with patch('pandas.read_csv', return_value=data), \
+             patch('os.path.exists', return_value=True):
+            pincode_data = PincodeData(cache_size=0)
+        
+        pincode_data.get_state("110001")
+        pincode_data.get_state("110001")
+        assert pincode_data.cache_info().currsize == 0
+        assert pincode_data.cache_info().hits == 0
+
+
+class TestPincodeRecord:
+    """Test the compact record return format."""
+    
+    @pytest.fixture
+    def record_data(self):
+        """Create mock pincode data returning PincodeRecord objects."""
+        data = pd.DataFrame({
+            'pincode': ['110001', '110001', '400001'],
+            'officename': ['Connaught Place S.O', 'Parliament Street S.O', 'Mumbai GPO'],
+            'statename': ['DELHI', 'DELHI', 'MAHARASHTRA'],
+            'districtname': ['Central Delhi', 'Central Delhi', 'Mumbai'],
+            'taluk': ['New Delhi', 'New Delhi', None],
+            'officetype': ['S.O', 'S.O', 'H.O'],
+            'Deliverystatus': ['Delivery', 'Non-Delivery', 'Delivery'],
+            'latitude': [28.63, 28.62, 18.93],
+        })
+        
+        with patch('pandas.read_csv', return_value=data), \
+             patch('os.path.exists', return_value=True):
+            return PincodeData(record_format='record')
+    
+    def test_attribute_and_key_access(self, record_data):
+        """Test reading fields from a record."""
+        records = record_data.get_pincode_info("110001")
+        assert all(isinstance(record, PincodeRecord) for record in records)
+        assert records[1].officename == 'Parliament Street S.O'
+        assert records[1]['Deliverystatus'] == 'Non-Delivery'
+        assert records[0].latitude == 28.63
+        assert type(records[0].latitude) is float
+        assert pd.isna(record_data.get_pincode_info("400001")[0].taluk)
+    
+    def test_to_dict_matches_dict_format(self, record_data):
+        """Test that to_dict gives the same result as the default format."""
+        with patch('pandas.read_csv', return_value=record_data.data), \
+             patch('os.path.exists', return_value=True):
+            dict_data = PincodeData()
+        
+        records = record_data.get_pincode_info("110001")
+        assert [record.to_dict() for record in records] == dict_data.get_pincode_info("110001")
+        assert records[0] == dict_data.get_pincode_info("110001")[0]
+        assert list(records[0].keys()) == list(dict_data.data.columns)
+    
+    def test_record_is_read_only(self, record_data):
+        """Test that records cannot be modified."""
+        record = record_data.get_pincode_info("110001")[0]
+        with pytest.raises(AttributeError):
+            record.statename = 'CHANGED'
+        with pytest.raises(AttributeError):
+            record.population
+        with pytest.raises(KeyError):
+            record['population']
+        assert not hasattr(record, '__dict__')
+    
+    def test_record_pickles_its_fields(self, record_data):
+        """Test that pickling a record does not depend on the dataset."""
+        import pickle
+        record = record_data.get_pincode_info("110001")[0]
+        restored = pickle.loads(pickle.dumps(record))
+        assert restored == record
+        assert restored.officename == 'Connaught Place S.O'
+    
+    def test_batch_and_search_return_records(self, record_data):
+        """Test that batch lookups and office search honour the record format."""
+        results = record_data.get_pincode_info_many(["110001", "999999"])
+        assert [record.officename for record in results[0]] == ['Connaught Place S.O', 'Parliament Street S.O']
+        assert isinstance(results[1], DataNotFoundError)
+        assert record_data.search_by_office("gpo")[0].pincode == '400001'
+        assert record_data.get_state("400001") == 'MAHARASHTRA'
+    
+    def test_invalid_record_format(self):
+        """Test that unknown record formats are rejected."""
+        with pytest.raises(ValueError):
+            PincodeData(record_format='tuple')
+
+
+class TestPincodeIndex:
+    """Test the pincode lookup index."""
+    
+    @pytest.fixture
+    def mock_index_data(self):
+        """Create mock data with pincodes spread out of order."""
+        data = pd.DataFrame({
+            'pincode': ['400001', '110001', '400001', '110002', '110001'],
+            'officename': ['Mumbai GPO', 'Connaught Place S.O', 'Fort S.O', 'Indraprastha S.O', 'Parliament Street S.O'],
+            'statename': ['MAHARASHTRA', 'DELHI', 'MAHARASHTRA', 'DELHI', 'DELHI'],
+            'districtname': ['Mumbai', 'Central Delhi', 'Mumbai', 'Central Delhi', 'Central Delhi'],
+            'taluk': ['Mumbai', 'New Delhi', 'Mumbai', 'New Delhi', 'New Delhi'],
+            'officetype': ['H.O', 'S.O', 'S.O', 'S.O', 'S.O'],
+            'Deliverystatus': ['Delivery', 'Delivery', 'Delivery', 'Delivery', 'Non-Delivery']
+        })
+        
+        with patch('pandas.read_csv', return_value=data), \
+             patch('os.path.exists', return_value=True):
+            return PincodeData()
+    
+    def test_index_built_at_load(self, mock_index_data):
+        """Test that the index is built when data is loaded."""
+        index = mock_index_data._index
+        assert index is not None
+        assert len(index) == 3
+        assert '110001' in index
+        assert '999999' not in index
+    
+    def test_index_positions_keep_file_order(self, mock_index_data):
+        """Test that row positions are grouped by pincode in file order."""
+        index = mock_index_data._index
+        assert index.positions('110001').tolist() == [1, 4]
+        assert index.positions('400001').tolist() == [0, 2]
+        assert index.positions('999999').tolist() == []
+    
+    def test_lookup_uses_index(self, mock_index_data):
+        """Test that lookups return the same rows as a full scan."""
+        result = mock_index_data.get_pincode_info("110001")
+        expected = mock_index_data.data[mock_index_data.data['pincode'] == '110001']
+        assert result == expected.to_dict('records')
+        assert mock_index_data.get_offices("400001") == ['Mumbai GPO', 'Fort S.O']
+    
+    def test_existence_bitmap(self, mock_index_data):
+        """Test that the bitmap is built at load and has one bit per 6-digit code."""
+        index = mock_index_data._index
+        assert 'bitmap' in vars(index)
+        assert index.bitmap.nbytes == 125_000
+        assert index.contains(np.array([110001, 110002, 110003, 400001])).tolist() == [True, True, False, True]
+    
+    def test_index_rebuilt_when_data_replaced(self, mock_index_data):
+        """Test that replacing the data invalidates the index."""
+        mock_index_data.data = mock_index_data.data.iloc[:2].reset_index(drop=True)
+        assert mock_index_data.get_offices("110001") == ['Connaught Place S.O']
+        with pytest.raises(DataNotFoundError):
+            mock_index_data.get_pincode_info("110002")
+        assert mock_index_data.exists("110002") is False
+
+
+class TestBatchLookup:
+    """Test vectorized batch lookups."""
+    
+    @pytest.fixture
+    def mock_batch_data(self):
+        """Create mock data for batch lookups."""
+        data = pd.DataFrame({
+            'pincode': ['110001', '110001', '400001', '560001'],
+            'officename': ['Connaught Place S.O', 'Parliament Street S.O', 'Mumbai GPO', 'Bangalore GPO'],
+            'statename': ['DELHI', 'DELHI', 'MAHARASHTRA', 'KARNATAKA'],
+            'districtname': ['Central Delhi', 'Central Delhi', 'Mumbai', 'Bangalore'],
+            'taluk': ['New Delhi', 'New Delhi', 'Mumbai', 'Bangalore North'],
+            'officetype': ['S.O', 'S.O', 'H.O', 'H.O'],
+            'Deliverystatus': ['Delivery', 'Non-Delivery', 'Delivery', 'Delivery']
+        })
+        
+        with patch('pandas.read_csv', return_value=data), \
+             patch('os.path.exists', return_value=True):
+            return PincodeData()
+    
+    def test_get_states_many_list(self, mock_batch_data):
+        """Test batch state lookup with mixed valid, unknown and invalid input."""
+        result = mock_batch_data.get_states_many(["110001", 400001, "999999", "abc", "560001"])
+        assert result.tolist() == ['DELHI', 'MAHARASHTRA', None, None, 'KARNATAKA']
+        assert result.isna().tolist() == [False, False, True, True, False]
+    
+    def test_get_states_many_keeps_series_index(self, mock_batch_data):
+        """Test that a Series input keeps its index."""
+        pincodes = pd.Series(['560001', '110001'], index=['a', 'b'])
+        result = mock_batch_data.get_states_many(pincodes)
+        assert result.index.tolist() == ['a', 'b']
+        assert result.tolist() == ['KARNATAKA', 'DELHI']
+    
+    def test_get_districts_many_numpy(self, mock_batch_data):
+        """Test batch district lookup with a NumPy array."""
+        result = mock_batch_data.get_districts_many(np.array([400001, 110001]))
+        assert result.tolist() == ['Mumbai', 'Central Delhi']
+    
+    def test_get_pincode_info_many(self, mock_batch_data):
+        """Test batch info lookup returns aligned records and per-item errors."""
+        result = mock_batch_data.get_pincode_info_many(["400001", "12345", "110001", "999999"])
+        assert len(result) == 4
+        assert result[0] == mock_batch_data.get_pincode_info("400001")
+        assert isinstance(result[1], InvalidPincodeError)
+        assert result[2] == mock_batch_data.get_pincode_info("110001")
+        assert isinstance(result[3], DataNotFoundError)
+    
+    def test_batch_empty_input(self, mock_batch_data):
+        """Test batch lookups with no pincodes."""
+        assert mock_batch_data.get_pincode_info_many([]) == []
+        assert mock_batch_data.get_taluks_many([]).tolist() == []
+    
+    def test_enrich_default_columns(self, mock_batch_data):
+        """Test enriching a DataFrame with mixed pincode representations."""
+        df = pd.DataFrame({'pin': [110001, 400001.0, '560001', '999999', None], 'qty': [1, 2, 3, 4, 5]})
+        result = mock_batch_data.enrich(df, column='pin')
+        
+        assert result['statename'].tolist()[:3] == ['DELHI', 'MAHARASHTRA', 'KARNATAKA']
+        assert result['districtname'].tolist()[:3] == ['Central Delhi', 'Mumbai', 'Bangalore']
+        assert result['office_count'].tolist() == [2, 1, 1, 0, 0]
+        assert result['taluk'].isna().tolist() == [False, False, False, True, True]
+        assert list(df.columns) == ['pin', 'qty']  # caller's frame untouched
+    
+    def test_enrich_selected_columns_with_prefix(self, mock_batch_data):
+        """Test choosing the output columns and prefixing their names."""
+        df = pd.DataFrame({'pincode': ['110001', '400001']}, index=[10, 20])
+        result = mock_batch_data.enrich(df, columns=['statename', 'officetype'], prefix='pin_')
+        
+        assert list(result.columns) == ['pincode', 'pin_statename', 'pin_officetype']
+        assert result.index.tolist() == [10, 20]
+        assert result['pin_officetype'].tolist() == ['S.O', 'H.O']
+    
+    def test_enrich_inplace(self, mock_batch_data):
+        """Test adding the columns to the caller's frame."""
+        df = pd.DataFrame({'pincode': ['560001']})
+        result = mock_batch_data.enrich(df, columns=['statename'], inplace=True)
+        assert result is df
+        assert df['statename'].tolist() == ['KARNATAKA']
+    
+    def test_enrich_invalid_arguments(self, mock_batch_data):
+        """Test enrich with a missing pincode column or unknown output column."""
+        df = pd.DataFrame({'pincode': ['110001']})
+        with pytest.raises(ValueError):
+            mock_batch_data.enrich(df, column='zip')
+        with pytest.raises(ValueError):
+            mock_batch_data.enrich(df, columns=['population'])
+    
+    def test_normalize_pincodes(self, mock_batch_data):
+        """Test that normalization reports unknown pincodes and keeps the index."""
+        pincodes = pd.Series(["110 001", "PIN: 400001", "999999", "011001", 560001.0], index=list('abcde'))
+        result = mock_batch_data.normalize_pincodes(pincodes)
+        
+        assert result.index.tolist() == list('abcde')
+        assert result['reason'].tolist() == ['ok', 'ok', 'unknown', 'leading_zero', 'ok']
+        assert result['pincode'].tolist()[:2] == ['110001', '400001']
+        assert result['pincode'].isna().tolist() == [False, False, True, True, False]
+    
+    def test_messy_input_is_looked_up(self, mock_batch_data):
+        """Test that single and batch lookups accept the same layouts."""
+        assert mock_batch_data.get_state("PIN: 110-001") == 'DELHI'
+        assert mock_batch_data.get_states_many(["110 001", "11 0001"]).tolist() == ['DELHI', None]
+        with pytest.raises(InvalidPincodeError):
+            mock_batch_data.get_state("11 0001")
+        with pytest.raises(InvalidPincodeError):
+            mock_batch_data.get_state("011001")
+    
+    def test_exists(self, mock_batch_data):
+        """Test existence checks that never raise."""
+        assert mock_batch_data.exists("110001") is True
+        assert mock_batch_data.exists(560001) is True
+        assert mock_batch_data.exists("PIN: 400 001") is True
+        for value in ["999999", "12345", "abc", None, "", 110001.5]:
+            assert mock_batch_data.exists(value) is False
+    
+    def test_exists_many(self, mock_batch_data):
+        """Test vectorized existence checks on integer and mixed input."""
+        result = mock_batch_data.exists_many(np.array([110001, 999999, 400001, -1, 10_000_000]))
+        assert result.tolist() == [True, False, True, False, False]
+        
+        result = mock_batch_data.exists_many(pd.Series(["560001", "110 001", "011001", None], index=list('abcd')))
+        assert result.tolist() == [True, True, False, False]
+        assert mock_batch_data.exists_many([]).tolist() == []
+    
+    @patch('pinin.core._get_default_instance')
+    def test_get_states_many_convenience(self, mock_get_instance):
+        """Test convenience function for batch state lookup."""
+        mock_instance = MagicMock()
+        mock_instance.get_states_many.return_value = pd.Series(['DELHI'])
+        mock_get_instance.return_value = mock_instance
+        
+        result = get_states_many(["110001"])
+        assert result.tolist() == ['DELHI']
+        mock_instance.get_states_many.assert_called_once_with(["110001"])
+
+
+class TestEnrichStream:
+    """Test streaming bulk enrichment used by the CLI."""
+    
+    @pytest.fixture
+    def mock_stream_data(self):
+        """Create mock data for stream enrichment."""
+        data = pd.DataFrame({
+            'pincode': ['110001', '110001', '400001'],
+            'officename': ['Connaught Place S.O', 'Parliament Street S.O', 'Mumbai GPO'],
+            'statename': ['DELHI', 'DELHI', 'MAHARASHTRA'],
+            'districtname': ['Central Delhi', 'Central Delhi', 'Mumbai'],
+            'taluk': ['New Delhi', 'New Delhi', 'Mumbai'],
+            'officetype': ['S.O', 'S.O', 'H.O'],
+            'Deliverystatus': ['Delivery', 'Non-Delivery', 'Delivery']
+        })
+        
+        with patch('pandas.read_csv', return_value=data), \
+             patch('os.path.exists', return_value=True):
+            return PincodeData()
+    
+    def test_enrich_stream_csv_in_chunks(self, mock_stream_data):
+        """Test that CSV input is enriched chunk by chunk with a single header."""
+        source = io.StringIO("pin,qty\n110001,1\n999999,2\n400001,3\n")
+        destination = io.StringIO()
+        
+        stats = enrich_stream(mock_stream_data, source, destination, column='pin',
+                              columns=['statename'], chunk_size=2)
+        
+        assert destination.getvalue().splitlines() == [
+            'pin,qty,statename', '110001,1,DELHI', '999999,2,', '400001,3,MAHARASHTRA'
+        ]
+        assert stats['rows'] == 3
+        assert stats['misses'] == 1
+    
+    def test_enrich_stream_ndjson(self, mock_stream_data):
+        """Test NDJSON input and output."""
+        source = io.StringIO('{"pincode": 400001}\n{"pincode": "bad"}\n')
+        destination = io.StringIO()
+        
+        stats = enrich_stream(mock_stream_data, source, destination, fmt='ndjson', chunk_size=1)
+        
+        rows = [json.loads(line) for line in destination.getvalue().splitlines()]
+        assert rows[0]['statename'] == 'MAHARASHTRA'
+        assert rows[0]['office_count'] == 1
+        assert rows[1]['statename'] is None
+        assert stats['misses'] == 1
+
+
+class TestEnrichCommand:
+    """Test the --enrich command line mode."""
+    
+    def test_verbose_enrich_to_stdout(self, synthetic_csv, tmp_path, capsys):
+        """Test that verbose messages do not end up in enriched CSV on stdout."""
+        pincode = PincodeData(synthetic_csv).data['pincode'].iloc[0]
+        orders = tmp_path / "orders.csv"
+        orders.write_text(f"pincode,qty\n{pincode},1\n999999,2\n")
+        argv = ['pypinindia', '--enrich', str(orders), '--columns', 'statename',
+                '--data-file', synthetic_csv, '--verbose', '--no-daemon']
+        
+        with patch.object(sys, 'argv', argv):
+            cli_main()
+        captured = capsys.readouterr()
+        
+        lines = captured.out.splitlines()
+        assert lines[0] == 'pincode,qty,statename'
+        assert [line.split(',')[:2] for line in lines[1:]] == [[pincode, '1'], ['999999', '2']]
+        assert f"Using custom data file: {synthetic_csv}" in captured.err
 
 
 class TestSearchFunctionality:
@@ -277,6 +674,51 @@ class TestSearchFunctionality:
         assert len(result) == 1
         assert 'Central Delhi' in result
     
+    def test_search_results_are_independent_copies(self, mock_search_data):
+        """Test that mutating a result does not affect later calls."""
+        result = mock_search_data.search_by_state("DELHI")
+        result.append('999999')
+        mock_search_data.get_districts("delhi").clear()
+        assert mock_search_data.search_by_state("delhi") == ['110001', '110002']
+        assert mock_search_data.get_districts("DELHI") == ['Central Delhi']
+    
+    def test_search_by_district_wrong_state(self, mock_search_data):
+        """Test district search narrowed to a state that does not contain it."""
+        assert mock_search_data.search_by_district("mumbai", "delhi") == []
+        assert mock_search_data.search_by_district("mumbai", "maharashtra") == ['400001', '400002']
+    
+    def test_search_by_office(self, mock_search_data):
+        """Test case-insensitive partial office name search."""
+        result = mock_search_data.search_by_office("mumbai off")
+        assert [r['officename'] for r in result] == ['Mumbai Office 1', 'Mumbai Office 2']
+        assert len(mock_search_data.search_by_office("Office")) == 4
+        assert mock_search_data.search_by_office("Chennai") == []
+    
+    def test_search_by_office_short_query(self, mock_search_data):
+        """Test queries shorter than a trigram."""
+        result = mock_search_data.search_by_office("2")
+        assert [r['pincode'] for r in result] == ['110002', '400002']
+    
+    def test_search_by_office_literal(self, mock_search_data):
+        """Test that the query is not interpreted as a regular expression."""
+        assert mock_search_data.search_by_office("Office .") == []
+        assert mock_search_data.search_by_office("(") == []
+    
+    def test_search_by_office_limit(self, mock_search_data):
+        """Test limiting the number of returned records."""
+        result = mock_search_data.search_by_office("office", limit=3)
+        assert [r['pincode'] for r in result] == ['110001', '110002', '400001']
+        assert mock_search_data.search_by_office("office", limit=0) == []
+    
+    def test_search_by_office_limit_is_prefix(self, synthetic_csv):
+        """Test that a limited search returns the first rows of the full result."""
+        pincode_data = PincodeData(synthetic_csv)
+        
+        for query in ["a", "PUR", "nagar", "s.o", "zzz"]:
+            full = pincode_data.search_by_office(query)
+            for limit in [1, 7, 300, len(full) + 1]:
+                assert pincode_data.search_by_office(query, limit=limit) == full[:limit]
+    
     def test_search_by_state_empty_result(self, mock_search_data):
         """Test search_by_state when no data is found for the state."""
         with patch.object(mock_search_data, '_get_matching_rows', return_value=pd.DataFrame()):
@@ -300,9 +742,99 @@ class TestSearchFunctionality:
         with patch.object(mock_search_data, 'data', pd.DataFrame()):
             result = mock_search_data.get_districts()
             assert len(result) == 0
+    
+    def test_search_by_prefix(self, mock_search_data):
+        """Test searching pincodes by leading digits."""
+        assert mock_search_data.search_by_prefix("1100") == ['110001', '110002']
+        assert mock_search_data.search_by_prefix(4) == ['400001', '400002']
+        assert mock_search_data.search_by_prefix("400002") == ['400002']
+        assert mock_search_data.search_by_prefix("5") == []
+    
+    def test_search_by_prefix_invalid(self, mock_search_data):
+        """Test that malformed prefixes are rejected."""
+        for prefix in ["", "11a", "1100011"]:
+            with pytest.raises(InvalidPincodeError):
+                mock_search_data.search_by_prefix(prefix)
+    
+    def test_search_by_range(self, mock_search_data):
+        """Test searching pincodes in an inclusive range."""
+        assert mock_search_data.search_by_range("110002", 400001) == ['110002', '400001']
+        assert mock_search_data.search_by_range("100000", "999999") == ['110001', '110002', '400001', '400002']
+        assert mock_search_data.search_by_range("400002", "110001") == []
+        with pytest.raises(InvalidPincodeError):
+            mock_search_data.search_by_range("1100", "400001")
+    
+    def test_iter_by_prefix_and_range(self, mock_search_data):
+        """Test the lazy variants of prefix and range search."""
+        assert list(mock_search_data.iter_by_prefix("4")) == ['400001', '400002']
+        assert list(mock_search_data.iter_by_range("110001", "110002")) == ['110001', '110002']
+        with pytest.raises(InvalidPincodeError):
+            mock_search_data.iter_by_prefix("x")
+    
+    def test_search_by_prefix_skips_malformed_pincodes(self, mock_search_data):
+        """Test that rows with malformed pincodes are not matched by prefix or range."""
+        data = mock_search_data.data.copy()
+        data['pincode'] = ['11000', '110002', '4000010', '400002']
+        with patch.object(mock_search_data, 'data', data):
+            assert mock_search_data.search_by_prefix("1") == ['110002']
+            assert mock_search_data.search_by_range("100000", "999999") == ['110002', '400002']
 
 
 
+class TestFuzzySearch:
+    """Test fuzzy name matching."""
+    
+    @pytest.fixture
+    def mock_fuzzy_data(self):
+        """Create mock data with similar office and district names."""
+        data = pd.DataFrame({
+            'pincode': ['110001', '110001', '560001', '560002', '400001'],
+            'officename': ['Connaught Place S.O', 'Parliament Street S.O', 'Bangalore GPO', 'Bengaluru City S.O', 'Mumbai GPO'],
+            'statename': ['DELHI', 'DELHI', 'KARNATAKA', 'KARNATAKA', 'MAHARASHTRA'],
+            'districtname': ['Central Delhi', 'Central Delhi', 'Bengaluru Urban', 'Bengaluru Urban', 'Mumbai'],
+            'taluk': ['New Delhi', 'New Delhi', 'Bangalore North', 'Bangalore South', 'Mumbai'],
+            'officetype': ['S.O', 'S.O', 'H.O', 'S.O', 'H.O'],
+            'Deliverystatus': ['Delivery', 'Delivery', 'Delivery', 'Delivery', 'Delivery']
+        })
+        
+        with patch('pandas.read_csv', return_value=data), \
+             patch('os.path.exists', return_value=True):
+            return PincodeData()
+    
+    def test_fuzzy_search_office_typo(self, mock_fuzzy_data):
+        """Test that a misspelled office name finds the intended office first."""
+        result = mock_fuzzy_data.fuzzy_search('officename', 'Conaught Plce S.O', k=2)
+        assert result[0]['value'] == 'Connaught Place S.O'
+        assert result[0]['distance'] == 2
+        assert result[0]['records'] == 1
+        assert len(result) == 2
+    
+    def test_fuzzy_search_district_case_insensitive(self, mock_fuzzy_data):
+        """Test matching a district regardless of case."""
+        result = mock_fuzzy_data.fuzzy_search('districtname', 'bengaluru urbn', k=1)
+        assert result == [{'value': 'Bengaluru Urban', 'distance': 1,
+                           'similarity': result[0]['similarity'], 'records': 2}]
+        assert 0 < result[0]['similarity'] < 1
+    
+    def test_fuzzy_search_max_distance(self, mock_fuzzy_data):
+        """Test that matches beyond max_distance are dropped."""
+        result = mock_fuzzy_data.fuzzy_search('districtname', 'Mumbay', max_distance=1)
+        assert [match['value'] for match in result] == ['Mumbai']
+        assert mock_fuzzy_data.fuzzy_search('districtname', 'Chennai', max_distance=1) == []
+    
+    def test_fuzzy_search_invalid_field(self, mock_fuzzy_data):
+        """Test searching a field that is not in the dataset."""
+        with pytest.raises(ValueError):
+            mock_fuzzy_data.fuzzy_search('population', 'Delhi')
+    
+    def test_edit_distance(self):
+        """Test the edit distance helper."""
+        assert edit_distance("KITTEN", "SITTING") == 3
+        assert edit_distance("", "ABC") == 3
+        assert edit_distance("SAME", "SAME") == 0
+        assert edit_distance("KITTEN", "SITTING", max_distance=1) == 2
+
+
 class TestConvenienceFunctions:
     """Test convenience functions."""
     
@@ -343,6 +875,49 @@ class TestConvenienceFunctions:
         assert instance1 is instance2
         MockPincodeData.assert_called_once()
     
+    def test_get_default_instance_concurrent_first_calls(self):
+        """Test that concurrent first calls create the default instance once."""
+        import threading
+        import time
+        from pinin.core import _get_default_instance
+        
+        created = []
+        
+        def slow_pincode_data():
+            created.append(threading.get_ident())
+            time.sleep(0.05)
+            return MagicMock()
+        
+        _get_default_instance.cache_clear()
+        results = []
+        with patch('pinin.core.PincodeData', side_effect=slow_pincode_data):
+            threads = [threading.Thread(target=lambda: results.append(_get_default_instance())) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        _get_default_instance.cache_clear()
+        
+        assert len(created) == 1
+        assert len(results) == 8 and all(result is results[0] for result in results)
+    
+    @patch('pinin.core.PincodeData')
+    def test_preload(self, MockPincodeData):
+        """Test loading the default instance ahead of time."""
+        from pinin import preload
+        from pinin.core import _get_default_instance
+        
+        _get_default_instance.cache_clear()
+        assert preload() is None
+        assert _get_default_instance.loaded
+        
+        _get_default_instance.cache_clear()
+        thread = preload(background=True)
+        thread.join()
+        assert _get_default_instance() is MockPincodeData.return_value
+        assert MockPincodeData.call_count == 2
+        _get_default_instance.cache_clear()
+    
     @patch('pinin.core._get_default_instance')
     def test_convenience_functions_handle_exceptions(self, mock_get_instance):
         """Test that convenience functions handle exceptions from PincodeData."""
@@ -388,6 +963,30 @@ class TestStatistics:
         assert stats['unique_districts'] == 2 # Central Delhi, Mumbai
         assert stats['unique_offices'] == 4   # All offices are unique
     
+    def test_repeated_columns_stored_as_categoricals(self, mock_stats_data):
+        """Test that repeated string columns are compacted but read back as plain strings."""
+        for column in ['statename', 'districtname', 'taluk', 'officetype', 'Deliverystatus']:
+            assert isinstance(mock_stats_data.data[column].dtype, pd.CategoricalDtype)
+        
+        info = mock_stats_data.get_pincode_info("110001")
+        assert type(info[0]['statename']) is str
+        assert type(mock_stats_data.get_district("400001")) is str
+        assert mock_stats_data.get_states() == ['DELHI', 'MAHARASHTRA']
+    
+    def test_get_statistics_memory_footprint(self, mock_stats_data):
+        """Test that statistics report memory before and after compaction."""
+        stats = mock_stats_data.get_statistics()
+        assert 0 < stats['memory_bytes']
+        assert 0 < stats['uncompacted_memory_bytes']
+    
+    def test_memory_footprint_measured_at_load(self, mock_stats_data):
+        """Test that the footprint is measured once at load, not on every call."""
+        with patch('pinin.core._memory_footprint') as measure:
+            first = mock_stats_data.get_statistics()
+            second = mock_stats_data.get_statistics()
+        measure.assert_not_called()
+        assert first['memory_bytes'] == second['memory_bytes']
+    
     def test_get_statistics_empty_dataset(self, mock_stats_data):
         """Test get_statistics when the dataset is empty."""
         with patch.object(mock_stats_data, 'data', pd.DataFrame()):
@@ -399,6 +998,293 @@ class TestStatistics:
             assert stats['unique_offices'] == 0
 
 
+class TestReload:
+    """Test reloading the dataset in place."""
+    
+    @pytest.fixture
+    def data_files(self, tmp_path):
+        """Write an original and an updated dataset."""
+        original = pd.DataFrame({
+            'pincode': ['110001', '110001', '110002', '400001'],
+            'officename': ['Office1', 'Office2', 'Office3', 'Office4'],
+            'statename': ['DELHI', 'DELHI', 'DELHI', 'MAHARASHTRA'],
+            'districtname': ['Central Delhi', 'Central Delhi', 'Central Delhi', 'Mumbai'],
+            'taluk': ['New Delhi', 'New Delhi', 'New Delhi', 'Mumbai'],
+            'officetype': ['S.O', 'S.O', 'S.O', 'S.O'],
+            'Deliverystatus': ['Delivery', 'Delivery', 'Delivery', 'Delivery']
+        })
+        updated = original.copy()
+        updated.loc[3, 'officename'] = 'Office4 Renamed'
+        updated = pd.concat([updated, updated.iloc[[2]].assign(pincode='110003')], ignore_index=True)
+        
+        current = tmp_path / "current.csv"
+        original.to_csv(current, index=False)
+        update = tmp_path / "update.csv"
+        updated.to_csv(update, index=False)
+        return str(current), str(update)
+    
+    def test_reload_swaps_data_and_reports_changes(self, data_files):
+        """Test that reload serves the new data and counts changed rows and pincodes."""
+        current, update = data_files
+        pincode_data = PincodeData(current)
+        assert pincode_data.get_offices("400001") == ['Office4']
+        
+        result = pincode_data.reload(update)
+        
+        assert pincode_data.get_offices("400001") == ['Office4 Renamed']
+        assert pincode_data.get_state("110003") == 'DELHI'
+        assert result.records == 5
+        assert (result.added, result.removed, result.changed_pincodes) == (2, 1, 2)
+        assert result.seconds > 0
+        assert pincode_data.cache_info().currsize == 2
+    
+    def test_reload_warms_lazy_indexes(self, data_files):
+        """Test that indexes built before a reload are rebuilt before the swap."""
+        current, update = data_files
+        pincode_data = PincodeData(current)
+        pincode_data.search_by_state('DELHI')
+        pincode_data.search_by_office('Office')
+        
+        pincode_data.reload(update)
+        
+        index = pincode_data._get_index()
+        assert 'groups' in vars(index)
+        assert 'officename' in index._names
+        assert pincode_data.search_by_state('DELHI') == ['110001', '110002', '110003']
+    
+    def test_failed_reload_keeps_current_data(self, data_files, tmp_path):
+        """Test that a reload error leaves the loaded data in place."""
+        current, _ = data_files
+        pincode_data = PincodeData(current)
+        
+        with pytest.raises(DataLoadError):
+            pincode_data.reload(str(tmp_path / "missing.csv"))
+        
+        assert pincode_data.get_state("400001") == 'MAHARASHTRA'
+        assert pincode_data._data_file == current
+    
+    def test_readers_during_reload(self, data_files):
+        """Test that concurrent lookups always see one complete dataset."""
+        current, update = data_files
+        pincode_data = PincodeData(current)
+        errors = []
+        stop = threading.Event()
+        
+        def reader():
+            while not stop.is_set():
+                try:
+                    offices = pincode_data.get_offices("400001")
+                    if offices not in (['Office4'], ['Office4 Renamed']):
+                        errors.append(offices)
+                except Exception as e:  # noqa: BLE001
+                    errors.append(e)
+        
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for path in [update, current, update]:
+            pincode_data.reload(path)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
+        assert pincode_data.get_offices("400001") == ['Office4 Renamed']
+    
+    def test_watch_reloads_changed_file(self, data_files):
+        """Test that the watcher picks up a replaced data file."""
+        current, update = data_files
+        pincode_data = PincodeData(current)
+        reloaded = threading.Event()
+        
+        pincode_data.watch(interval=0.05, on_reload=lambda result: reloaded.set())
+        try:
+            os.replace(update, current)
+            assert reloaded.wait(5)
+        finally:
+            pincode_data.stop_watching()
+        
+        assert pincode_data.get_state("110003") == 'DELHI'
+    
+    def test_watch_rejects_bad_interval(self, data_files):
+        """Test that the watch interval must be positive."""
+        with pytest.raises(ValueError):
+            PincodeData(data_files[0]).watch(interval=0)
+
+
+class TestColumnProjection:
+    """Test loading a subset of the columns."""
+    
+    @pytest.fixture
+    def data_file(self, tmp_path):
+        """Write a small dataset with every column."""
+        data = pd.DataFrame({
+            'pincode': ['110001', '110001', '400001'],
+            'officename': ['Office1', 'Office2', 'Office3'],
+            'statename': ['DELHI', 'DELHI', 'MAHARASHTRA'],
+            'districtname': ['Central Delhi', 'Central Delhi', 'Mumbai'],
+            'taluk': ['New Delhi', 'New Delhi', 'Mumbai'],
+            'officetype': ['S.O', 'B.O', 'H.O'],
+            'Deliverystatus': ['Delivery', 'Delivery', 'Delivery'],
+            'circlename': ['Delhi', 'Delhi', 'Maharashtra']
+        })
+        path = tmp_path / "pincodes.csv"
+        data.to_csv(path, index=False)
+        return str(path)
+    
+    def test_minimal_profile(self, data_file):
+        """Test that the minimal profile keeps only pincode, state and district."""
+        pincode_data = PincodeData(data_file, columns='minimal')
+        
+        assert list(pincode_data.data.columns) == ['pincode', 'statename', 'districtname']
+        assert pincode_data.get_state("110001") == 'DELHI'
+        assert pincode_data.get_district("400001") == 'Mumbai'
+        assert pincode_data.search_by_state("delhi") == ['110001']
+        assert pincode_data.get_districts("MAHARASHTRA") == ['Mumbai']
+        assert pincode_data.get_pincode_info("400001") == [
+            {'pincode': '400001', 'statename': 'MAHARASHTRA', 'districtname': 'Mumbai'}
+        ]
+    
+    def test_dropped_columns_raise(self, data_file):
+        """Test that methods needing a dropped column say which one."""
+        pincode_data = PincodeData(data_file, columns='minimal')
+        
+        with pytest.raises(ColumnNotAvailableError) as excinfo:
+            pincode_data.get_taluk("110001")
+        assert excinfo.value.column == 'taluk'
+        with pytest.raises(ColumnNotAvailableError):
+            pincode_data.get_offices("110001")
+        with pytest.raises(ColumnNotAvailableError):
+            pincode_data.search_by_office("Office")
+        with pytest.raises(ColumnNotAvailableError):
+            pincode_data.fuzzy_search('officename', "Ofice")
+        with pytest.raises(ColumnNotAvailableError):
+            pincode_data.get_taluks_many(["110001"])
+        with pytest.raises(ColumnNotAvailableError):
+            pincode_data.enrich(pd.DataFrame({'pincode': ["110001"]}), columns=['taluk'])
+    
+    def test_enrich_typo_with_projection(self, data_file):
+        """Test that a misspelt column is still unknown when a projection is active."""
+        pincode_data = PincodeData(data_file, columns='minimal')
+        frame = pd.DataFrame({'pincode': ["110001"]})
+        
+        with pytest.raises(ValueError, match="Unknown enrichment columns"):
+            pincode_data.enrich(frame, columns=['statenme'])
+        with pytest.raises(ColumnNotAvailableError) as excinfo:
+            pincode_data.enrich(frame, columns=['statenme', 'circlename'])
+        assert excinfo.value.column == 'circlename'
+    
+    def test_enrich_dropped_custom_column(self, data_file, tmp_path):
+        """Test that columns outside the usual schema are recognized from the file header."""
+        data = pd.read_csv(data_file, dtype=str)
+        data['landmark'] = 'Gate'
+        path = tmp_path / "custom.csv"
+        data.to_csv(path, index=False)
+        pincode_data = PincodeData(str(path), columns='minimal')
+        
+        with pytest.raises(ColumnNotAvailableError) as excinfo:
+            pincode_data.enrich(pd.DataFrame({'pincode': ["110001"]}), columns=['landmark'])
+        assert excinfo.value.column == 'landmark'
+    
+    def test_enrich_defaults_to_loaded_columns(self, data_file):
+        """Test that enrich adds only the default columns that were loaded."""
+        pincode_data = PincodeData(data_file, columns='minimal')
+        
+        result = pincode_data.enrich(pd.DataFrame({'pincode': ["110001", "999999"]}))
+        
+        assert list(result.columns) == ['pincode', 'statename', 'districtname', 'office_count']
+        assert result['office_count'].tolist() == [2, 0]
+    
+    def test_column_list_and_statistics(self, data_file):
+        """Test a custom column list and statistics without dropped columns."""
+        full = PincodeData(data_file)
+        projected = PincodeData(data_file, columns=['officename', 'statename'])
+        
+        assert list(projected.data.columns) == ['pincode', 'officename', 'statename']
+        assert projected.get_offices("110001") == ['Office1', 'Office2']
+        with pytest.raises(ColumnNotAvailableError):
+            projected.get_states()
+        
+        stats = projected.get_statistics()
+        assert 'unique_districts' not in stats
+        assert stats['unique_offices'] == 3
+        assert stats['memory_bytes'] < full.get_statistics()['memory_bytes']
+    
+    def test_full_and_unknown_profiles(self, data_file):
+        """Test that 'full' keeps every column and unknown profiles are rejected."""
+        assert 'circlename' in PincodeData(data_file, columns='full').data.columns
+        assert 'circlename' not in PincodeData(data_file, columns='standard').data.columns
+        with pytest.raises(ValueError):
+            PincodeData(data_file, columns='tiny')
+    
+    def test_missing_selected_column(self, data_file):
+        """Test that selecting a column the file lacks fails to load."""
+        with pytest.raises(DataLoadError):
+            PincodeData(data_file, columns=['regionname'])
+    
+    def test_projected_snapshot(self, data_file):
+        """Test that snapshots hold every column and serve projected loads."""
+        written = PincodeData(data_file, use_snapshot=True, columns='minimal')
+        loaded = PincodeData(data_file, use_snapshot=True, columns='minimal')
+        full = PincodeData(data_file, use_snapshot=True)
+        
+        for pincode_data in (written, loaded):
+            assert list(pincode_data.data.columns) == ['pincode', 'statename', 'districtname']
+            assert pincode_data.get_state("400001") == 'MAHARASHTRA'
+        assert full.get_offices("110001") == ['Office1', 'Office2']
+
+
+class TestSuggest:
+    """Test suggestions for mistyped pincodes."""
+    
+    @pytest.fixture
+    def mock_suggest_data(self):
+        """Create mock data with pincodes one typo apart."""
+        data = pd.DataFrame({
+            'pincode': ['110001', '110001', '110001', '101001', '110007', '110002', '110050',
+                        '110011', '110011', '560001'],
+            'officename': ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J'],
+            'statename': ['DELHI'] * 9 + ['KARNATAKA'],
+            'districtname': ['Central Delhi'] * 9 + ['Bangalore'],
+            'taluk': ['New Delhi'] * 9 + ['Bangalore North'],
+            'officetype': ['S.O'] * 10,
+            'Deliverystatus': ['Delivery'] * 10
+        })
+        
+        with patch('pandas.read_csv', return_value=data), \
+             patch('os.path.exists', return_value=True):
+            return PincodeData()
+    
+    def test_ranked_by_edit_then_office_count(self, mock_suggest_data):
+        """Test that suggestions are ranked by edit kind, then office count, then distance."""
+        result = mock_suggest_data.suggest("110010", k=10)
+        
+        assert result[0] == {'pincode': '110001', 'edit': 'transposition', 'records': 3}
+        assert [item['edit'] for item in result] == ['transposition', 'substitution', 'substitution',
+                                                     'nearby', 'nearby']
+        assert [item['pincode'] for item in result[1:]] == ['110011', '110050', '110007', '110002']
+    
+    def test_nearby_stays_in_sorting_district(self, mock_suggest_data):
+        """Test that numerically close pincodes outside the 3-digit district are not suggested."""
+        result = mock_suggest_data.suggest("110900")
+        
+        assert all(item['pincode'].startswith('110') for item in result if item['edit'] == 'nearby')
+        assert '560001' not in [item['pincode'] for item in result]
+    
+    def test_limit_and_existing_pincode(self, mock_suggest_data):
+        """Test the result limit and that the typed pincode is not suggested."""
+        assert len(mock_suggest_data.suggest("110010", k=2)) == 2
+        assert mock_suggest_data.suggest("110010", k=0) == []
+        assert '110001' not in [item['pincode'] for item in mock_suggest_data.suggest("110001")]
+        assert mock_suggest_data.suggest("PIN: 011001")[0]['pincode'] == '101001'
+    
+    def test_invalid_input(self, mock_suggest_data):
+        """Test that values without six digits are rejected."""
+        with pytest.raises(InvalidPincodeError):
+            mock_suggest_data.suggest("1100")
+        with pytest.raises(InvalidPincodeError):
+            mock_suggest_data.suggest("abcdef")
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -0,0 +1,178 @@
+"""
+Tests for the lookup daemon and its client.
+"""
+
+import json
+import os
+import socket
+import tempfile
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from pinin import PincodeData
+from pinin.cli import search_state, show_statistics
+from pinin.client import DaemonClient, connect, default_address, parse_address
+from pinin.exceptions import DataNotFoundError, InvalidPincodeError
+from pinin.server import handle_request, make_server
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix sockets")
+
+
+@pytest.fixture(scope="module")
+def pincode_data(synthetic_csv):
+    return PincodeData(synthetic_csv)
+
+
+@pytest.fixture
+def daemon(pincode_data, tmp_path):
+    """Run a daemon for the synthetic dataset on a temporary socket."""
+    address = str(tmp_path / "pinin.sock")
+    server = make_server(pincode_data, address)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield address
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class TestProtocol:
+    """Test request handling without a socket."""
+
+    def test_result_and_error(self, pincode_data):
+        """Test that results and exceptions are encoded as JSON lines."""
+        pincode = pincode_data.data['pincode'].iloc[0]
+        request = json.dumps({'method': 'get_state', 'args': [pincode]}).encode()
+
+        response = handle_request(pincode_data, request, {})
+        assert response.endswith(b"\n")
+        assert json.loads(response) == {'result': pincode_data.get_state(pincode)}
+
+        response = json.loads(handle_request(pincode_data, b'{"method": "get_state", "args": ["999999"]}', {}))
+        assert response['error']['type'] == 'DataNotFoundError'
+        assert response['error']['pincode'] == '999999'
+
+    def test_rejects_unknown_methods_and_bad_json(self, pincode_data):
+        """Test that only the read API is exposed."""
+        response = json.loads(handle_request(pincode_data, b'{"method": "_load_data"}', {}))
+        assert response['error']['type'] == 'ValueError'
+
+        response = json.loads(handle_request(pincode_data, b'not json', {}))
+        assert 'error' in response
+
+    def test_parse_address(self):
+        """Test that HOST:PORT selects TCP and anything else is a socket path."""
+        assert parse_address("127.0.0.1:8765") == ("127.0.0.1", 8765)
+        assert parse_address(":9000") == ("127.0.0.1", 9000)
+        assert parse_address("/run/user/1000/pypinindia.sock") == "/run/user/1000/pypinindia.sock"
+
+
+class TestDaemon:
+    """Test a running daemon through the client."""
+
+    def test_lookups_match_local_results(self, daemon, pincode_data):
+        """Test that the client returns the same results as a local instance."""
+        pincode = pincode_data.data['pincode'].iloc[0]
+        state = pincode_data.get_states()[0]
+
+        with DaemonClient(daemon) as client:
+            assert client.get_state(pincode) == pincode_data.get_state(pincode)
+            assert client.get_offices(pincode) == pincode_data.get_offices(pincode)
+            assert client.search_by_state(state) == pincode_data.search_by_state(state)
+            assert client.get_districts(state) == pincode_data.get_districts(state)
+            assert len(client.get_pincode_info(pincode)) == len(pincode_data.get_pincode_info(pincode))
+
+    def test_errors_are_raised_again(self, daemon):
+        """Test that daemon errors keep their exception types."""
+        with DaemonClient(daemon) as client:
+            with pytest.raises(DataNotFoundError) as excinfo:
+                client.get_state('999999')
+            assert excinfo.value.pincode == '999999'
+            with pytest.raises(InvalidPincodeError):
+                client.get_state('12')
+            with pytest.raises(AttributeError):
+                client.enrich
+
+    def test_connect_checks_data_file(self, daemon, synthetic_csv, tmp_path):
+        """Test that connect only returns clients of a daemon serving the requested data."""
+        client = connect(daemon, synthetic_csv)
+        assert client is not None
+        client.close()
+
+        assert connect(daemon, str(tmp_path / "other.csv")) is None
+        assert connect(daemon) is None
+        assert connect(str(tmp_path / "missing.sock")) is None
+
+    def test_refuses_address_in_use(self, daemon, pincode_data):
+        """Test that a second daemon cannot take over a live socket."""
+        with pytest.raises(OSError):
+            make_server(pincode_data, daemon)
+
+    def test_replaces_stale_socket(self, pincode_data, tmp_path):
+        """Test that a socket file left by a dead daemon is removed."""
+        address = str(tmp_path / "stale.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(address)
+        stale.close()
+
+        server = make_server(pincode_data, address)
+        server.server_close()
+        assert not os.path.exists(address)
+
+    def test_socket_is_owner_only(self, daemon):
+        """Test that the socket is created without access for other users."""
+        assert os.stat(daemon).st_mode & 0o777 == 0o600
+        # The process umask is restored after binding
+        umask = os.umask(0o022)
+        os.umask(umask)
+        assert umask != 0o177
+
+    def test_cli_helpers_take_optional_source(self, daemon, pincode_data, synthetic_csv, capsys):
+        """Test that the CLI helpers keep their signatures and accept a data source by keyword."""
+        state = pincode_data.get_states()[0]
+        expected = pincode_data.search_by_state(state)
+
+        search_state(state, True, False, synthetic_csv)
+        assert json.loads(capsys.readouterr().out) == expected
+        search_state(state, True, False, pincode_data=connect(daemon, synthetic_csv))
+        assert json.loads(capsys.readouterr().out) == expected
+        show_statistics(True, False, pincode_data=pincode_data)
+        assert json.loads(capsys.readouterr().out)['unique_states'] == len(pincode_data.get_states())
+
+    def test_refuses_socket_with_loose_permissions(self, daemon):
+        """Test that a socket other users can reach is not trusted."""
+        os.chmod(daemon, 0o666)
+        assert connect(daemon) is None
+        with pytest.raises(PermissionError):
+            DaemonClient(daemon)
+
+    def test_refuses_socket_of_another_user(self, daemon, pincode_data):
+        """Test that a socket owned by someone else is neither used nor taken over."""
+        with patch('os.getuid', return_value=os.getuid() + 1):
+            assert connect(daemon) is None
+            with pytest.raises(PermissionError):
+                DaemonClient(daemon)
+            with pytest.raises(PermissionError):
+                make_server(pincode_data, daemon)
+
+    def test_default_socket_in_private_directory(self, pincode_data, tmp_path, monkeypatch):
+        """Test that without XDG_RUNTIME_DIR the socket goes in an owner-only directory."""
+        monkeypatch.delenv('XDG_RUNTIME_DIR', raising=False)
+        monkeypatch.delenv('PININ_SOCKET', raising=False)
+        monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+        address = default_address()
+        directory = os.path.dirname(address)
+        assert directory == str(tmp_path / f"pypinindia-{os.getuid()}")
+
+        server = make_server(pincode_data, address)
+        try:
+            assert os.stat(directory).st_mode & 0o777 == 0o700
+            os.chmod(directory, 0o755)
+            with pytest.raises(PermissionError):
+                DaemonClient(address)
+        finally:
+            server.server_close()
+        with pytest.raises(PermissionError):
+            make_server(pincode_data, address)
@@ -0,0 +1,79 @@
+"""
+Tests for lookups served from a shared, memory-mapped snapshot.
+"""
+
+import pytest
+import pandas as pd
+from unittest.mock import patch
+
+from pinin import PincodeData
+from pinin.shared import SharedPincodeData
+from pinin.exceptions import DataLoadError, DataNotFoundError, InvalidPincodeError
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """Write a small pincode CSV file."""
+    data = pd.DataFrame({
+        'pincode': [110001, 110001, 400001, 110002],
+        'officename': ['Connaught Place S.O', 'Parliament Street S.O', 'Mumbai GPO', 'Indraprastha S.O'],
+        'statename': ['DELHI', 'DELHI', 'MAHARASHTRA', 'DELHI'],
+        'districtname': ['Central Delhi', 'Central Delhi', 'Mumbai', 'Central Delhi'],
+        'taluk': ['New Delhi', 'New Delhi', None, 'New Delhi'],
+        'officetype': ['S.O', 'S.O', 'H.O', 'S.O'],
+        'Deliverystatus': ['Delivery', 'Non-Delivery', 'Delivery', 'Delivery'],
+        'latitude': [28.63, 28.62, 18.93, 28.61],
+    })
+    path = tmp_path / "pincodes.csv"
+    data.to_csv(path, index=False)
+    return str(path)
+
+
+class TestSharedPincodeData:
+    """Test attaching to a snapshot and looking pincodes up from it."""
+
+    def test_matches_pincode_data(self, csv_file):
+        """Test that shared lookups return what PincodeData returns."""
+        shared = SharedPincodeData(csv_file)
+        pincode_data = PincodeData(csv_file, use_snapshot=False)
+
+        for pincode in ["110001", "110002", 400001]:
+            expected = pincode_data.get_pincode_info(pincode)
+            actual = shared.get_pincode_info(pincode)
+            assert actual == expected
+            assert shared.get_state(pincode) == pincode_data.get_state(pincode)
+            assert shared.get_district(pincode) == pincode_data.get_district(pincode)
+            assert shared.get_offices(pincode) == pincode_data.get_offices(pincode)
+
+        assert shared.get_taluk("110001") == 'New Delhi'
+        assert pd.isna(shared.get_pincode_info("400001")[0]['taluk'])
+        assert len(shared) == 3
+        assert shared.columns == list(pincode_data.data.columns)
+
+    def test_attach_without_parsing(self, csv_file):
+        """Test that workers attach to a prepared snapshot without parsing the CSV."""
+        path = SharedPincodeData.prepare(csv_file)
+
+        with patch('pandas.read_csv', side_effect=AssertionError("CSV parsed")):
+            shared = SharedPincodeData(csv_file, build=False)
+        assert shared.snapshot_path == path
+        assert shared.get_state("110002") == 'DELHI'
+
+    def test_missing_snapshot_without_build(self, csv_file):
+        """Test that attaching fails cleanly when there is nothing to attach to."""
+        with pytest.raises(DataLoadError):
+            SharedPincodeData(csv_file, build=False)
+
+    def test_lookup_errors(self, csv_file):
+        """Test that invalid and unknown pincodes raise like PincodeData."""
+        shared = SharedPincodeData(csv_file)
+        with pytest.raises(InvalidPincodeError):
+            shared.get_state("1100")
+        with pytest.raises(DataNotFoundError):
+            shared.get_pincode_info("999999")
+        with pytest.raises(DataNotFoundError):
+            shared.get_offices("100000")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,113 @@
+"""
+Tests for compiled dataset snapshots.
+"""
+
+import os
+
+import pytest
+import pandas as pd
+from unittest.mock import patch
+
+from pinin import PincodeData
+from pinin import loader, snapshot
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """Write a small pincode CSV file."""
+    data = pd.DataFrame({
+        'pincode': [110001, 110001, 400001, 110002],
+        'officename': ['Connaught Place S.O', 'Parliament Street S.O', 'Mumbai GPO', 'Indraprastha S.O'],
+        'statename': ['DELHI', 'DELHI', 'MAHARASHTRA', 'DELHI'],
+        'districtname': ['Central Delhi', 'Central Delhi', 'Mumbai', 'Central Delhi'],
+        'taluk': ['New Delhi', 'New Delhi', None, 'New Delhi'],
+        'officetype': ['S.O', 'S.O', 'H.O', 'S.O'],
+        'Deliverystatus': ['Delivery', 'Non-Delivery', 'Delivery', 'Delivery'],
+        'latitude': [28.63, 28.62, 18.93, 28.61],
+    })
+    path = tmp_path / "pincodes.csv"
+    data.to_csv(path, index=False)
+    return str(path)
+
+
+class TestSnapshot:
+    """Test snapshot creation, loading and invalidation."""
+
+    def test_snapshot_written_on_first_load(self, csv_file):
+        """Test that parsing the CSV leaves a snapshot behind."""
+        PincodeData(csv_file, use_snapshot=True)
+        assert os.path.exists(csv_file + snapshot.SUFFIX)
+
+    def test_snapshot_used_on_second_load(self, csv_file):
+        """Test that a current snapshot is loaded without parsing the CSV."""
+        first = PincodeData(csv_file, use_snapshot=True)
+
+        with patch('pandas.read_csv', side_effect=AssertionError("CSV parsed")):
+            second = PincodeData(csv_file, use_snapshot=True)
+
+        assert second.get_pincode_info("110001") == first.get_pincode_info("110001")
+        assert second.get_offices("400001") == ['Mumbai GPO']
+        assert pd.isna(second.get_pincode_info("400001")[0]['taluk'])
+        assert second.get_pincode_info("110002")[0]['latitude'] == 28.61
+        assert list(second.data.columns) == list(first.data.columns)
+        assert isinstance(second.data['statename'].dtype, pd.CategoricalDtype)
+        assert second.get_states() == ['DELHI', 'MAHARASHTRA']
+
+    def test_snapshot_rebuilt_when_csv_changes(self, csv_file):
+        """Test that a stale snapshot is ignored and replaced."""
+        PincodeData(csv_file, use_snapshot=True)
+
+        with open(csv_file, 'a') as handle:
+            handle.write("560001,Bangalore GPO,KARNATAKA,Bangalore,Bangalore North,H.O,Delivery,12.97\n")
+
+        updated = PincodeData(csv_file, use_snapshot=True)
+        assert updated.get_state("560001") == 'KARNATAKA'
+
+        with patch('pandas.read_csv', side_effect=AssertionError("CSV parsed")):
+            assert PincodeData(csv_file, use_snapshot=True).get_state("560001") == 'KARNATAKA'
+
+    def test_csv_replaced_during_parse(self, csv_file, tmp_path, monkeypatch):
+        """Test that no snapshot is written when the CSV changes while it is parsed."""
+        monkeypatch.setenv('PININ_CACHE_DIR', str(tmp_path / "cache"))
+        parse = loader.read_csv
+
+        def parse_then_replace(*args, **kwargs):
+            data = parse(*args, **kwargs)
+            with open(csv_file, 'a') as handle:
+                handle.write("560001,Bangalore GPO,KARNATAKA,Bangalore,Bangalore North,H.O,Delivery,12.97\n")
+            return data
+
+        with patch('pinin.loader.read_csv', side_effect=parse_then_replace):
+            stale = PincodeData(csv_file, use_snapshot=True)
+        assert not stale.exists("560001")
+        assert not os.path.exists(csv_file + snapshot.SUFFIX)
+        assert not os.path.exists(tmp_path / "cache") or not os.listdir(tmp_path / "cache")
+
+        assert PincodeData(csv_file, use_snapshot=True).get_state("560001") == 'KARNATAKA'
+
+    def test_snapshot_reused_when_only_mtime_changes(self, csv_file):
+        """Test that touching the CSV without changing it keeps the snapshot."""
+        PincodeData(csv_file, use_snapshot=True)
+        stat = os.stat(csv_file)
+        os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        with patch('pandas.read_csv', side_effect=AssertionError("CSV parsed")):
+            PincodeData(csv_file, use_snapshot=True)
+
+    def test_corrupt_snapshot_falls_back_to_csv(self, csv_file):
+        """Test that an unreadable snapshot is ignored."""
+        with open(csv_file + snapshot.SUFFIX, 'wb') as handle:
+            handle.write(b"not a snapshot")
+
+        pincode_data = PincodeData(csv_file, use_snapshot=True)
+        assert pincode_data.get_state("110001") == 'DELHI'
+
+    def test_snapshot_disabled(self, csv_file):
+        """Test that snapshots can be turned off."""
+        PincodeData(csv_file, use_snapshot=False)
+        assert not os.path.exists(csv_file + snapshot.SUFFIX)
+        assert not PincodeData(csv_file)._use_snapshot  # PININ_SNAPSHOT=0 in tests
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])